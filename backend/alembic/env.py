@@ -61,7 +61,9 @@ def run_migrations_online() -> None:
 
     """
     # Use the engine from database.py which handles Azure Managed Identity
-    from database import engine as connectable
+    from database import get_engine
+
+    connectable = get_engine()
 
     with connectable.connect() as connection:
         context.configure(
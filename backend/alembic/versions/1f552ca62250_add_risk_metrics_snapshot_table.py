@@ -0,0 +1,57 @@
+"""add risk_metrics_snapshot table
+
+Revision ID: 1f552ca62250
+Revises: 605404c624ce
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1f552ca62250'
+down_revision: Union[str, Sequence[str], None] = '605404c624ce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('risk_metrics_snapshot',
+    sa.Column('id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('ai_system_id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('metric', sa.String(), nullable=False),
+    sa.Column('bucket', sa.String(), nullable=False),
+    sa.Column('event_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['ai_system_id'], ['ai_systems.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('ai_system_id', 'day', 'metric', 'bucket', name='uq_risk_metrics_snapshot_bucket')
+    )
+
+    # Backfill from existing history; new writes are counted incrementally by the routers.
+    backfill_sources = (
+        ("incident_severity", "ai_incidents", "severity"),
+        ("incident_type", "ai_incidents", "incident_type"),
+        ("change_request", "change_requests", "change_type"),
+    )
+    for metric, table, column in backfill_sources:
+        op.execute(
+            f"""
+            INSERT INTO risk_metrics_snapshot
+                (id, ai_system_id, day, metric, bucket, event_count, updated_at)
+            SELECT gen_random_uuid(), ai_system_id, CAST(created_at AS DATE),
+                   '{metric}', CAST({column} AS TEXT), COUNT(*), now()
+            FROM {table}
+            GROUP BY ai_system_id, CAST(created_at AS DATE), {column}
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('risk_metrics_snapshot')
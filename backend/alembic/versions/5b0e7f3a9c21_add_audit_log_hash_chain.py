@@ -0,0 +1,35 @@
+"""add audit log hash chain
+
+Revision ID: 5b0e7f3a9c21
+Revises: d43bfc2e7c5a
+Create Date: 2026-10-17 13:05:41.662310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b0e7f3a9c21'
+down_revision: Union[str, Sequence[str], None] = 'd43bfc2e7c5a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows stay unchained (NULL); new rows start each month's chain.
+    op.add_column('audit_logs', sa.Column('chain_seq', sa.BigInteger(), nullable=True))
+    op.add_column('audit_logs', sa.Column('prev_hash', sa.String(length=64), nullable=True))
+    op.add_column('audit_logs', sa.Column('entry_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_audit_logs_chain_seq', 'audit_logs', ['chain_seq'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_logs_chain_seq', table_name='audit_logs')
+    op.drop_column('audit_logs', 'entry_hash')
+    op.drop_column('audit_logs', 'prev_hash')
+    op.drop_column('audit_logs', 'chain_seq')
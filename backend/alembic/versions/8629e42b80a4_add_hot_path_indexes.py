@@ -0,0 +1,80 @@
+"""add hot path indexes
+
+Revision ID: 8629e42b80a4
+Revises: 1f552ca62250
+Create Date: 2026-10-17 10:03:27.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8629e42b80a4'
+down_revision: Union[str, Sequence[str], None] = '1f552ca62250'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns, partial-index predicate)
+INDEXES = [
+    ('ix_ai_incidents_created_at', 'ai_incidents', ['created_at'], None),
+    ('ix_ai_incidents_ai_system_id_created_at', 'ai_incidents', ['ai_system_id', 'created_at'], None),
+    ('ix_ai_incidents_incident_type_created_at', 'ai_incidents', ['incident_type', 'created_at'], None),
+    ('ix_ai_incidents_assigned_to_role_created_at', 'ai_incidents', ['assigned_to_role', 'created_at'], None),
+    ('ix_change_requests_created_at', 'change_requests', ['created_at'], None),
+    ('ix_change_requests_ai_system_id_created_at', 'change_requests', ['ai_system_id', 'created_at'], None),
+    ('ix_prompt_versions_prompt_template_id_version', 'prompt_versions', ['prompt_template_id', 'version'], None),
+    ('ix_prompt_versions_created_at', 'prompt_versions', ['created_at'], None),
+    ('ix_rag_source_versions_rag_source_id_version', 'rag_source_versions', ['rag_source_id', 'version'], None),
+    ('ix_rag_source_versions_created_at', 'rag_source_versions', ['created_at'], None),
+    ('ix_ai_system_prompt_bindings_ai_system_id_active_to', 'ai_system_prompt_bindings', ['ai_system_id', 'active_to'], None),
+    ('ix_ai_system_prompt_bindings_active', 'ai_system_prompt_bindings', ['ai_system_id'], 'active_to IS NULL'),
+    ('ix_ai_system_prompt_bindings_prompt_version_id', 'ai_system_prompt_bindings', ['prompt_version_id'], None),
+    ('ix_ai_system_rag_bindings_ai_system_id_active_to', 'ai_system_rag_bindings', ['ai_system_id', 'active_to'], None),
+    ('ix_ai_system_rag_bindings_active', 'ai_system_rag_bindings', ['ai_system_id'], 'active_to IS NULL'),
+    ('ix_ai_system_rag_bindings_rag_source_version_id', 'ai_system_rag_bindings', ['rag_source_version_id'], None),
+    ('ix_risk_metrics_snapshot_metric_day', 'risk_metrics_snapshot', ['metric', 'day'], None),
+]
+
+
+def _drop_if_invalid(name: str, table: str) -> None:
+    # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which
+    # if_not_exists would then skip forever; drop it so it is rebuilt.
+    invalid = op.get_bind().execute(
+        sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build concurrently so large tables stay writable while the indexes are created.
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            _drop_if_invalid(name, table)
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _where in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,68 @@
+"""add content blobs for version text
+
+Revision ID: c7a4d2e9f810
+Revises: 5b0e7f3a9c21
+Create Date: 2026-10-17 14:22:17.408391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a4d2e9f810'
+down_revision: Union[str, Sequence[str], None] = '5b0e7f3a9c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'content_blobs',
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('codec', sa.String(length=16), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('content_hash'),
+    )
+    # Existing versions keep their inline text; new versions reference a blob instead.
+    op.add_column('prompt_versions', sa.Column('content_blob_hash', sa.String(length=64), nullable=True))
+    op.create_foreign_key(
+        'fk_prompt_versions_content_blob_hash',
+        'prompt_versions',
+        'content_blobs',
+        ['content_blob_hash'],
+        ['content_hash'],
+    )
+    op.create_index('ix_prompt_versions_content_blob_hash', 'prompt_versions', ['content_blob_hash'])
+    op.alter_column('prompt_versions', 'prompt_text', existing_type=sa.Text(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Inline blob-backed texts again before the column becomes NOT NULL.
+    from utils.content_codec import decompress_text
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT prompt_versions.id, content_blobs.codec, content_blobs.data "
+            "FROM prompt_versions JOIN content_blobs "
+            "ON content_blobs.content_hash = prompt_versions.content_blob_hash "
+            "WHERE prompt_versions.prompt_text IS NULL"
+        )
+    ).fetchall()
+    for version_id, codec, data in rows:
+        bind.execute(
+            sa.text("UPDATE prompt_versions SET prompt_text = :text WHERE id = :id"),
+            {"text": decompress_text(codec, data), "id": version_id},
+        )
+    op.alter_column('prompt_versions', 'prompt_text', existing_type=sa.Text(), nullable=False)
+    op.drop_index('ix_prompt_versions_content_blob_hash', table_name='prompt_versions')
+    op.drop_constraint('fk_prompt_versions_content_blob_hash', 'prompt_versions', type_='foreignkey')
+    op.drop_column('prompt_versions', 'content_blob_hash')
+    op.drop_table('content_blobs')
@@ -0,0 +1,112 @@
+"""partition audit_logs by month
+
+Revision ID: d43bfc2e7c5a
+Revises: 8629e42b80a4
+Create Date: 2026-10-17 11:40:08.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd43bfc2e7c5a'
+down_revision: Union[str, Sequence[str], None] = '8629e42b80a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+AUDIT_LOG_COLUMNS = (
+    "id, timestamp, user_id, action, entity_type, entity_id, "
+    "payload_hash, state_hash, audit_metadata"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned")
+    op.execute("ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey")
+
+    # The partition key must be part of the primary key on a partitioned table.
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL,
+            timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            user_id VARCHAR(255),
+            action VARCHAR(255) NOT NULL,
+            entity_type VARCHAR(255),
+            entity_id VARCHAR(255),
+            payload_hash VARCHAR(255) NOT NULL,
+            state_hash VARCHAR(255),
+            audit_metadata JSON,
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """
+    )
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    # Idempotent helper used here and by the application to add months ahead of time.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_audit_log_partition(month_start DATE)
+        RETURNS TEXT AS $$
+        DECLARE
+            start_at DATE := date_trunc('month', month_start)::DATE;
+            partition_name TEXT := format('audit_logs_y%sm%s', to_char(start_at, 'YYYY'), to_char(start_at, 'MM'));
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                start_at,
+                (start_at + INTERVAL '1 month')::DATE
+            );
+            RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        SELECT create_audit_log_partition(month_start::DATE)
+        FROM generate_series(
+            date_trunc('month', COALESCE((SELECT min(timestamp) FROM audit_logs_unpartitioned), now())),
+            date_trunc('month', now()) + INTERVAL '3 months',
+            INTERVAL '1 month'
+        ) AS month_start
+        """
+    )
+
+    op.execute(
+        f"INSERT INTO audit_logs ({AUDIT_LOG_COLUMNS}) "
+        f"SELECT {AUDIT_LOG_COLUMNS} FROM audit_logs_unpartitioned"
+    )
+    op.execute("DROP TABLE audit_logs_unpartitioned")
+
+    op.create_index('ix_audit_logs_timestamp_id', 'audit_logs', ['timestamp', 'id'])
+    op.create_index('ix_audit_logs_user_id_timestamp', 'audit_logs', ['user_id', 'timestamp'])
+    op.create_index('ix_audit_logs_action_timestamp', 'audit_logs', ['action', 'timestamp'])
+    op.create_index(
+        'ix_audit_logs_entity_timestamp',
+        'audit_logs',
+        ['entity_type', 'entity_id', 'timestamp'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute(
+        f"""
+        CREATE TABLE audit_logs AS
+        SELECT {AUDIT_LOG_COLUMNS} FROM audit_logs_partitioned
+        """
+    )
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN id SET NOT NULL")
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN timestamp SET NOT NULL")
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN action SET NOT NULL")
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN payload_hash SET NOT NULL")
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE")
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id)")
+    op.execute("DROP FUNCTION IF EXISTS create_audit_log_partition(DATE)")
@@ -0,0 +1,73 @@
+"""add version dedup indexes and idempotency keys
+
+Revision ID: e2b9c4f1a7d3
+Revises: c7a4d2e9f810
+Create Date: 2026-10-17 15:10:52.730114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9c4f1a7d3'
+down_revision: Union[str, Sequence[str], None] = 'c7a4d2e9f810'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns, unique)
+INDEXES = [
+    ('ix_prompt_versions_template_content_hash', 'prompt_versions', ['prompt_template_id', 'content_hash'], False),
+    ('ix_rag_source_versions_source_content_hash', 'rag_source_versions', ['rag_source_id', 'content_hash'], False),
+    ('uq_prompt_versions_template_idempotency_key', 'prompt_versions', ['prompt_template_id', 'idempotency_key'], True),
+    ('uq_rag_source_versions_source_idempotency_key', 'rag_source_versions', ['rag_source_id', 'idempotency_key'], True),
+]
+
+
+def _drop_if_invalid(name: str, table: str) -> None:
+    # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which
+    # if_not_exists would then skip forever; drop it so it is rebuilt.
+    invalid = op.get_bind().execute(
+        sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # IF NOT EXISTS: the columns are committed before the index builds, so a
+    # re-run after a failed build finds them already present.
+    op.execute("ALTER TABLE prompt_versions ADD COLUMN IF NOT EXISTS idempotency_key VARCHAR(255)")
+    op.execute("ALTER TABLE rag_source_versions ADD COLUMN IF NOT EXISTS idempotency_key VARCHAR(255)")
+
+    # Build concurrently so the version tables stay writable while the indexes are created.
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            _drop_if_invalid(name, table)
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=unique,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _unique in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    op.drop_column('rag_source_versions', 'idempotency_key')
+    op.drop_column('prompt_versions', 'idempotency_key')
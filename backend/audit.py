@@ -1,5 +1,183 @@
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import atexit
 import json
+import logging
+import os
+import queue
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX development machines
+    fcntl = None
+
+SECURITY_LOG_PATH = os.getenv("SECURITY_LOG_PATH", "audit_security.log")
+SECURITY_LOG_MAX_BYTES = int(os.getenv("SECURITY_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+SECURITY_LOG_BACKUP_COUNT = int(os.getenv("SECURITY_LOG_BACKUP_COUNT", "5"))
+SECURITY_LOG_QUEUE_SIZE = int(os.getenv("SECURITY_LOG_QUEUE_SIZE", "10000"))
+
+
+class _SharedRotatingFileHandler(RotatingFileHandler):
+    """``RotatingFileHandler`` that several worker processes can append to.
+
+    Every uvicorn worker holds its own handler on the same file. Rollover
+    runs under an exclusive ``flock`` on ``<path>.lock`` and re-checks the
+    file on disk first, so only one worker rotates; the others see that the
+    path now names a different inode and reopen it before their next write,
+    as ``WatchedFileHandler`` does.
+    """
+
+    def __init__(self, filename, on_error, **kwargs):
+        self._identity = None
+        self._on_error = on_error
+        super().__init__(filename, encoding="utf-8", **kwargs)
+        self._lock_path = f"{self.baseFilename}.lock"
+
+    def _open(self):
+        stream = super()._open()
+        stat = os.fstat(stream.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        return stream
+
+    def _reopen_if_rotated(self) -> None:
+        if self.stream is None:
+            return
+        try:
+            stat = os.stat(self.baseFilename)
+            current = (stat.st_dev, stat.st_ino)
+        except FileNotFoundError:
+            current = None
+        if current != self._identity:
+            self.stream.close()
+            self.stream = self._open()
+
+    @contextmanager
+    def _rollover_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def emit(self, record) -> None:
+        try:
+            self._reopen_if_rotated()
+            if self.shouldRollover(record):
+                with self._rollover_lock():
+                    # Another worker may have rotated while this one waited.
+                    self._reopen_if_rotated()
+                    if self.shouldRollover(record):
+                        self.doRollover()
+            logging.FileHandler.emit(self, record)
+        except Exception:
+            self.handleError(record)
+
+    def handleError(self, record) -> None:
+        self._on_error()
+
+
+class _BoundedQueueHandler(QueueHandler):
+    def __init__(self, event_queue, on_full):
+        super().__init__(event_queue)
+        self._on_full = on_full
+
+    def enqueue(self, record) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._on_full()
+
+
+class _DrainingQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Block rather than fail when the queue is full, so stop() always drains.
+        self.queue.put(self._sentinel)
+
+
+class SecurityEventWriter:
+    """Appends security events to a size-rotated JSON lines file off the request path.
+
+    ``write`` only enqueues onto a bounded queue; a ``QueueListener`` thread
+    writes through a rotating file handler that is safe to share between
+    worker processes. When the queue is full the event is dropped and
+    counted rather than blocking the caller. ``stop()`` (called at app
+    shutdown and at interpreter exit) waits until every queued event is
+    written.
+    """
+
+    def __init__(
+        self,
+        path: str = SECURITY_LOG_PATH,
+        max_bytes: int = SECURITY_LOG_MAX_BYTES,
+        backup_count: int = SECURITY_LOG_BACKUP_COUNT,
+        max_queue_size: int = SECURITY_LOG_QUEUE_SIZE,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_queue_size = max_queue_size
+
+        self._logger = logging.getLogger("security_events")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._listener: QueueListener | None = None
+        self._start_lock = threading.Lock()
+        self._dropped_lock = threading.Lock()
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        with self._dropped_lock:
+            return self._dropped
+
+    def _count_dropped(self) -> None:
+        with self._dropped_lock:
+            self._dropped += 1
+
+    def write(self, line: str) -> None:
+        self._ensure_started()
+        self._logger.info(line)
+
+    def _ensure_started(self) -> None:
+        if self._listener is not None:
+            return
+        with self._start_lock:
+            if self._listener is not None:
+                return
+            event_queue: queue.Queue = queue.Queue(maxsize=self.max_queue_size)
+            file_handler = _SharedRotatingFileHandler(
+                self.path,
+                on_error=self._count_dropped,
+                maxBytes=self.max_bytes,
+                backupCount=self.backup_count,
+                delay=True,
+            )
+            file_handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger.addHandler(_BoundedQueueHandler(event_queue, self._count_dropped))
+            self._listener = _DrainingQueueListener(event_queue, file_handler)
+            self._listener.start()
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Write everything queued so far, then stop the writer thread."""
+        with self._start_lock:
+            listener, self._listener = self._listener, None
+            if listener is None:
+                return
+            for handler in list(self._logger.handlers):
+                self._logger.removeHandler(handler)
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+
+security_event_writer = SecurityEventWriter()
 
 
 def log_security_event(user_id, action, details=None) -> None:
@@ -9,8 +187,4 @@ def log_security_event(user_id, action, details=None) -> None:
         "action": action,
         "details": details or {},
     }
-    try:
-        with open("audit_security.log", "a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry) + "\n")
-    except OSError:
-        pass
+    security_event_writer.write(json.dumps(entry))
@@ -1,8 +1,9 @@
 import os
+import threading
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import make_url
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from models import Base
 
@@ -48,12 +49,42 @@ def _create_engine():
     return create_engine(DATABASE_URL, creator=connect_with_token, pool_pre_ping=True)
 
 
-engine = _create_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """The process-wide engine, created on first use rather than at import.
+
+    Importing the app (or a script that only needs the models) no longer
+    requires DATABASE_URL, a DBAPI driver or azure-identity to be loadable.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine()
+                _session_factory.configure(bind=_engine)
+    return _engine
+
+
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
+
+
+def SessionLocal() -> Session:
+    get_engine()
+    return _session_factory()
+
+
+def __getattr__(name: str):
+    # ``from database import engine`` keeps working, resolved lazily.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_db() -> None:
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 
 def get_db():
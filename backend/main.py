@@ -1,21 +1,24 @@
 import hashlib
 import json
 import logging
+import os
 import subprocess
-import sys
 from datetime import datetime
 
 from fastapi import FastAPI, Request
-from sqlalchemy.orm import Session
 
-from database import SessionLocal
-from models import AuditLog
+from audit import security_event_writer
+from routers.admin import router as admin_router
 from routers.ai_system import router as ai_system_router
+from routers.audit import router as audit_router
 from routers.change_request import router as change_request_router
 from routers.prompt import router as prompt_router
 from routers.rag import router as rag_router
 from routers.incidents import router as incidents_router
 from routers.risk import router as risk_router
+from security.auth import auth_metrics
+from services.audit_log_writer import audit_log_writer
+from services.schema_migrations import ensure_schema_current
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +31,9 @@ app = FastAPI(
 
 @app.on_event("startup")
 def run_migrations():
-    """Run database migrations on startup using the current Python interpreter."""
+    """Verify the schema is at head, upgrading it under an advisory lock if needed."""
     try:
-        logger.info("Running database migrations...")
-        result = subprocess.run(
-            [sys.executable, "-m", "alembic", "upgrade", "head"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        logger.info(f"Migrations completed: {result.stdout}")
+        ensure_schema_current()
     except subprocess.CalledProcessError as e:
         logger.error(f"Migration failed: {e.stderr}")
         raise
@@ -45,12 +41,38 @@ def run_migrations():
         logger.error(f"Unexpected error during migration: {e}")
         raise
 
+
+@app.on_event("startup")
+async def start_audit_log_writer():
+    await audit_log_writer.start()
+
+
+@app.on_event("shutdown")
+async def stop_audit_log_writer():
+    """Drain queued audit entries before the worker exits."""
+    await audit_log_writer.stop()
+
+
+@app.on_event("shutdown")
+def stop_security_event_writer():
+    """Write queued security events before the worker exits."""
+    security_event_writer.stop()
+
 app.include_router(ai_system_router)
 app.include_router(change_request_router)
 app.include_router(prompt_router)
 app.include_router(rag_router)
 app.include_router(incidents_router)
 app.include_router(risk_router)
+app.include_router(audit_router)
+app.include_router(admin_router)
+
+
+# "raw" hashes the request body bytes as the route reads them; "canonical_json"
+# keeps the legacy decode + sort_keys re-encode digest, which needs the whole
+# body in memory.
+AUDIT_PAYLOAD_HASH_MODE = os.getenv("AUDIT_PAYLOAD_HASH_MODE", "raw").lower()
+BODILESS_METHODS = {"GET", "HEAD", "OPTIONS"}
 
 
 def hash_payload(payload: dict) -> str:
@@ -58,59 +80,138 @@ def hash_payload(payload: dict) -> str:
     return hashlib.sha256(payload_str.encode("utf-8")).hexdigest()
 
 
-@app.middleware("http")
-async def audit_logging_middleware(request: Request, call_next):
-    body_bytes = await request.body()
-    try:
-        body = json.loads(body_bytes.decode("utf-8")) if body_bytes else {}
-    except json.JSONDecodeError:
-        body = {"raw": body_bytes.decode("utf-8", errors="ignore")}
+EMPTY_PAYLOAD_HASH = hash_payload({})
+
+
+class _BodyDigest:
+    """Running digest of the request body chunks seen so far."""
+
+    def __init__(self, mode: str = AUDIT_PAYLOAD_HASH_MODE):
+        self.mode = mode
+        self.hasher = hashlib.sha256()
+        self.chunks: list[bytes] | None = [] if mode == "canonical_json" else None
+        self.size = 0
+        self.complete = False
+
+    def update(self, chunk: bytes, more_body: bool) -> None:
+        if chunk:
+            self.hasher.update(chunk)
+            self.size += len(chunk)
+            if self.chunks is not None:
+                self.chunks.append(chunk)
+        if not more_body:
+            self.complete = True
+
+    def result(self) -> tuple[str, str]:
+        """``(payload_hash, payload_hash_mode)`` for the audit entry.
 
-    async def receive():
-        return {"type": "http.request", "body": body_bytes, "more_body": False}
+        A route that stops reading early (a 413, or a request rejected
+        before its body is parsed) gets the digest of the bytes it read,
+        marked ``raw_sha256_partial``.
+        """
+        if not self.complete:
+            return self.hasher.hexdigest(), "raw_sha256_partial"
+        if not self.size:
+            return EMPTY_PAYLOAD_HASH, "empty"
+        if self.chunks is not None:
+            body_bytes = b"".join(self.chunks)
+            try:
+                body = json.loads(body_bytes.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                body = {"raw": body_bytes.decode("utf-8", errors="ignore")}
+            return hash_payload(body), "canonical_json"
+        return self.hasher.hexdigest(), "raw_sha256"
 
-    request_with_body = Request(request.scope, receive=receive)
 
-    payload_hash = hash_payload(body)
+class AuditBodyDigestMiddleware:
+    """Hash request bodies as the route consumes them.
+
+    Wraps ``receive`` so every body chunk is fed to a ``_BodyDigest`` kept
+    on ``request.state`` and then passed on unchanged. Nothing is buffered,
+    so route-level size limits and streaming uploads (``_read_bulk_body``,
+    ``/admin/restore``) keep working on arbitrarily large bodies.
+    ``audit_logging_middleware`` reads the digest once the route returns.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in BODILESS_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        digest = _BodyDigest()
+        scope.setdefault("state", {})["audit_body_digest"] = digest
+
+        async def hashing_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                digest.update(message.get("body", b""), message.get("more_body", False))
+            return message
+
+        await self.app(scope, hashing_receive, send)
+
+
+@app.middleware("http")
+async def audit_logging_middleware(request: Request, call_next):
     user_id = request.headers.get("x-user-id", "anonymous")
     method = request.method
     path = request.url.path
 
-    response = await call_next(request_with_body)
+    response = await call_next(request)
 
     state = request.scope.get("state", {})
+    digest = state.get("audit_body_digest")
+    if digest is None:
+        payload_hash, payload_hash_mode = EMPTY_PAYLOAD_HASH, "bodiless"
+    else:
+        payload_hash, payload_hash_mode = digest.result()
     action = state.get("audit_action", f"{method} {path}")
     entity_id = state.get("audit_entity_id")
     entity_type = state.get("audit_entity_type")
-    audit_metadata = state.get("audit_metadata")
+    audit_metadata = {
+        **(state.get("audit_metadata") or {}),
+        "payload_hash_mode": payload_hash_mode,
+    }
     state_hash = None
     if "audit_previous_state" in state and "audit_new_state" in state:
         combined = f"{state['audit_previous_state']}->{state['audit_new_state']}"
         state_hash = hashlib.sha256(combined.encode("utf-8")).hexdigest()
 
-    db: Session = SessionLocal()
-    try:
-        log_entry = AuditLog(
-            timestamp=datetime.utcnow(),
-            user_id=user_id,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            payload_hash=payload_hash,
-            state_hash=state_hash,
-            audit_metadata=audit_metadata,
-        )
-        db.add(log_entry)
-        db.commit()
-    except Exception:
-        db.rollback()
-        logger.exception("Audit log insert failed")
-    finally:
-        db.close()
+    await audit_log_writer.submit(
+        {
+            "timestamp": datetime.utcnow(),
+            "user_id": user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "payload_hash": payload_hash,
+            "state_hash": state_hash,
+            "audit_metadata": audit_metadata,
+        }
+    )
 
     return response
 
 
+# Added after the decorator above so it is the outer layer and sees the
+# body chunks before the route does.
+app.add_middleware(AuditBodyDigestMiddleware)
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@app.get("/health/audit")
+def audit_health():
+    """Audit writer queue depth and flush latency."""
+    return audit_log_writer.metrics()
+
+
+@app.get("/health/auth")
+def auth_health():
+    """Principal resolution counters; resolutions should track authenticated requests."""
+    return auth_metrics()
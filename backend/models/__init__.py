@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, JSON, String, Text, func
+from sqlalchemy import BigInteger, DateTime, Index, JSON, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -40,6 +40,14 @@ class Incident(TraceableMixin, Base):
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    # On PostgreSQL the table is range-partitioned by month on ``timestamp``.
+    __table_args__ = (
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+        Index("ix_audit_logs_user_id_timestamp", "user_id", "timestamp"),
+        Index("ix_audit_logs_action_timestamp", "action", "timestamp"),
+        Index("ix_audit_logs_entity_timestamp", "entity_type", "entity_id", "timestamp"),
+        Index("ix_audit_logs_chain_seq", "chain_seq"),
+    )
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=generate_uuid)
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -50,6 +58,10 @@ class AuditLog(Base):
     payload_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     state_hash: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     audit_metadata: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Per-month hash chain; NULL for rows written before chaining was enabled.
+    chain_seq: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    prev_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    entry_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
 
 from .ai_system import AISystem, LifecycleStatus, RiskClassification  # noqa: E402
@@ -61,3 +73,5 @@ from .rag_source_version import RAGSourceStatus, RAGSourceVersion  # noqa: E402
 from .ai_system_prompt_binding import AISystemPromptBinding  # noqa: E402
 from .ai_system_rag_binding import AISystemRAGBinding  # noqa: E402
 from .ai_incident import AIIncident, ImpactArea, IncidentSeverity, IncidentStatus, IncidentType  # noqa: E402
+from .risk_metrics_snapshot import RiskMetricsSnapshot, SnapshotMetric  # noqa: E402
+from .content_blob import ContentBlob  # noqa: E402
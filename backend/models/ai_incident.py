@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 
 from . import Base
@@ -51,6 +51,12 @@ class RootCauseCategory(str, enum.Enum):
 
 class AIIncident(Base):
     __tablename__ = "ai_incidents"
+    __table_args__ = (
+        Index("ix_ai_incidents_created_at", "created_at"),
+        Index("ix_ai_incidents_ai_system_id_created_at", "ai_system_id", "created_at"),
+        Index("ix_ai_incidents_incident_type_created_at", "incident_type", "created_at"),
+        Index("ix_ai_incidents_assigned_to_role_created_at", "assigned_to_role", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=False), primary_key=True, default=generate_uuid)
 
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from . import Base, generate_uuid
@@ -8,6 +8,15 @@ from . import Base, generate_uuid
 
 class AISystemPromptBinding(Base):
     __tablename__ = "ai_system_prompt_bindings"
+    __table_args__ = (
+        Index("ix_ai_system_prompt_bindings_ai_system_id_active_to", "ai_system_id", "active_to"),
+        Index(
+            "ix_ai_system_prompt_bindings_active",
+            "ai_system_id",
+            postgresql_where=text("active_to IS NULL"),
+        ),
+        Index("ix_ai_system_prompt_bindings_prompt_version_id", "prompt_version_id"),
+    )
 
     id = Column(UUID(as_uuid=False), primary_key=True, default=generate_uuid)
 
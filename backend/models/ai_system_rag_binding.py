@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from . import Base, generate_uuid
@@ -8,6 +8,15 @@ from . import Base, generate_uuid
 
 class AISystemRAGBinding(Base):
     __tablename__ = "ai_system_rag_bindings"
+    __table_args__ = (
+        Index("ix_ai_system_rag_bindings_ai_system_id_active_to", "ai_system_id", "active_to"),
+        Index(
+            "ix_ai_system_rag_bindings_active",
+            "ai_system_id",
+            postgresql_where=text("active_to IS NULL"),
+        ),
+        Index("ix_ai_system_rag_bindings_rag_source_version_id", "rag_source_version_id"),
+    )
 
     id = Column(UUID(as_uuid=False), primary_key=True, default=generate_uuid)
 
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 
 from . import Base, generate_uuid
@@ -24,6 +24,10 @@ class ChangeStatus(str, enum.Enum):
 
 class ChangeRequest(Base):
     __tablename__ = "change_requests"
+    __table_args__ = (
+        Index("ix_change_requests_created_at", "created_at"),
+        Index("ix_change_requests_ai_system_id_created_at", "ai_system_id", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=False), primary_key=True, default=generate_uuid)
 
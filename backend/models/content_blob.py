@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String
+
+from . import Base
+
+
+class ContentBlob(Base):
+    """Compressed version content, stored once per distinct ``content_hash``.
+
+    ``content_hash`` is the SHA-256 of the uncompressed UTF-8 text, so
+    versions with identical text share a single row.
+    """
+
+    __tablename__ = "content_blobs"
+
+    content_hash = Column(String(64), primary_key=True)
+    codec = Column(String(16), nullable=False)
+    size = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,8 +1,11 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from utils.content_codec import content_hash as text_content_hash, decompress_text
 
 from . import Base, generate_uuid
 
@@ -16,6 +19,18 @@ class PromptStatus(str, enum.Enum):
 
 class PromptVersion(Base):
     __tablename__ = "prompt_versions"
+    __table_args__ = (
+        Index("ix_prompt_versions_prompt_template_id_version", "prompt_template_id", "version"),
+        Index("ix_prompt_versions_created_at", "created_at"),
+        Index("ix_prompt_versions_content_blob_hash", "content_blob_hash"),
+        Index("ix_prompt_versions_template_content_hash", "prompt_template_id", "content_hash"),
+        Index(
+            "uq_prompt_versions_template_idempotency_key",
+            "prompt_template_id",
+            "idempotency_key",
+            unique=True,
+        ),
+    )
 
     id = Column(UUID(as_uuid=False), primary_key=True, default=generate_uuid)
 
@@ -29,7 +44,15 @@ class PromptVersion(Base):
 
     status = Column(Enum(PromptStatus), default=PromptStatus.DRAFT, nullable=False)
 
-    prompt_text = Column(Text, nullable=False)
+    # Legacy rows keep their text inline; new rows reference a shared blob.
+    inline_prompt_text = Column("prompt_text", Text, nullable=True)
+
+    content_blob_hash = Column(
+        String(64),
+        ForeignKey("content_blobs.content_hash"),
+        nullable=True,
+    )
+    content_blob = relationship("ContentBlob", lazy="joined")
 
     parameters_schema = Column(JSON, nullable=True)
 
@@ -37,6 +60,8 @@ class PromptVersion(Base):
 
     diff_from_prev = Column(Text, nullable=True)
 
+    idempotency_key = Column(String(255), nullable=True)
+
     change_request_id = Column(
         UUID(as_uuid=False),
         ForeignKey("change_requests.id"),
@@ -45,3 +70,16 @@ class PromptVersion(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     created_by = Column(String, nullable=False)
+
+    @property
+    def prompt_text(self) -> str | None:
+        if self.inline_prompt_text is not None:
+            return self.inline_prompt_text
+        if self.content_blob is None:
+            return None
+        return decompress_text(self.content_blob.codec, self.content_blob.data)
+
+    @property
+    def text_hash(self) -> str:
+        """SHA-256 of the prompt text alone (``content_hash`` also covers parameters)."""
+        return self.content_blob_hash or text_content_hash(self.inline_prompt_text or "")
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 
 from . import Base, generate_uuid
@@ -16,6 +16,17 @@ class RAGSourceStatus(str, enum.Enum):
 
 class RAGSourceVersion(Base):
     __tablename__ = "rag_source_versions"
+    __table_args__ = (
+        Index("ix_rag_source_versions_rag_source_id_version", "rag_source_id", "version"),
+        Index("ix_rag_source_versions_created_at", "created_at"),
+        Index("ix_rag_source_versions_source_content_hash", "rag_source_id", "content_hash"),
+        Index(
+            "uq_rag_source_versions_source_idempotency_key",
+            "rag_source_id",
+            "idempotency_key",
+            unique=True,
+        ),
+    )
 
     id = Column(UUID(as_uuid=False), primary_key=True, default=generate_uuid)
 
@@ -38,6 +49,8 @@ class RAGSourceVersion(Base):
 
     diff_from_prev = Column(Text, nullable=True)
 
+    idempotency_key = Column(String(255), nullable=True)
+
     change_request_id = Column(
         UUID(as_uuid=False),
         ForeignKey("change_requests.id"),
@@ -0,0 +1,44 @@
+import enum
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from . import Base, generate_uuid
+
+
+class SnapshotMetric(str, enum.Enum):
+    INCIDENT_SEVERITY = "incident_severity"
+    INCIDENT_TYPE = "incident_type"
+    CHANGE_REQUEST = "change_request"
+
+
+class RiskMetricsSnapshot(Base):
+    """Per-system, per-day event counts backing the /risk dashboards.
+
+    Each row counts events for one ``metric`` bucket, e.g. incidents of
+    severity ``HIGH`` or change requests of type ``prompt`` created on ``day``.
+    """
+
+    __tablename__ = "risk_metrics_snapshot"
+    __table_args__ = (
+        UniqueConstraint(
+            "ai_system_id",
+            "day",
+            "metric",
+            "bucket",
+            name="uq_risk_metrics_snapshot_bucket",
+        ),
+        Index("ix_risk_metrics_snapshot_metric_day", "metric", "day"),
+    )
+
+    id = Column(UUID(as_uuid=False), primary_key=True, default=generate_uuid)
+
+    ai_system_id = Column(UUID(as_uuid=False), ForeignKey("ai_systems.id"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    metric = Column(String, nullable=False)
+    bucket = Column(String, nullable=False)
+    event_count = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,91 @@
+import tempfile
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from database import get_db
+from security.auth import require_not_auditor, require_roles
+from security.roles import Role
+from services.environment_snapshot import SnapshotError, restore_snapshot, stream_snapshot
+from utils.streaming import ClosingStreamingResponse
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+SNAPSHOT_MEDIA_TYPE = "application/gzip"
+# Uploads larger than this spill from memory to a temporary file.
+RESTORE_SPOOL_MAX_MEMORY = 64 * 1024 * 1024
+
+
+def _require_postgresql(db: Session) -> None:
+    if db.get_bind().dialect.name != "postgresql":
+        raise HTTPException(status_code=501, detail="Snapshots require PostgreSQL")
+
+
+@router.get(
+    "/snapshot",
+    dependencies=[Depends(require_roles(Role.ADMIN))],
+)
+def export_snapshot(request: Request, db: Session = Depends(get_db)):
+    """Stream a gzip archive of all governance tables from one consistent snapshot."""
+    _require_postgresql(db)
+
+    state = request.scope.setdefault("state", {})
+    state["audit_action"] = "ENVIRONMENT_SNAPSHOT_EXPORTED"
+    state["audit_entity_type"] = "ENVIRONMENT"
+
+    filename = f"ai-grc-snapshot-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.gz"
+    return ClosingStreamingResponse(
+        stream_snapshot(),
+        media_type=SNAPSHOT_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _restore_and_commit(db: Session, archive) -> dict:
+    """Blocking part of a restore: COPY the archive in, then commit or roll back."""
+    try:
+        summary = restore_snapshot(db, archive)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return summary
+
+
+@router.post(
+    "/restore",
+    dependencies=[Depends(require_roles(Role.ADMIN)), Depends(require_not_auditor)],
+)
+async def restore_environment(
+    request: Request,
+    confirm: bool = Query(False, description="Must be true: restore replaces all governance data"),
+    db: Session = Depends(get_db),
+):
+    """Replace all governance data with an archive from ``GET /admin/snapshot``.
+
+    IDs are preserved, no triage or per-record audit entries are produced,
+    and the risk metrics snapshot is rebuilt. The restore itself is
+    recorded as a single ``ENVIRONMENT_RESTORED`` audit entry.
+    """
+    if not confirm:
+        raise HTTPException(status_code=400, detail="Pass confirm=true to replace all governance data")
+    _require_postgresql(db)
+
+    with tempfile.SpooledTemporaryFile(max_size=RESTORE_SPOOL_MAX_MEMORY) as archive:
+        async for chunk in request.stream():
+            archive.write(chunk)
+        archive.seek(0)
+
+        try:
+            summary = await run_in_threadpool(_restore_and_commit, db, archive)
+        except SnapshotError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    state = request.scope.setdefault("state", {})
+    state["audit_action"] = "ENVIRONMENT_RESTORED"
+    state["audit_entity_type"] = "ENVIRONMENT"
+    state["audit_metadata"] = summary
+
+    return summary
@@ -1,11 +1,11 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from schemas.ai_system import AISystemCreate, AISystemResponse
 from schemas.lifecycle import LifecycleUpdate
-from models.ai_system import AISystem, ALLOWED_TRANSITIONS
+from models.ai_system import AISystem, ALLOWED_TRANSITIONS, LifecycleStatus, RiskClassification
 from models.change_request import ChangeRequest
 from models.ai_system_prompt_binding import AISystemPromptBinding
 from models.ai_system_rag_binding import AISystemRAGBinding
@@ -15,6 +15,7 @@ from schemas.activation import PromptActivationRequest, RAGActivationRequest
 from database import get_db
 from security.auth import get_current_user, require_roles
 from security.roles import Role
+from utils.pagination import PageParams, keyset_page, page_params
 
 router = APIRouter(prefix="/ai-systems", tags=["AI Systems"])
 
@@ -51,9 +52,22 @@ def create_ai_system(payload: AISystemCreate, request: Request, db: Session = De
 
 
 @router.get("/", response_model=list[AISystemResponse])
-def list_ai_systems(db: Session = Depends(get_db)):
-    systems = db.query(AISystem).all()
-    return systems
+def list_ai_systems(
+    response: Response,
+    lifecycle_status: LifecycleStatus | None = None,
+    risk_classification: RiskClassification | None = None,
+    owner: str | None = None,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
+    query = db.query(AISystem)
+    if lifecycle_status:
+        query = query.filter(AISystem.lifecycle_status == lifecycle_status)
+    if risk_classification:
+        query = query.filter(AISystem.risk_classification == risk_classification)
+    if owner:
+        query = query.filter(AISystem.owner == owner)
+    return keyset_page(query, (AISystem.created_at, AISystem.id), page, response)
 
 
 @router.get("/{system_id}", response_model=AISystemResponse)
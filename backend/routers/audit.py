@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models import AuditLog
+from schemas.audit import AuditLogResponse
+from security.auth import require_roles
+from security.roles import Role
+from utils.pagination import PageParams, keyset_page, page_params
+from utils.streaming import stream_ndjson, wants_ndjson
+
+router = APIRouter(prefix="/audit", tags=["Audit"])
+
+
+@router.get(
+    "/logs",
+    response_model=list[AuditLogResponse],
+    dependencies=[Depends(require_roles(Role.AUDITOR, Role.COMPLIANCE, Role.ADMIN))],
+)
+def list_audit_logs(
+    request: Request,
+    response: Response,
+    timestamp_from: datetime | None = None,
+    timestamp_to: datetime | None = None,
+    user_id: str | None = None,
+    action: str | None = None,
+    entity_type: str | None = None,
+    entity_id: str | None = None,
+    stream: bool = False,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
+    """Query audit log entries page by page, or all matches as NDJSON.
+
+    ``audit_logs`` is partitioned by month on ``timestamp``; bounding a query
+    with ``timestamp_from``/``timestamp_to`` lets PostgreSQL scan only the
+    matching partitions. Send ``Accept: application/x-ndjson`` or
+    ``?stream=true`` for the streaming export.
+    """
+    def build_query(session: Session):
+        query = session.query(AuditLog)
+        if timestamp_from:
+            query = query.filter(AuditLog.timestamp >= timestamp_from)
+        if timestamp_to:
+            query = query.filter(AuditLog.timestamp < timestamp_to)
+        if user_id:
+            query = query.filter(AuditLog.user_id == user_id)
+        if action:
+            query = query.filter(AuditLog.action == action)
+        if entity_type:
+            query = query.filter(AuditLog.entity_type == entity_type)
+        if entity_id:
+            query = query.filter(AuditLog.entity_id == entity_id)
+        return query
+
+    if wants_ndjson(request, stream):
+        return stream_ndjson(
+            lambda session: build_query(session).order_by(
+                AuditLog.timestamp.desc(), AuditLog.id.desc()
+            ),
+            AuditLogResponse,
+        )
+    return keyset_page(build_query(db), (AuditLog.timestamp, AuditLog.id), page, response)
@@ -1,14 +1,18 @@
 from datetime import datetime
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from database import get_db
 from models.ai_system import AISystem
-from models.change_request import ChangeRequest, ChangeStatus, is_valid_transition
+from models.change_request import ChangeRequest, ChangeStatus, ChangeType, is_valid_transition
 from schemas.change_request import ChangeRequestCreate, ChangeRequestResponse
 from audit import log_security_event
 from security.auth import get_current_user, require_not_auditor, require_roles
+from services.risk_snapshot_service import RiskSnapshotService
+from utils.pagination import PageParams, keyset_page, page_params
+from utils.streaming import stream_ndjson, wants_ndjson
 from security.roles import Role
 
 router = APIRouter(tags=["Change Requests"])
@@ -42,6 +46,7 @@ def create_change_request(
     )
 
     db.add(change)
+    RiskSnapshotService(db).record_change_request(change)
     db.commit()
     db.refresh(change)
 
@@ -54,9 +59,50 @@ def create_change_request(
 
 
 @router.get("/changes", response_model=list[ChangeRequestResponse])
-def list_change_requests(db: Session = Depends(get_db)):
-    changes = db.query(ChangeRequest).all()
-    return changes
+def list_change_requests(
+    request: Request,
+    response: Response,
+    status: ChangeStatus | None = None,
+    change_type: ChangeType | None = None,
+    ai_system_id: UUID | None = None,
+    requested_by: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    stream: bool = False,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
+    """List change requests page by page, or all matches as NDJSON.
+
+    Send ``Accept: application/x-ndjson`` or ``?stream=true`` for the
+    streaming export; pagination parameters are ignored in that mode.
+    """
+    def build_query(session: Session):
+        query = session.query(ChangeRequest)
+        if status:
+            query = query.filter(ChangeRequest.status == status)
+        if change_type:
+            query = query.filter(ChangeRequest.change_type == change_type)
+        if ai_system_id:
+            query = query.filter(ChangeRequest.ai_system_id == str(ai_system_id))
+        if requested_by:
+            query = query.filter(ChangeRequest.requested_by == requested_by)
+        if created_from:
+            query = query.filter(ChangeRequest.created_at >= created_from)
+        if created_to:
+            query = query.filter(ChangeRequest.created_at < created_to)
+        return query
+
+    if wants_ndjson(request, stream):
+        return stream_ndjson(
+            lambda session: build_query(session).order_by(
+                ChangeRequest.created_at.desc(), ChangeRequest.id.desc()
+            ),
+            ChangeRequestResponse,
+        )
+    return keyset_page(
+        build_query(db), (ChangeRequest.created_at, ChangeRequest.id), page, response
+    )
 
 
 @router.get("/changes/{change_id}", response_model=ChangeRequestResponse)
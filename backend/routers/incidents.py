@@ -1,13 +1,29 @@
+import json
+import uuid
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import ValidationError
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from database import get_db
-from models.ai_incident import AIIncident, IncidentStatus
+from models.ai_incident import (
+    AIIncident,
+    IncidentSeverity,
+    IncidentStatus,
+    IncidentType,
+    generate_uuid,
+)
 from models.change_request import ChangeRequest, ChangeType
 from models.ai_system import AISystem
 from schemas.ai_incident import (
+    AIIncidentBulkItem,
+    AIIncidentBulkResponse,
+    AIIncidentBulkResult,
     AIIncidentCreate,
     AIIncidentInvestigation,
     AIIncidentResponse,
@@ -16,6 +32,7 @@ from schemas.ai_incident import (
 )
 from utils.audit import (
     AI_INCIDENT_ASSIGNED,
+    AI_INCIDENT_BULK_REPORTED,
     AI_INCIDENT_INVESTIGATED,
     AI_INCIDENT_REPORTED,
     AI_INCIDENT_RESOLVED,
@@ -23,11 +40,70 @@ from utils.audit import (
     AI_INCIDENT_TRIAGE_CONFIRMED,
 )
 from services.incident_triage_service import IncidentTriageService
+from services.risk_snapshot_service import RiskSnapshotService
 from security.auth import get_current_user, require_not_auditor
 from security.roles import Role
+from utils.pagination import PageParams, keyset_page, page_params
+from utils.streaming import stream_ndjson, wants_ndjson
 
 router = APIRouter(prefix="/incidents", tags=["AI Incidents"])
 
+MAX_BULK_INCIDENTS = 1000
+# Checked before the body is parsed: 1000 incidents with long descriptions
+# fit comfortably, while an oversized batch is rejected without decoding it.
+MAX_BULK_BODY_BYTES = 8 * 1024 * 1024
+
+
+@dataclass
+class IncidentFilters:
+    status: IncidentStatus | None = None
+    severity: IncidentSeverity | None = None
+    incident_type: IncidentType | None = None
+    ai_system_id: uuid.UUID | None = None
+    assigned_to_user: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+    def apply(self, query):
+        if self.status:
+            query = query.filter(AIIncident.status == self.status)
+        if self.severity:
+            query = query.filter(AIIncident.severity == self.severity)
+        if self.incident_type:
+            query = query.filter(AIIncident.incident_type == self.incident_type)
+        if self.ai_system_id:
+            query = query.filter(AIIncident.ai_system_id == str(self.ai_system_id))
+        if self.assigned_to_user:
+            query = query.filter(AIIncident.assigned_to_user == self.assigned_to_user)
+        if self.created_from:
+            query = query.filter(AIIncident.created_at >= self.created_from)
+        if self.created_to:
+            query = query.filter(AIIncident.created_at < self.created_to)
+        return query
+
+
+def _apply_triage(incident: AIIncident, suggestion: dict, system: AISystem) -> None:
+    incident.triage_suggested_severity = suggestion["severity"]
+    incident.triage_suggested_owner_role = suggestion["owner_role"]
+    incident.triage_suggested_root_cause_category = suggestion["root_cause"]
+    root_cause_explanation = suggestion.get("root_cause_explanation")
+    if root_cause_explanation:
+        incident.triage_suggestion_reason = (
+            f"{suggestion['reason']} | RCA: {root_cause_explanation}"
+        )
+    else:
+        incident.triage_suggestion_reason = suggestion["reason"]
+    incident.triage_status = "SUGGESTED"
+
+    incident.assigned_to_role = suggestion["owner_role"]
+    incident.assigned_at = datetime.utcnow()
+    risk_value = getattr(system.risk_classification, "value", system.risk_classification)
+    if risk_value in ("high", "critical"):
+        incident.assigned_to_role = "COMPLIANCE"
+        incident.triage_suggestion_reason = (
+            f"{incident.triage_suggestion_reason} | Auto-escalated due to high-risk system"
+        )
+
 
 @router.post(
     "/ai-systems/{ai_system_id}/incidents",
@@ -59,28 +135,10 @@ def create_incident(
 
     triage_service = IncidentTriageService(db)
     suggestion = triage_service.suggest(incident)
-    incident.triage_suggested_severity = suggestion["severity"]
-    incident.triage_suggested_owner_role = suggestion["owner_role"]
-    incident.triage_suggested_root_cause_category = suggestion["root_cause"]
-    root_cause_explanation = suggestion.get("root_cause_explanation")
-    if root_cause_explanation:
-        incident.triage_suggestion_reason = (
-            f"{suggestion['reason']} | RCA: {root_cause_explanation}"
-        )
-    else:
-        incident.triage_suggestion_reason = suggestion["reason"]
-    incident.triage_status = "SUGGESTED"
-
-    incident.assigned_to_role = suggestion["owner_role"]
-    incident.assigned_at = datetime.utcnow()
-    risk_value = getattr(system.risk_classification, "value", system.risk_classification)
-    if risk_value in ("high", "critical"):
-        incident.assigned_to_role = "COMPLIANCE"
-        incident.triage_suggestion_reason = (
-            f"{incident.triage_suggestion_reason} | Auto-escalated due to high-risk system"
-        )
+    _apply_triage(incident, suggestion, system)
 
     db.add(incident)
+    RiskSnapshotService(db).record_incident(incident)
     db.commit()
     db.refresh(incident)
 
@@ -103,6 +161,182 @@ def create_incident(
     return incident
 
 
+def _parse_bulk_body(body: bytes, content_type: str) -> list[tuple[dict | None, str | None]]:
+    """Split a JSON array or NDJSON body into (item, parse error) pairs."""
+    if "ndjson" in content_type:
+        items = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append((json.loads(line), None))
+            except json.JSONDecodeError as exc:
+                items.append((None, f"Invalid JSON line: {exc.msg}"))
+        return items
+
+    try:
+        payload = json.loads(body or b"[]")
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    return [(item, None) for item in payload]
+
+
+async def _read_bulk_body(request: Request) -> bytes:
+    """Read the body, rejecting it with 413 once it exceeds ``MAX_BULK_BODY_BYTES``."""
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Batch body exceeds {MAX_BULK_BODY_BYTES} bytes",
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_BULK_BODY_BYTES:
+        raise too_large
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > MAX_BULK_BODY_BYTES:
+            raise too_large
+    return bytes(body)
+
+
+def _ingest_incidents(raw_items, db: Session, user) -> tuple[AIIncidentBulkResponse, dict]:
+    results: list[AIIncidentBulkResult | None] = [None] * len(raw_items)
+
+    valid = []
+    for index, (raw, error) in enumerate(raw_items):
+        if error is None:
+            try:
+                item = AIIncidentBulkItem.model_validate(raw)
+                # Normalised so the lookup below matches regardless of case,
+                # and a malformed id fails its item rather than the query.
+                system_id = str(uuid.UUID(item.ai_system_id))
+                valid.append((index, item, system_id))
+                continue
+            except ValidationError as exc:
+                error = "; ".join(
+                    f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+                    for err in exc.errors()
+                )
+            except ValueError:
+                error = "ai_system_id: Input should be a valid UUID"
+        results[index] = AIIncidentBulkResult(index=index, status="error", error=error)
+
+    system_ids = {system_id for _, _, system_id in valid}
+    systems = (
+        {system.id: system for system in db.query(AISystem).filter(AISystem.id.in_(system_ids))}
+        if system_ids
+        else {}
+    )
+
+    # Triage inputs are computed once per affected system, not once per incident.
+    triage_service = IncidentTriageService(db)
+    contexts = {system_id: triage_service.system_context(system_id) for system_id in systems}
+
+    now = datetime.utcnow()
+    incidents = []
+    for index, item, system_id in valid:
+        system = systems.get(system_id)
+        if not system:
+            results[index] = AIIncidentBulkResult(
+                index=index,
+                status="error",
+                ai_system_id=system_id,
+                error="AI system not found",
+            )
+            continue
+
+        incident = AIIncident(
+            id=generate_uuid(),
+            ai_system_id=system.id,
+            incident_type=item.incident_type,
+            severity=item.severity,
+            impact_area=item.impact_area,
+            description=item.description,
+            contains_personal_data=item.contains_personal_data,
+            detected_by=user.username,
+            detection_date=now,
+            created_at=now,
+            created_by=user.username,
+            status=IncidentStatus.OPEN,
+        )
+        suggestion = triage_service.suggest_for_context(contexts[system.id], item.incident_type)
+        _apply_triage(incident, suggestion, system)
+        incidents.append((index, incident))
+
+    if incidents:
+        columns = [column.key for column in AIIncident.__table__.columns]
+        db.execute(
+            insert(AIIncident),
+            [{key: getattr(incident, key) for key in columns} for _, incident in incidents],
+        )
+        RiskSnapshotService(db).record_incidents(incident for _, incident in incidents)
+        db.commit()
+
+    for index, incident in incidents:
+        results[index] = AIIncidentBulkResult(
+            index=index,
+            status="created",
+            incident_id=incident.id,
+            ai_system_id=incident.ai_system_id,
+            triage_suggested_severity=incident.triage_suggested_severity,
+            assigned_to_role=incident.assigned_to_role,
+        )
+
+    created = len(incidents)
+    response = AIIncidentBulkResponse(
+        created=created,
+        failed=len(results) - created,
+        results=results,
+    )
+    audit_metadata = {
+        "user": user.username,
+        "received": len(results),
+        "created": created,
+        "failed": response.failed,
+        "incidents_per_system": dict(Counter(incident.ai_system_id for _, incident in incidents)),
+        "triage_action": AI_INCIDENT_TRIAGE_SUGGESTED,
+        "assignment_action": AI_INCIDENT_ASSIGNED,
+    }
+    return response, audit_metadata
+
+
+@router.post(
+    "/bulk",
+    response_model=AIIncidentBulkResponse,
+    dependencies=[Depends(require_not_auditor)],
+)
+async def create_incidents_bulk(
+    request: Request,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """Report a batch of incidents across one or more AI systems.
+
+    Accepts a JSON array or an ``application/x-ndjson`` body of
+    ``AIIncidentCreate`` records with an ``ai_system_id``. Valid items are
+    triaged and inserted together; invalid ones are reported per item.
+    """
+    raw_items = _parse_bulk_body(
+        await _read_bulk_body(request), request.headers.get("content-type", "")
+    )
+    if len(raw_items) > MAX_BULK_INCIDENTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {MAX_BULK_INCIDENTS} incidents",
+        )
+
+    response, audit_metadata = await run_in_threadpool(_ingest_incidents, raw_items, db, user)
+
+    state = request.scope.setdefault("state", {})
+    state["audit_action"] = AI_INCIDENT_BULK_REPORTED
+    state["audit_entity_type"] = "AI_INCIDENT_BATCH"
+    state["audit_metadata"] = audit_metadata
+
+    return response
+
+
 @router.post(
     "/{incident_id}/triage/confirm",
     response_model=AIIncidentResponse,
@@ -151,8 +385,10 @@ def confirm_triage(
     incident.triage_confirmed_at = datetime.utcnow()
     incident.triage_override_reason = payload.override_reason
 
+    previous_severity = incident.severity
     incident.severity = payload.confirmed_severity
     incident.root_cause_category = payload.confirmed_root_cause_category.value
+    RiskSnapshotService(db).record_severity_change(incident, previous_severity)
 
     db.commit()
     db.refresh(incident)
@@ -173,21 +409,51 @@ def confirm_triage(
     return incident
 
 @router.get("/", response_model=list[AIIncidentResponse])
-def list_incidents(db: Session = Depends(get_db)):
-    return db.query(AIIncident).order_by(AIIncident.created_at.desc()).all()
+def list_incidents(
+    request: Request,
+    response: Response,
+    assigned_to_role: str | None = None,
+    stream: bool = False,
+    filters: IncidentFilters = Depends(),
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
+    """List incidents page by page, or all matches as NDJSON.
+
+    Send ``Accept: application/x-ndjson`` or ``?stream=true`` for the
+    streaming export; pagination parameters are ignored in that mode.
+    """
+    def build_query(session: Session):
+        query = filters.apply(session.query(AIIncident))
+        if assigned_to_role:
+            query = query.filter(AIIncident.assigned_to_role == assigned_to_role.upper())
+        return query
+
+    if wants_ndjson(request, stream):
+        return stream_ndjson(
+            lambda session: build_query(session).order_by(
+                AIIncident.created_at.desc(), AIIncident.id.desc()
+            ),
+            AIIncidentResponse,
+        )
+    return keyset_page(build_query(db), (AIIncident.created_at, AIIncident.id), page, response)
 
 
 @router.get("/queue", response_model=list[AIIncidentResponse])
-def get_queue(role: str, db: Session = Depends(get_db)):
+def get_queue(
+    role: str,
+    response: Response,
+    filters: IncidentFilters = Depends(),
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
     role_value = role.upper()
     if role_value not in {"AI_OWNER", "COMPLIANCE"}:
         raise HTTPException(status_code=400, detail="Invalid role. Use ai_owner or compliance.")
-    return (
-        db.query(AIIncident)
-        .filter(AIIncident.assigned_to_role == role_value)
-        .order_by(AIIncident.created_at.desc())
-        .all()
+    query = filters.apply(
+        db.query(AIIncident).filter(AIIncident.assigned_to_role == role_value)
     )
+    return keyset_page(query, (AIIncident.created_at, AIIncident.id), page, response)
 
 
 @router.get("/{incident_id}", response_model=AIIncidentResponse)
@@ -1,7 +1,9 @@
 import hashlib
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from database import get_db
@@ -16,8 +18,12 @@ from schemas.prompt import (
 )
 from security.auth import get_current_user, require_not_auditor, require_roles
 from security.roles import Role
+from services.content_store import ContentStore
+from services.version_diff import DiffFormat, cached_diff
 from schemas.submit import VersionSubmitRequest
-from utils.diff import generate_unified_diff
+from utils.idempotency import find_existing_version, idempotency_key_header, mark_replayed
+from utils.pagination import PageParams, keyset_page, page_params
+from utils.streaming import stream_ndjson, wants_ndjson
 
 router = APIRouter(prefix="/prompts", tags=["Prompt Governance"])
 
@@ -52,8 +58,17 @@ def create_prompt_template(
 
 
 @router.get("/templates", response_model=list[PromptTemplateResponse])
-def list_prompt_templates(db: Session = Depends(get_db)):
-    return db.query(PromptTemplate).all()
+def list_prompt_templates(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
+    return keyset_page(
+        db.query(PromptTemplate),
+        (PromptTemplate.created_at, PromptTemplate.id),
+        page,
+        response,
+    )
 
 
 @router.get("/templates/{template_id}", response_model=PromptTemplateResponse)
@@ -64,6 +79,15 @@ def get_prompt_template(template_id: str, db: Session = Depends(get_db)):
     return template
 
 
+def _replay_version(version: PromptVersion, request: Request, response: Response):
+    mark_replayed(response)
+    state = request.scope.setdefault("state", {})
+    state["audit_action"] = "PROMPT_VERSION_CREATE_REPLAYED"
+    state["audit_entity_id"] = version.id
+    state["audit_entity_type"] = "PROMPT_VERSION"
+    return version
+
+
 @router.post(
     "/templates/{template_id}/versions",
     response_model=PromptVersionResponse,
@@ -73,6 +97,8 @@ def create_prompt_version(
     template_id: str,
     payload: PromptVersionCreate,
     request: Request,
+    response: Response,
+    idempotency_key: str | None = Depends(idempotency_key_header),
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
@@ -80,36 +106,49 @@ def create_prompt_version(
     if not template:
         raise HTTPException(status_code=404, detail="Prompt template not found")
 
-    prev_version = (
-        db.query(PromptVersion)
-        .filter(PromptVersion.prompt_template_id == template_id)
-        .order_by(PromptVersion.version.desc())
-        .first()
-    )
-
-    new_version_number = 1 if not prev_version else prev_version.version + 1
+    hash_input = payload.prompt_text + str(payload.parameters_schema or "")
+    content_hash = hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
 
-    diff = generate_unified_diff(
-        prev_version.prompt_text if prev_version else None,
-        payload.prompt_text,
+    # Re-posted content (or a repeated Idempotency-Key) returns the existing version
+    # without writing anything.
+    versions = db.query(PromptVersion).filter(PromptVersion.prompt_template_id == template_id)
+    existing = find_existing_version(
+        versions, PromptVersion, content_hash, idempotency_key
     )
+    if existing:
+        return _replay_version(existing, request, response)
 
-    hash_input = payload.prompt_text + str(payload.parameters_schema or "")
-    content_hash = hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+    latest_version = (
+        db.query(func.max(PromptVersion.version))
+        .filter(PromptVersion.prompt_template_id == template_id)
+        .scalar()
+    )
+    new_version_number = (latest_version or 0) + 1
 
+    # The text goes to the shared blob store; the diff is computed on demand.
     version = PromptVersion(
         prompt_template_id=template_id,
         version=new_version_number,
         status=PromptStatus.DRAFT,
-        prompt_text=payload.prompt_text,
+        content_blob_hash=ContentStore(db).put(payload.prompt_text),
         parameters_schema=payload.parameters_schema,
-        diff_from_prev=diff,
         content_hash=content_hash,
         created_by=user.username,
+        idempotency_key=idempotency_key,
     )
 
     db.add(version)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request with the same Idempotency-Key inserted first.
+        db.rollback()
+        existing = find_existing_version(
+            versions, PromptVersion, content_hash, idempotency_key
+        )
+        if not existing:
+            raise
+        return _replay_version(existing, request, response)
     db.refresh(version)
 
     state = request.scope.setdefault("state", {})
@@ -121,12 +160,41 @@ def create_prompt_version(
 
 
 @router.get("/templates/{template_id}/versions", response_model=list[PromptVersionResponse])
-def list_prompt_versions(template_id: str, db: Session = Depends(get_db)):
-    return (
-        db.query(PromptVersion)
-        .filter(PromptVersion.prompt_template_id == template_id)
-        .order_by(PromptVersion.version.asc())
-        .all()
+def list_prompt_versions(
+    template_id: str,
+    request: Request,
+    response: Response,
+    status: PromptStatus | None = None,
+    stream: bool = False,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
+    """List a template's versions page by page, or all of them as NDJSON.
+
+    Send ``Accept: application/x-ndjson`` or ``?stream=true`` for the
+    streaming export; pagination parameters are ignored in that mode.
+    """
+    def build_query(session: Session):
+        query = session.query(PromptVersion).filter(
+            PromptVersion.prompt_template_id == template_id
+        )
+        if status:
+            query = query.filter(PromptVersion.status == status)
+        return query
+
+    if wants_ndjson(request, stream):
+        return stream_ndjson(
+            lambda session: build_query(session).order_by(
+                PromptVersion.version.asc(), PromptVersion.id.asc()
+            ),
+            PromptVersionResponse,
+        )
+    return keyset_page(
+        build_query(db),
+        (PromptVersion.version, PromptVersion.id),
+        page,
+        response,
+        descending=False,
     )
 
 
@@ -150,7 +218,68 @@ def get_prompt_diff(version_id: str, db: Session = Depends(get_db)):
     if not version:
         raise HTTPException(status_code=404, detail="Prompt version not found")
 
-    return {"diff": version.diff_from_prev}
+    # Versions created before lazy diffs keep their stored diff.
+    if version.diff_from_prev is not None:
+        return {"diff": version.diff_from_prev}
+
+    prev_version = (
+        db.query(PromptVersion)
+        .filter(
+            PromptVersion.prompt_template_id == version.prompt_template_id,
+            PromptVersion.version < version.version,
+        )
+        .order_by(PromptVersion.version.desc())
+        .first()
+    )
+    if not prev_version:
+        return {"diff": ""}
+
+    return {
+        "diff": cached_diff(
+            prev_version.text_hash,
+            version.text_hash,
+            lambda: (prev_version.prompt_text, version.prompt_text),
+        )
+    }
+
+
+@router.get("/versions/{version_id}/diff/{other_version_id}")
+def compare_prompt_versions(
+    version_id: str,
+    other_version_id: str,
+    diff_format: DiffFormat = Query(DiffFormat.UNIFIED, alias="format"),
+    db: Session = Depends(get_db),
+):
+    """Diff any two versions, ``version_id`` as the old side.
+
+    ``format`` is ``unified`` (text), ``side_by_side`` (aligned line rows) or
+    ``word`` (word-level segments). Results are cached by the pair of
+    content hashes; as a sync endpoint this runs in the threadpool, off the
+    event loop.
+    """
+    versions = {
+        version.id: version
+        for version in db.query(PromptVersion).filter(
+            PromptVersion.id.in_([version_id, other_version_id])
+        )
+    }
+    old, new = versions.get(version_id), versions.get(other_version_id)
+    if not old or not new:
+        raise HTTPException(status_code=404, detail="Prompt version not found")
+
+    return {
+        "from_version_id": old.id,
+        "from_version": old.version,
+        "to_version_id": new.id,
+        "to_version": new.version,
+        "format": diff_format.value,
+        "diff": cached_diff(
+            old.text_hash,
+            new.text_hash,
+            lambda: (old.prompt_text, new.prompt_text),
+            diff_format,
+        ),
+    }
 
 
 @router.post(
@@ -2,7 +2,9 @@ import hashlib
 import json
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from database import get_db
@@ -17,12 +19,41 @@ from schemas.rag import (
 )
 from security.auth import get_current_user, require_roles
 from security.roles import Role
-from utils.diff import generate_unified_diff
+from services.version_diff import DiffFormat, cached_diff
+from utils.idempotency import find_existing_version, idempotency_key_header, mark_replayed
+from utils.pagination import PageParams, keyset_page, page_params
 from schemas.submit import VersionSubmitRequest
 
 router = APIRouter(prefix="/rag", tags=["RAG Governance"])
 
 
+def _canonical_config(uri, ingestion_config, embedding_config) -> str:
+    """Stable JSON form of a version's configuration; its SHA-256 is the content hash."""
+    return json.dumps(
+        {
+            "uri": uri,
+            "ingestion_config": ingestion_config,
+            "embedding_config": embedding_config,
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _version_config(version: RAGSourceVersion) -> str:
+    """Indented configuration text used for diffs, so each setting is its own line."""
+    return json.dumps(
+        {
+            "uri": version.uri,
+            "ingestion_config": version.ingestion_config,
+            "embedding_config": version.embedding_config,
+        },
+        sort_keys=True,
+        indent=2,
+        default=str,
+    )
+
+
 @router.post(
     "/sources",
     response_model=RAGSourceResponse,
@@ -54,8 +85,17 @@ def create_rag_source(
 
 
 @router.get("/sources", response_model=list[RAGSourceResponse])
-def list_rag_sources(db: Session = Depends(get_db)):
-    return db.query(RAGSource).all()
+def list_rag_sources(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
+    return keyset_page(
+        db.query(RAGSource),
+        (RAGSource.created_at, RAGSource.id),
+        page,
+        response,
+    )
 
 
 @router.get("/sources/{source_id}", response_model=RAGSourceResponse)
@@ -66,6 +106,15 @@ def get_rag_source(source_id: str, db: Session = Depends(get_db)):
     return source
 
 
+def _replay_version(version: RAGSourceVersion, request: Request, response: Response):
+    mark_replayed(response)
+    state = request.scope.setdefault("state", {})
+    state["audit_action"] = "RAG_SOURCE_VERSION_CREATE_REPLAYED"
+    state["audit_entity_id"] = version.id
+    state["audit_entity_type"] = "RAG_SOURCE_VERSION"
+    return version
+
+
 @router.post(
     "/sources/{source_id}/versions",
     response_model=RAGSourceVersionResponse,
@@ -75,6 +124,8 @@ def create_rag_source_version(
     source_id: str,
     payload: RAGSourceVersionCreate,
     request: Request,
+    response: Response,
+    idempotency_key: str | None = Depends(idempotency_key_header),
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
@@ -82,40 +133,24 @@ def create_rag_source_version(
     if not source:
         raise HTTPException(status_code=404, detail="RAG source not found")
 
-    prev_version = (
-        db.query(RAGSourceVersion)
-        .filter(RAGSourceVersion.rag_source_id == source_id)
-        .order_by(RAGSourceVersion.version.desc())
-        .first()
-    )
-
-    new_version_number = 1 if not prev_version else prev_version.version + 1
-
-    prev_config = None
-    if prev_version:
-        prev_config = json.dumps(
-            {
-                "uri": prev_version.uri,
-                "ingestion_config": prev_version.ingestion_config,
-                "embedding_config": prev_version.embedding_config,
-            },
-            sort_keys=True,
-            default=str,
-        )
+    current_config = _canonical_config(payload.uri, payload.ingestion_config, payload.embedding_config)
+    content_hash = hashlib.sha256(current_config.encode("utf-8")).hexdigest()
 
-    current_config = json.dumps(
-        {
-            "uri": payload.uri,
-            "ingestion_config": payload.ingestion_config,
-            "embedding_config": payload.embedding_config,
-        },
-        sort_keys=True,
-        default=str,
+    # Re-posted content (or a repeated Idempotency-Key) returns the existing version
+    # without writing anything.
+    versions = db.query(RAGSourceVersion).filter(RAGSourceVersion.rag_source_id == source_id)
+    existing = find_existing_version(
+        versions, RAGSourceVersion, content_hash, idempotency_key
     )
+    if existing:
+        return _replay_version(existing, request, response)
 
-    diff = generate_unified_diff(prev_config, current_config)
-
-    content_hash = hashlib.sha256(current_config.encode("utf-8")).hexdigest()
+    latest_version = (
+        db.query(func.max(RAGSourceVersion.version))
+        .filter(RAGSourceVersion.rag_source_id == source_id)
+        .scalar()
+    )
+    new_version_number = (latest_version or 0) + 1
 
     version = RAGSourceVersion(
         rag_source_id=source_id,
@@ -125,12 +160,22 @@ def create_rag_source_version(
         ingestion_config=payload.ingestion_config,
         embedding_config=payload.embedding_config,
         content_hash=content_hash,
-        diff_from_prev=diff,
         created_by=user.username,
+        idempotency_key=idempotency_key,
     )
 
     db.add(version)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request with the same Idempotency-Key inserted first.
+        db.rollback()
+        existing = find_existing_version(
+            versions, RAGSourceVersion, content_hash, idempotency_key
+        )
+        if not existing:
+            raise
+        return _replay_version(existing, request, response)
     db.refresh(version)
 
     state = request.scope.setdefault("state", {})
@@ -142,12 +187,22 @@ def create_rag_source_version(
 
 
 @router.get("/sources/{source_id}/versions", response_model=list[RAGSourceVersionResponse])
-def list_rag_versions(source_id: str, db: Session = Depends(get_db)):
-    return (
-        db.query(RAGSourceVersion)
-        .filter(RAGSourceVersion.rag_source_id == source_id)
-        .order_by(RAGSourceVersion.version.asc())
-        .all()
+def list_rag_versions(
+    source_id: str,
+    response: Response,
+    status: RAGSourceStatus | None = None,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+):
+    query = db.query(RAGSourceVersion).filter(RAGSourceVersion.rag_source_id == source_id)
+    if status:
+        query = query.filter(RAGSourceVersion.status == status)
+    return keyset_page(
+        query,
+        (RAGSourceVersion.version, RAGSourceVersion.id),
+        page,
+        response,
+        descending=False,
     )
 
 
@@ -171,7 +226,68 @@ def get_rag_version_diff(version_id: str, db: Session = Depends(get_db)):
     if not version:
         raise HTTPException(status_code=404, detail="RAG source version not found")
 
-    return {"diff": version.diff_from_prev}
+    # Versions created before lazy diffs keep their stored diff.
+    if version.diff_from_prev is not None:
+        return {"diff": version.diff_from_prev}
+
+    prev_version = (
+        db.query(RAGSourceVersion)
+        .filter(
+            RAGSourceVersion.rag_source_id == version.rag_source_id,
+            RAGSourceVersion.version < version.version,
+        )
+        .order_by(RAGSourceVersion.version.desc())
+        .first()
+    )
+    if not prev_version:
+        return {"diff": ""}
+
+    return {
+        "diff": cached_diff(
+            prev_version.content_hash,
+            version.content_hash,
+            lambda: (_version_config(prev_version), _version_config(version)),
+        )
+    }
+
+
+@router.get("/versions/{version_id}/diff/{other_version_id}")
+def compare_rag_versions(
+    version_id: str,
+    other_version_id: str,
+    diff_format: DiffFormat = Query(DiffFormat.UNIFIED, alias="format"),
+    db: Session = Depends(get_db),
+):
+    """Diff any two versions, ``version_id`` as the old side.
+
+    ``format`` is ``unified`` (text), ``side_by_side`` (aligned line rows) or
+    ``word`` (word-level segments). Results are cached by the pair of
+    content hashes; as a sync endpoint this runs in the threadpool, off the
+    event loop.
+    """
+    versions = {
+        version.id: version
+        for version in db.query(RAGSourceVersion).filter(
+            RAGSourceVersion.id.in_([version_id, other_version_id])
+        )
+    }
+    old, new = versions.get(version_id), versions.get(other_version_id)
+    if not old or not new:
+        raise HTTPException(status_code=404, detail="RAG source version not found")
+
+    return {
+        "from_version_id": old.id,
+        "from_version": old.version,
+        "to_version_id": new.id,
+        "to_version": new.version,
+        "format": diff_format.value,
+        "diff": cached_diff(
+            old.content_hash,
+            new.content_hash,
+            lambda: (_version_config(old), _version_config(new)),
+            diff_format,
+        ),
+    }
 
 
 @router.post(
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
 
 from database import get_db
 from services.risk_metrics_service import RiskMetricsService
+from utils.pagination import MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/risk", tags=["Risk"])
 
@@ -25,14 +28,16 @@ def risk_summary(db=Depends(get_db)):
 
 
 @router.get("/ai-systems/{id}")
-def risk_for_system(id: str, db=Depends(get_db)):
+def risk_for_system(id: UUID, db=Depends(get_db)):
+    # A malformed id is rejected with 422 before it reaches the per-system filters.
+    system_id = str(id)
     service = RiskMetricsService(db)
 
-    hallucination_data = service.hallucination_rate_per_system().get(id, {})
-    changes = service.changes_last_30_days().get(id, 0)
+    hallucination_data = service.hallucination_rate_per_system(system_id=system_id).get(system_id, {})
+    changes = service.changes_last_30_days(system_id=system_id).get(system_id, 0)
 
     return {
-        "system_id": id,
+        "system_id": system_id,
         "hallucination_data": hallucination_data,
         "changes_last_30_days": changes,
         "flags": {
@@ -76,12 +81,22 @@ def incident_trends(db=Depends(get_db)):
 
 
 @router.get("/drift")
-def drift_signals(db=Depends(get_db)):
-    """Get drift signals for all AI systems (prompt, RAG, and incident-correlated changes)"""
+def drift_signals(
+    after_system_id: UUID | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db=Depends(get_db),
+):
+    """Get drift signals for all AI systems (prompt, RAG, and incident-correlated changes)
+
+    Incident-correlated drift can be paged by AI system with ``limit`` and
+    ``after_system_id``.
+    """
     service = RiskMetricsService(db)
 
     return {
         "prompt_drift": service.prompt_drift(),
         "rag_drift": service.rag_drift(),
-        "incident_correlated_drift": service.change_after_incident(),
+        "incident_correlated_drift": service.change_after_incident(
+            after_system_id=str(after_system_id) if after_system_id else None, limit=limit
+        ),
     }
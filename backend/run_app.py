@@ -1,31 +1,30 @@
 #!/usr/bin/env python
 """Startup script that runs migrations before starting the FastAPI app."""
 
+import os
 import subprocess
 import sys
 
-def main():
-    print("Running database migrations...")
-    result = subprocess.run(
-        ["alembic", "upgrade", "head"],
-        capture_output=True,
-        text=True
-    )
+from services.schema_migrations import ensure_schema_current
 
-    if result.returncode != 0:
-        print(f"Migration failed: {result.stderr}", file=sys.stderr)
+def main():
+    print("Checking database migrations...")
+    try:
+        outcome = ensure_schema_current("auto")
+    except subprocess.CalledProcessError as e:
+        print(f"Migration failed: {e.stderr}", file=sys.stderr)
         sys.exit(1)
 
-    print("Migrations completed successfully")
-    print(result.stdout)
+    print(f"Schema {outcome}")
 
+    # The schema is at head now; workers only need the cheap version check.
     print("Starting uvicorn server...")
     subprocess.run([
         "uvicorn",
         "main:app",
         "--host", "0.0.0.0",
         "--port", "8000"
-    ])
+    ], env={**os.environ, "MIGRATION_MODE": "check"})
 
 if __name__ == "__main__":
     main()
@@ -22,6 +22,26 @@ class AIIncidentCreate(BaseModel):
     )
 
 
+class AIIncidentBulkItem(AIIncidentCreate):
+    ai_system_id: str = Field(..., description="AI system the incident belongs to")
+
+
+class AIIncidentBulkResult(BaseModel):
+    index: int
+    status: str
+    incident_id: str | None = None
+    ai_system_id: str | None = None
+    triage_suggested_severity: str | None = None
+    assigned_to_role: str | None = None
+    error: str | None = None
+
+
+class AIIncidentBulkResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[AIIncidentBulkResult]
+
+
 class AIIncidentResponse(BaseModel):
     id: str
     ai_system_id: str
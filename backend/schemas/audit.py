@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AuditLogResponse(BaseModel):
+    id: str
+    timestamp: datetime
+    user_id: Optional[str]
+    action: str
+    entity_type: Optional[str]
+    entity_id: Optional[str]
+    payload_hash: str
+    state_hash: Optional[str]
+    audit_metadata: Optional[dict]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Benchmark verified JWT authentication against a local JWKS file.
+
+Usage:
+    python scripts/bench_auth.py [--iterations N]
+
+Generates a throwaway RSA key, serves it through ``AUTH_JWKS_FILE`` and
+times three paths: full signature verification with warm JWKS keys, the
+per-token user cache hit, and ``get_current_user`` as a request sees it.
+Exits 1 if the warm ``get_current_user`` path exceeds the budget.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BUDGET_MICROSECONDS = 100.0
+
+
+def _write_jwks(directory: str) -> tuple[str, str]:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jose import jwk
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("ascii")
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode("ascii")
+
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk.update({"kid": "bench", "use": "sig", "alg": "RS256"})
+    path = os.path.join(directory, "jwks.json")
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"keys": [public_jwk]}, handle)
+    return path, private_pem
+
+
+def _time_per_call(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        jwks_path, private_pem = _write_jwks(directory)
+        # The auth modules read their configuration at import time.
+        os.environ["AUTH_JWKS_FILE"] = jwks_path
+        os.environ["SECURITY_LOG_PATH"] = os.path.join(directory, "audit_security.log")
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+
+        from fastapi.security import HTTPAuthorizationCredentials
+        from jose import jwt
+        from starlette.requests import Request
+
+        from security import auth
+        from security.jwks import decode_verified_token
+
+        token = jwt.encode(
+            {
+                "oid": "bench-user",
+                "preferred_username": "bench@example.com",
+                "roles": ["admin"],
+                "exp": int(time.time()) + 3600,
+            },
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": "bench"},
+        )
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+        decode_verified_token(token)  # load the JWKS once
+        auth.get_current_user(request, credentials)  # populate the user cache
+
+        verify_us = _time_per_call(lambda: decode_verified_token(token), max(args.iterations // 10, 1))
+        cache_us = _time_per_call(lambda: auth._parse_user(token), args.iterations)
+        request_us = _time_per_call(lambda: auth.get_current_user(request, credentials), args.iterations)
+
+    print(f"signature verification (warm JWKS): {verify_us:8.1f} us/call")
+    print(f"user cache hit:                     {cache_us:8.1f} us/call")
+    print(f"get_current_user (warm):            {request_us:8.1f} us/call")
+    if request_us > BUDGET_MICROSECONDS:
+        print(f"FAIL: warm get_current_user exceeds {BUDGET_MICROSECONDS:.0f} us budget")
+        return 1
+    print(f"OK: within {BUDGET_MICROSECONDS:.0f} us budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
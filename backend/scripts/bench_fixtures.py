@@ -0,0 +1,173 @@
+"""Seed data shared by the benchmark and check scripts in this directory.
+
+The scripts seed inside a session transaction and roll it back when they
+finish, so they can point at a development database without leaving rows
+behind. Import from a sibling script (``scripts/`` is on ``sys.path`` when a
+script is run directly):
+
+    from bench_fixtures import seed_portfolio
+"""
+
+import itertools
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from models import (
+    AIIncident,
+    AISystem,
+    AISystemPromptBinding,
+    ChangeRequest,
+    PromptTemplate,
+    PromptVersion,
+    generate_uuid,
+)
+from models.ai_incident import ImpactArea, IncidentSeverity, IncidentStatus, IncidentType
+from models.ai_system import LifecycleStatus, RiskClassification
+from models.change_request import ChangeStatus, ChangeType
+from models.prompt_version import PromptStatus
+from services.risk_snapshot_service import RiskSnapshotService
+
+INSERT_CHUNK_SIZE = 5_000
+SEED_USER = "bench-seed"
+
+
+def _insert(db: Session, model, rows: list[dict]) -> None:
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        db.execute(insert(model), rows[start:start + INSERT_CHUNK_SIZE])
+
+
+def seed_portfolio(
+    db: Session,
+    systems: int,
+    incidents_per_system: int = 0,
+    changes_per_system: int = 0,
+    prompt_versions_per_system: int = 0,
+    days: int = 90,
+) -> list[str]:
+    """Insert ``systems`` AI systems with incidents, changes and prompt bindings.
+
+    Incidents and change requests are spread over the last ``days`` days and
+    cycle through every type, severity and queue role. Each system gets one
+    prompt template with ``prompt_versions_per_system`` versions, each bound
+    in turn, so only the newest binding is active. The risk snapshot is
+    rebuilt at the end. Returns the system ids; nothing is committed.
+    """
+    now = datetime.utcnow()
+    run = generate_uuid()[:8]
+    system_ids = [generate_uuid() for _ in range(systems)]
+    _insert(
+        db,
+        AISystem,
+        [
+            {
+                "id": system_id,
+                "name": f"{SEED_USER}-{run}-{index}",
+                "business_purpose": "Benchmark fixture",
+                "intended_users": "Benchmarks",
+                "risk_classification": list(RiskClassification)[index % len(RiskClassification)],
+                "owner": SEED_USER,
+                "lifecycle_status": LifecycleStatus.active,
+                "created_at": now - timedelta(days=days),
+                "created_by": SEED_USER,
+            }
+            for index, system_id in enumerate(system_ids)
+        ],
+    )
+
+    types = itertools.cycle(IncidentType)
+    severities = itertools.cycle(IncidentSeverity)
+    roles = itertools.cycle(["AI_OWNER", "COMPLIANCE"])
+    incidents = []
+    for system_id in system_ids:
+        for index in range(incidents_per_system):
+            created_at = now - timedelta(days=days * index / max(incidents_per_system, 1))
+            incidents.append(
+                {
+                    "id": generate_uuid(),
+                    "ai_system_id": system_id,
+                    "incident_type": next(types),
+                    "severity": next(severities),
+                    "impact_area": ImpactArea.CUSTOMER,
+                    "description": "Benchmark incident",
+                    "contains_personal_data": False,
+                    "detected_by": SEED_USER,
+                    "detection_date": created_at,
+                    "status": IncidentStatus.OPEN,
+                    "created_at": created_at,
+                    "created_by": SEED_USER,
+                    "triage_status": "SUGGESTED",
+                    "assigned_to_role": next(roles),
+                }
+            )
+    _insert(db, AIIncident, incidents)
+
+    changes = []
+    for system_id in system_ids:
+        for index in range(max(changes_per_system, 1 if prompt_versions_per_system else 0)):
+            changes.append(
+                {
+                    "id": generate_uuid(),
+                    "ai_system_id": system_id,
+                    "change_type": ChangeType.PROMPT,
+                    "description": "Benchmark change",
+                    "contains_personal_data": False,
+                    "business_justification": "Benchmark",
+                    "impact_assessment": "None",
+                    "rollback_plan": "None",
+                    "status": ChangeStatus.IMPLEMENTED,
+                    "requested_by": SEED_USER,
+                    "created_at": now - timedelta(days=days * index / max(changes_per_system, 1)),
+                }
+            )
+    _insert(db, ChangeRequest, changes)
+
+    if prompt_versions_per_system:
+        change_by_system = {change["ai_system_id"]: change["id"] for change in changes}
+        templates, versions, bindings = [], [], []
+        for index, system_id in enumerate(system_ids):
+            template_id = generate_uuid()
+            templates.append(
+                {
+                    "id": template_id,
+                    "name": f"{SEED_USER}-{run}-{index}",
+                    "description": "Benchmark template",
+                    "created_at": now - timedelta(days=days),
+                    "created_by": SEED_USER,
+                }
+            )
+            for version in range(1, prompt_versions_per_system + 1):
+                version_id = generate_uuid()
+                latest = version == prompt_versions_per_system
+                age = (prompt_versions_per_system - version) / prompt_versions_per_system
+                activated = now - timedelta(days=days * age)
+                versions.append(
+                    {
+                        "id": version_id,
+                        "prompt_template_id": template_id,
+                        "version": version,
+                        "status": PromptStatus.ACTIVE if latest else PromptStatus.RETIRED,
+                        "inline_prompt_text": f"Benchmark prompt {version}",
+                        "content_hash": f"{template_id}-{version}",
+                        "created_at": activated,
+                        "created_by": SEED_USER,
+                    }
+                )
+                bindings.append(
+                    {
+                        "id": generate_uuid(),
+                        "ai_system_id": system_id,
+                        "prompt_version_id": version_id,
+                        "active_from": activated,
+                        "active_to": None if latest else activated + timedelta(days=1),
+                        "activated_by": SEED_USER,
+                        "change_request_id": change_by_system[system_id],
+                    }
+                )
+        _insert(db, PromptTemplate, templates)
+        _insert(db, PromptVersion, versions)
+        _insert(db, AISystemPromptBinding, bindings)
+
+    RiskSnapshotService(db).rebuild()
+    return system_ids
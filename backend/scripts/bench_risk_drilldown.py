@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Benchmark the per-system risk drilldown against the whole-portfolio path.
+
+Usage:
+    python scripts/bench_risk_drilldown.py [--systems N] [--incidents-per-system N]
+                                           [--samples N] [--budget-ms MS]
+
+Seeds a portfolio (10,000 systems by default) inside a transaction and
+runs ANALYZE, then for a sample of system ids times the two ways of answering
+``/risk/ai-systems/{id}``: the per-system path, which passes ``system_id``
+to ``hallucination_rate_per_system`` and ``changes_last_30_days``, and the
+whole-portfolio path, which computes every system and picks one key. Both
+must return the same figures. The transaction is rolled back at the end.
+Exits 1 on a mismatch, or if --budget-ms is given and the per-system
+median exceeds it.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv(Path(__file__).parent.parent / ".env")
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench_fixtures import seed_portfolio
+from database import SessionLocal
+from services.risk_metrics_service import RiskMetricsService
+
+
+def _per_system(service: RiskMetricsService, system_id: str) -> tuple[dict, int]:
+    return (
+        service.hallucination_rate_per_system(system_id=system_id).get(system_id, {}),
+        service.changes_last_30_days(system_id=system_id).get(system_id, 0),
+    )
+
+
+def _whole_portfolio(service: RiskMetricsService, system_id: str) -> tuple[dict, int]:
+    return (
+        service.hallucination_rate_per_system().get(system_id, {}),
+        service.changes_last_30_days().get(system_id, 0),
+    )
+
+
+def _time(fn, service: RiskMetricsService, system_ids: list[str]) -> tuple[list[float], list]:
+    timings, results = [], []
+    for system_id in system_ids:
+        started = time.perf_counter()
+        results.append(fn(service, system_id))
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings, results
+
+
+def _summary(timings: list[float]) -> str:
+    p95 = sorted(timings)[int(len(timings) * 0.95) - 1]
+    return f"median {statistics.median(timings):8.2f} ms, p95 {p95:8.2f} ms, max {max(timings):8.2f} ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--systems", type=int, default=10_000)
+    parser.add_argument("--incidents-per-system", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--budget-ms", type=float)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        system_ids = seed_portfolio(
+            db, args.systems, incidents_per_system=args.incidents_per_system, changes_per_system=3
+        )
+        db.flush()
+        # Bulk-loaded tables have no planner statistics until analyzed.
+        db.connection().exec_driver_sql("ANALYZE")
+        print(
+            f"seeded {args.systems} systems, {args.systems * args.incidents_per_system} incidents "
+            f"in {time.perf_counter() - started:.1f}s\n"
+        )
+
+        service = RiskMetricsService(db)
+        sample = random.Random(0).sample(system_ids, min(args.samples, len(system_ids)))
+        # Warm the connection and plan caches before timing either path.
+        _per_system(service, sample[0])
+        _whole_portfolio(service, sample[0])
+
+        per_system_ms, per_system_results = _time(_per_system, service, sample)
+        portfolio_ms, portfolio_results = _time(_whole_portfolio, service, sample)
+    finally:
+        db.rollback()
+        db.close()
+
+    print(f"per-system path:      {_summary(per_system_ms)}")
+    print(f"whole-portfolio path: {_summary(portfolio_ms)}")
+    print(f"speedup (median):     {statistics.median(portfolio_ms) / statistics.median(per_system_ms):.0f}x")
+
+    if per_system_results != portfolio_results:
+        print("FAIL: per-system and whole-portfolio paths disagree")
+        return 1
+    if args.budget_ms is not None and statistics.median(per_system_ms) > args.budget_ms:
+        print(f"FAIL: per-system median exceeds {args.budget_ms:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
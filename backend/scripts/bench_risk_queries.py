@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Check that the risk endpoints issue a constant number of queries.
+
+Usage:
+    python scripts/bench_risk_queries.py [--systems 100,1000,4000]
+                                         [--incidents-per-system N]
+
+For each portfolio size, seeds that many AI systems with incidents and
+change requests inside a transaction, then counts the SQL statements and
+times ``/risk/summary``, ``/risk/ai-systems/{id}`` and
+``hallucination_rate_per_system()``. The route functions are called
+directly with the seeded session. The transaction is rolled back after
+each size, so no seed rows remain. Exits 1 if any call's query count
+changes as the portfolio grows, the N+1 pattern the grouped queries
+replaced.
+"""
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import UUID
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv(Path(__file__).parent.parent / ".env")
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event
+
+from bench_fixtures import seed_portfolio
+from database import SessionLocal, get_engine
+from routers.risk import risk_for_system, risk_summary
+from services.risk_metrics_service import RiskMetricsService
+
+
+@contextmanager
+def _count_queries():
+    """Yield a one-item list holding the number of statements executed so far."""
+    counter = [0]
+
+    def before_cursor_execute(*_):
+        counter[0] += 1
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _measure(fn) -> tuple[int, float]:
+    with _count_queries() as counter:
+        started = time.perf_counter()
+        fn()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    return counter[0], elapsed_ms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--systems", default="100,1000,4000", help="comma-separated portfolio sizes")
+    parser.add_argument("--incidents-per-system", type=int, default=5)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.systems.split(",")]
+
+    calls = {
+        "/risk/summary": lambda db, system_id: risk_summary(db=db),
+        "/risk/ai-systems/{id}": lambda db, system_id: risk_for_system(UUID(system_id), db=db),
+        "hallucination_rate_per_system()": lambda db, system_id: RiskMetricsService(db).hallucination_rate_per_system(),
+    }
+    query_counts = {name: {} for name in calls}
+
+    print(f"{'systems':>8}  {'call':<32}  {'queries':>7}  {'ms':>9}")
+    db = SessionLocal()
+    try:
+        for size in sizes:
+            system_ids = seed_portfolio(
+                db, size, incidents_per_system=args.incidents_per_system, changes_per_system=2
+            )
+            db.flush()
+            for name, call in calls.items():
+                queries, elapsed_ms = _measure(lambda: call(db, system_ids[len(system_ids) // 2]))
+                query_counts[name][size] = queries
+                print(f"{size:>8}  {name:<32}  {queries:>7}  {elapsed_ms:9.1f}")
+            db.rollback()
+    finally:
+        db.rollback()
+        db.close()
+
+    failed = False
+    for name, by_size in query_counts.items():
+        if len(set(by_size.values())) > 1:
+            print(f"FAIL: {name} query count grows with the portfolio: {by_size}")
+            failed = True
+    if not failed:
+        print("\nOK: query counts are independent of portfolio size")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""Benchmark time-to-first-request for ``main:app`` under uvicorn.
+
+Usage:
+    python scripts/bench_startup.py [--runs N] [--skip-migrations]
+                                    [--record PATH] [--budget-ms MS]
+
+Each run starts a fresh uvicorn process on a free port and polls
+``GET /health`` until it answers 200; the elapsed time from spawn covers
+interpreter start, app import, startup hooks and the first response.
+The app's own environment (.env, DATABASE_URL) is used as is;
+--skip-migrations sets MIGRATION_MODE=skip to leave the database out.
+
+--record appends one JSON line per invocation (timestamp, git revision,
+min/median/max) so local runs can be compared over time without CI.
+Exits 1 if --budget-ms is given and the median exceeds it.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+POLL_INTERVAL_SECONDS = 0.01
+STARTUP_TIMEOUT_SECONDS = 60.0
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _time_to_first_request(env: dict) -> float:
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        while time.perf_counter() - started < STARTUP_TIMEOUT_SECONDS:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited during startup:\n{server.stderr.read()}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                pass
+            time.sleep(POLL_INTERVAL_SECONDS)
+        raise RuntimeError(f"No response from {url} within {STARTUP_TIMEOUT_SECONDS:.0f}s")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def _git_revision() -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    return result.stdout.strip() or None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--skip-migrations", action="store_true")
+    parser.add_argument("--record", type=Path, help="append a JSON line with the results")
+    parser.add_argument("--budget-ms", type=float)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.skip_migrations:
+        env["MIGRATION_MODE"] = "skip"
+
+    timings = []
+    for run in range(1, args.runs + 1):
+        timings.append(_time_to_first_request(env))
+        print(f"run {run}: {timings[-1]:8.1f} ms")
+
+    median_ms = statistics.median(timings)
+    print(f"time to first request: min {min(timings):.1f} ms, median {median_ms:.1f} ms, max {max(timings):.1f} ms")
+
+    if args.record:
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "revision": _git_revision(),
+            "runs": args.runs,
+            "migration_mode": env.get("MIGRATION_MODE", "auto"),
+            "min_ms": round(min(timings), 1),
+            "median_ms": round(median_ms, 1),
+            "max_ms": round(max(timings), 1),
+        }
+        with args.record.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f"FAIL: median exceeds {args.budget_ms:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""Benchmark triage suggestion throughput, interpreted versus compiled rules.
+
+Usage:
+    python scripts/bench_triage_rules.py [--iterations N]
+
+Runs ``IncidentTriageService.suggest_for_context`` over a mix of system
+contexts and incident types with three rule engines:
+
+- legacy: re-reads both triage YAML files for every incident, then
+  interprets each condition (``ast.parse`` and a tree walk per evaluation),
+  as the service did before rules were compiled;
+- interpreter: the same interpreter over rules loaded once;
+- compiled: the process-wide rule set from ``load_rule_set()``.
+
+Prints suggestions per second for each. Exits 1 if the interpreter and the
+compiled engine disagree on any suggestion. No database is needed.
+"""
+
+import argparse
+import ast
+import itertools
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import yaml
+
+from models.ai_incident import IncidentType
+from services.incident_triage_service import IncidentTriageService
+from services.triage_rule_engine import (
+    ROOT_CAUSE_MAP_PATH,
+    RULES_PATH,
+    CompiledRule,
+    CompiledRuleSet,
+)
+
+
+def _interpret(node: ast.AST, context: dict):
+    """The tree-walking evaluator the service used before rules were compiled."""
+    if isinstance(node, ast.BoolOp):
+        values = [_interpret(value, context) for value in node.values]
+        return all(values) if isinstance(node.op, ast.And) else any(values)
+    if isinstance(node, ast.Compare):
+        left = _interpret(node.left, context)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _interpret(comparator, context)
+            if isinstance(op, ast.Eq):
+                result = left == right
+            elif isinstance(op, ast.NotEq):
+                result = left != right
+            elif isinstance(op, ast.Gt):
+                result = left > right
+            elif isinstance(op, ast.GtE):
+                result = left >= right
+            elif isinstance(op, ast.Lt):
+                result = left < right
+            elif isinstance(op, ast.LtE):
+                result = left <= right
+            elif isinstance(op, ast.In):
+                result = left in right
+            elif isinstance(op, ast.NotIn):
+                result = left not in right
+            else:
+                raise ValueError("Unsupported operator")
+            if not result:
+                return False
+            left = right
+        return True
+    if isinstance(node, ast.Name):
+        return context.get(node.id)
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Tuple):
+        return tuple(_interpret(elt, context) for elt in node.elts)
+    raise ValueError("Unsupported condition expression")
+
+
+def _interpreted_rule_set(rules: dict) -> CompiledRuleSet:
+    def interpreted(condition: str):
+        return lambda context: _interpret(ast.parse(condition, mode="eval").body, context)
+
+    def section(name: str) -> tuple[CompiledRule, ...]:
+        return tuple(
+            CompiledRule(rule=rule, predicate=interpreted(rule["condition"]) if rule.get("condition") else None)
+            for rule in rules.get(name, []) or []
+        )
+
+    return CompiledRuleSet(
+        severity_rules=section("severity_rules"),
+        escalation_rules=section("escalation_rules"),
+        drift_rules=section("drift_rules"),
+    )
+
+
+def _load_yaml(path: Path) -> dict:
+    with path.open("r", encoding="utf-8") as handle:
+        return yaml.safe_load(handle) or {}
+
+
+def _cases() -> list[tuple[dict, str]]:
+    contexts = [
+        {"risk": risk, "drift_flag": drift, "incidents_last_30_days": incidents, "volatility": volatility}
+        for risk, drift, incidents, volatility in itertools.product(
+            ("low", "medium", "high", "critical"), (False, True), (0, 5), (2, 15)
+        )
+    ]
+    return [(context, incident_type.value) for context in contexts for incident_type in IncidentType]
+
+
+def _throughput(suggest, cases: list[tuple[dict, str]], iterations: int) -> float:
+    started = time.perf_counter()
+    for context, incident_type in itertools.islice(itertools.cycle(cases), iterations):
+        suggest(context, incident_type)
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    cases = _cases()
+    compiled = IncidentTriageService(db=None)
+    interpreter = IncidentTriageService(db=None)
+    interpreter.rule_set = _interpreted_rule_set(_load_yaml(RULES_PATH))
+
+    mismatches = [
+        (context, incident_type)
+        for context, incident_type in cases
+        if interpreter.suggest_for_context(context, incident_type)
+        != compiled.suggest_for_context(context, incident_type)
+    ]
+    if mismatches:
+        print(f"FAIL: engines disagree on {len(mismatches)} of {len(cases)} cases, e.g. {mismatches[0]}")
+        return 1
+    print(f"OK: interpreter and compiled engine agree on all {len(cases)} cases\n")
+
+    def legacy_suggest(context: dict, incident_type: str) -> dict:
+        service = IncidentTriageService(db=None)
+        service.rule_set = _interpreted_rule_set(_load_yaml(RULES_PATH))
+        service.root_cause_map = _load_yaml(ROOT_CAUSE_MAP_PATH)
+        return service.suggest_for_context(context, incident_type)
+
+    # Re-reading YAML is orders of magnitude slower; fewer iterations keep the run short.
+    legacy_iterations = max(args.iterations // 50, 100)
+    results = [
+        ("legacy (YAML reload + interpreter)", _throughput(legacy_suggest, cases, legacy_iterations)),
+        ("interpreter", _throughput(interpreter.suggest_for_context, cases, args.iterations)),
+        ("compiled", _throughput(compiled.suggest_for_context, cases, args.iterations)),
+    ]
+    compiled_rate = results[-1][1]
+    print(f"{'engine':<36}  {'suggestions/s':>14}  {'vs compiled':>11}")
+    for name, rate in results:
+        print(f"{name:<36}  {rate:14,.0f}  {rate / compiled_rate:10.3f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""Check with EXPLAIN that the hot risk and queue queries use their indexes.
+
+Usage:
+    python scripts/check_index_usage.py [--systems N] [--incidents-per-system N]
+
+Seeds a portfolio inside a transaction, runs ANALYZE, and EXPLAINs each
+hot-path query against the migrated database. A check passes when its
+plan scans one of the expected indexes from the hot-path index migration.
+The transaction is rolled back at the end, so no seed rows remain. Exits 1
+and prints the offending plan if any query falls back to a sequential scan.
+Requires PostgreSQL.
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv(Path(__file__).parent.parent / ".env")
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from bench_fixtures import seed_portfolio
+from database import SessionLocal
+from models import (
+    AIIncident,
+    AISystemPromptBinding,
+    ChangeRequest,
+    PromptVersion,
+    RiskMetricsSnapshot,
+    SnapshotMetric,
+)
+from models.ai_incident import IncidentType
+
+INDEX_NODE_TYPES = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+PAGE_SIZE = 101
+
+
+def _hot_queries(system_id: str, template_id: str) -> list[tuple[str, object, set[str]]]:
+    now = datetime.utcnow()
+    return [
+        (
+            "incidents for one system, newest first",
+            select(AIIncident)
+            .where(AIIncident.ai_system_id == system_id)
+            .order_by(AIIncident.created_at.desc(), AIIncident.id.desc())
+            .limit(PAGE_SIZE),
+            {"ix_ai_incidents_ai_system_id_created_at"},
+        ),
+        (
+            "role queue page",
+            select(AIIncident)
+            .where(AIIncident.assigned_to_role == "COMPLIANCE")
+            .order_by(AIIncident.created_at.desc(), AIIncident.id.desc())
+            .limit(PAGE_SIZE),
+            {"ix_ai_incidents_assigned_to_role_created_at", "ix_ai_incidents_created_at"},
+        ),
+        (
+            "hallucinations in the last week",
+            select(AIIncident.id).where(
+                AIIncident.incident_type == IncidentType.HALLUCINATION,
+                AIIncident.created_at >= now - timedelta(days=7),
+            ),
+            {"ix_ai_incidents_incident_type_created_at"},
+        ),
+        (
+            "changes for one system in the last 30 days",
+            select(ChangeRequest.id).where(
+                ChangeRequest.ai_system_id == system_id,
+                ChangeRequest.created_at >= now - timedelta(days=30),
+            ),
+            {"ix_change_requests_ai_system_id_created_at"},
+        ),
+        (
+            "active prompt binding for one system",
+            select(AISystemPromptBinding).where(
+                AISystemPromptBinding.ai_system_id == system_id,
+                AISystemPromptBinding.active_to.is_(None),
+            ),
+            {
+                "ix_ai_system_prompt_bindings_active",
+                "ix_ai_system_prompt_bindings_ai_system_id_active_to",
+            },
+        ),
+        (
+            "latest version of a prompt template",
+            select(PromptVersion.id)
+            .where(PromptVersion.prompt_template_id == template_id)
+            .order_by(PromptVersion.version.desc())
+            .limit(1),
+            {"ix_prompt_versions_prompt_template_id_version"},
+        ),
+        (
+            "risk snapshot change volume, last 30 days",
+            select(RiskMetricsSnapshot.ai_system_id, RiskMetricsSnapshot.event_count).where(
+                RiskMetricsSnapshot.metric == SnapshotMetric.CHANGE_REQUEST.value,
+                RiskMetricsSnapshot.day >= (now - timedelta(days=30)).date(),
+            ),
+            {"ix_risk_metrics_snapshot_metric_day"},
+        ),
+    ]
+
+
+def _scanned_indexes(plan: dict) -> set[str]:
+    found = set()
+    if plan.get("Node Type") in INDEX_NODE_TYPES:
+        found.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        found |= _scanned_indexes(child)
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--systems", type=int, default=2_000)
+    parser.add_argument("--incidents-per-system", type=int, default=25)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name != "postgresql":
+            print("EXPLAIN checks require PostgreSQL", file=sys.stderr)
+            return 2
+
+        system_ids = seed_portfolio(
+            db,
+            args.systems,
+            incidents_per_system=args.incidents_per_system,
+            changes_per_system=5,
+            prompt_versions_per_system=5,
+        )
+        system_id = system_ids[len(system_ids) // 2]
+        template_id = db.execute(
+            select(PromptVersion.prompt_template_id)
+            .join(AISystemPromptBinding, AISystemPromptBinding.prompt_version_id == PromptVersion.id)
+            .where(AISystemPromptBinding.ai_system_id == system_id)
+            .limit(1)
+        ).scalar_one()
+        connection = db.connection()
+        connection.exec_driver_sql("ANALYZE")
+
+        failures = 0
+        for label, statement, expected in _hot_queries(system_id, template_id):
+            sql = str(
+                statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+            )
+            plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()[0]["Plan"]
+            used = _scanned_indexes(plan)
+            ok = bool(used & expected)
+            failures += not ok
+            print(f"{'OK  ' if ok else 'FAIL'} {label}: {', '.join(sorted(used)) or 'no index scan'}")
+            if not ok:
+                explained = connection.exec_driver_sql(f"EXPLAIN {sql}")
+                print("\n".join(f"       {line}" for (line,) in explained))
+        return 1 if failures else 0
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,25 @@
 #!/usr/bin/env python
-"""Export local database data to JSON for migration to Azure."""
+"""Export local database data to JSON for migration to Azure.
 
+Usage:
+    python scripts/export_local_data.py > export.json
+    python scripts/export_local_data.py --output-dir export/ [--format ndjson|parquet]
+                                        [--workers N] [--batch-size N]
+
+Without ``--output-dir`` everything is printed as one JSON document, which
+only suits small databases. With it, each table is streamed to its own file
+and a ``manifest.json`` records row counts and SHA-256 checksums. On
+PostgreSQL all tables are read in parallel from one exported
+repeatable-read snapshot, so the files are mutually consistent.
+"""
+
+import argparse
+import enum
+import hashlib
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -12,16 +29,38 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database import SessionLocal
+from sqlalchemy import Boolean, DateTime, Integer, JSON, select, text
+
+from database import SessionLocal, engine
 from models import (
     AISystem,
+    AISystemPromptBinding,
+    AISystemRAGBinding,
     ChangeRequest,
+    ContentBlob,
     PromptTemplate,
     PromptVersion,
     RAGSource,
     RAGSourceVersion,
     AIIncident,
 )
+from utils.content_codec import decompress_text
+
+DEFAULT_BATCH_SIZE = 5000
+MANIFEST_FILE = "manifest.json"
+
+# Streaming export: output name -> table, in import dependency order.
+EXPORT_TABLES = {
+    "ai_systems": AISystem.__table__,
+    "change_requests": ChangeRequest.__table__,
+    "prompt_templates": PromptTemplate.__table__,
+    "prompt_versions": PromptVersion.__table__,
+    "rag_sources": RAGSource.__table__,
+    "rag_source_versions": RAGSourceVersion.__table__,
+    "ai_system_prompt_bindings": AISystemPromptBinding.__table__,
+    "ai_system_rag_bindings": AISystemRAGBinding.__table__,
+    "incidents": AIIncident.__table__,
+}
 
 
 def export_data():
@@ -141,6 +180,18 @@ def export_data():
                 "root_cause_description": incident.root_cause_description,
                 "root_cause_category": incident.root_cause_category,
                 "corrective_change_request_id": str(incident.corrective_change_request_id) if incident.corrective_change_request_id else None,
+                "contains_personal_data": incident.contains_personal_data,
+                "triage_suggested_severity": incident.triage_suggested_severity,
+                "triage_suggested_owner_role": incident.triage_suggested_owner_role,
+                "triage_suggested_root_cause_category": incident.triage_suggested_root_cause_category,
+                "triage_suggestion_reason": incident.triage_suggestion_reason,
+                "triage_status": incident.triage_status,
+                "triage_confirmed_by": incident.triage_confirmed_by,
+                "triage_confirmed_at": incident.triage_confirmed_at.isoformat() if incident.triage_confirmed_at else None,
+                "triage_override_reason": incident.triage_override_reason,
+                "assigned_to_role": incident.assigned_to_role,
+                "assigned_to_user": incident.assigned_to_user,
+                "assigned_at": incident.assigned_at.isoformat() if incident.assigned_at else None,
                 "created_at": incident.created_at.isoformat() if incident.created_at else None,
                 "created_by": incident.created_by,
             })
@@ -157,5 +208,175 @@ def export_data():
         db.close()
 
 
+def _table_statement(name: str):
+    table = EXPORT_TABLES[name]
+    if name == "prompt_versions":
+        # Resolve blob-backed prompt text so each row is self-contained.
+        blobs = ContentBlob.__table__
+        return (
+            select(table, blobs.c.codec.label("_blob_codec"), blobs.c.data.label("_blob_data"))
+            .outerjoin(blobs, blobs.c.content_hash == table.c.content_blob_hash)
+            .order_by(table.c.id)
+        )
+    return select(table).order_by(table.c.id)
+
+
+def _export_row(row) -> dict:
+    record = dict(row)
+    codec = record.pop("_blob_codec", None)
+    data = record.pop("_blob_data", None)
+    if record.get("prompt_text") is None and data is not None:
+        record["prompt_text"] = decompress_text(codec, data)
+    return record
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+
+def _write_ndjson(batches, path: Path) -> tuple[int, str]:
+    rows = 0
+    digest = hashlib.sha256()
+    with open(path, "wb") as handle:
+        for batch in batches:
+            chunk = "".join(
+                json.dumps(_export_row(row), default=_json_default) + "\n" for row in batch
+            ).encode("utf-8")
+            handle.write(chunk)
+            digest.update(chunk)
+            rows += len(batch)
+    return rows, digest.hexdigest()
+
+
+def _arrow_type(column):
+    import pyarrow as pa
+
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us")
+    return pa.string()
+
+
+def _write_parquet(name: str, batches, path: Path) -> tuple[int, str]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)") from exc
+
+    table = EXPORT_TABLES[name]
+    columns = list(table.columns)
+    schema = pa.schema([(column.name, _arrow_type(column)) for column in columns])
+    json_columns = {column.name for column in columns if isinstance(column.type, JSON)}
+
+    def cell(column_name, value):
+        if value is None:
+            return None
+        if column_name in json_columns:
+            return json.dumps(value, default=_json_default)
+        if isinstance(value, enum.Enum):
+            return value.value
+        if schema.field(column_name).type == pa.string() and not isinstance(value, str):
+            return str(value)
+        return value
+
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for batch in batches:
+            records = [_export_row(row) for row in batch]
+            writer.write_table(
+                pa.Table.from_pydict(
+                    {
+                        column.name: [cell(column.name, record.get(column.name)) for record in records]
+                        for column in columns
+                    },
+                    schema=schema,
+                )
+            )
+            rows += len(records)
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return rows, digest.hexdigest()
+
+
+def _export_table(name: str, output_dir: Path, fmt: str, batch_size: int, snapshot_id: str | None) -> dict:
+    """Stream one table to disk on its own connection, inside the shared snapshot."""
+    with engine.connect() as conn:
+        if snapshot_id:
+            conn = conn.execution_options(isolation_level="REPEATABLE READ")
+            conn.execute(text("SET TRANSACTION READ ONLY"))
+            conn.execute(text("SET TRANSACTION SNAPSHOT :snapshot_id"), {"snapshot_id": snapshot_id})
+
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+            _table_statement(name)
+        )
+        batches = result.mappings().partitions()
+        path = output_dir / f"{name}.{fmt}"
+        if fmt == "parquet":
+            rows, checksum = _write_parquet(name, batches, path)
+        else:
+            rows, checksum = _write_ndjson(batches, path)
+
+    print(f"  {name}: {rows} records", file=sys.stderr)
+    return {"file": path.name, "rows": rows, "sha256": checksum, "bytes": path.stat().st_size}
+
+
+def export_streaming(output_dir: Path, fmt: str = "ndjson", workers: int = 4, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Write one file per table plus a manifest, with constant memory per table."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    exported_at = datetime.now(timezone.utc).isoformat()
+
+    # The coordinating transaction holds the exported snapshot open until every worker is done.
+    with engine.connect() as coordinator:
+        snapshot_id = None
+        if coordinator.dialect.name == "postgresql":
+            coordinator = coordinator.execution_options(isolation_level="REPEATABLE READ")
+            snapshot_id = coordinator.execute(text("SELECT pg_export_snapshot()")).scalar()
+        else:
+            workers = 1
+
+        print("Exported:", file=sys.stderr)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                name: pool.submit(_export_table, name, output_dir, fmt, batch_size, snapshot_id)
+                for name in EXPORT_TABLES
+            }
+            tables = {name: future.result() for name, future in futures.items()}
+
+    manifest = {
+        "exported_at": exported_at,
+        "format": fmt,
+        "snapshot_id": snapshot_id,
+        "tables": tables,
+    }
+    with open(output_dir / MANIFEST_FILE, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+    print(f"Manifest written to {output_dir / MANIFEST_FILE}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export local database data for migration to Azure.")
+    parser.add_argument("--output-dir", type=Path, help="Stream one file per table into this directory")
+    parser.add_argument("--format", choices=["ndjson", "parquet"], default="ndjson")
+    parser.add_argument("--workers", type=int, default=4, help="Tables exported in parallel")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.output_dir:
+        export_streaming(args.output_dir, args.format, args.workers, args.batch_size)
+    else:
+        export_data()
+
+
 if __name__ == "__main__":
-    export_data()
+    main()
@@ -1,11 +1,30 @@
 #!/usr/bin/env python
-"""Import data to Azure via API endpoints."""
+"""Import data to Azure via API endpoints.
 
+Usage:
+    python import_to_azure.py <data.json | export_dir> [--base-url URL] [--token TOKEN]
+                              [--concurrency N] [--checkpoint FILE] [--dry-run]
+
+Accepts the single JSON document or the per-table export directory written
+by ``export_local_data.py``. Stages run in dependency order (systems,
+templates and sources -> change requests -> versions -> incidents); records
+within a stage are posted concurrently. Every created record's old ID ->
+new ID mapping is saved to the checkpoint file, so an interrupted run picks
+up where it stopped. To try it locally, run ``AUTH_MODE=mock uvicorn
+main:app`` and pass ``--base-url http://127.0.0.1:8000``.
+"""
+
+import argparse
+import asyncio
 import json
+import os
 import sys
-import httpx
+import time
+from collections import defaultdict
 from pathlib import Path
 
+import httpx
+
 
 AZURE_BASE_URL = "https://ai-grc-api-dev-h7dchcdad7c6bmdh.switzerlandnorth-01.azurewebsites.net"
 HEADERS = {
@@ -14,12 +33,293 @@ HEADERS = {
     "x-user-id": "migration-script",  # For audit logs
 }
 
+DEFAULT_CONCURRENCY = 16
+BULK_INCIDENT_BATCH_SIZE = 1000
+MAX_ATTEMPTS = 4
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+CHECKPOINT_FLUSH_SECONDS = 2.0
 
-def import_data(data_file: str, dry_run: bool = False):
-    """Import data to Azure via API."""
 
-    with open(data_file, 'r') as f:
-        data = json.load(f)
+def load_data(source: str) -> dict[str, list[dict]]:
+    """Load the legacy JSON document or an export directory's NDJSON files."""
+    path = Path(source)
+    if path.is_file():
+        with open(path, "r") as f:
+            return json.load(f)
+
+    manifest = json.loads((path / "manifest.json").read_text())
+    if manifest["format"] != "ndjson":
+        raise SystemExit("Only NDJSON exports can be imported")
+    data = {}
+    for table, entry in manifest["tables"].items():
+        with open(path / entry["file"], "r", encoding="utf-8") as f:
+            data[table] = [json.loads(line) for line in f if line.strip()]
+    return data
+
+
+class Checkpoint:
+    """Old ID -> new ID map per table, persisted atomically to a JSON file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.id_map: dict[str, dict[str, str]] = defaultdict(dict)
+        if path.exists():
+            for table, mapping in json.loads(path.read_text()).get("id_map", {}).items():
+                self.id_map[table].update(mapping)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def get(self, table: str, old_id) -> str | None:
+        return self.id_map[table].get(str(old_id))
+
+    def record(self, table: str, old_id, new_id: str) -> None:
+        self.id_map[table][str(old_id)] = new_id
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= CHECKPOINT_FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"id_map": self.id_map}))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+
+class Importer:
+    def __init__(self, client: httpx.AsyncClient, checkpoint: Checkpoint, concurrency: int):
+        self.client = client
+        self.checkpoint = checkpoint
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.results = defaultdict(lambda: {"success": 0, "skipped": 0, "failed": 0})
+
+    async def _post(self, path: str, payload, headers: dict | None = None) -> httpx.Response:
+        """POST with bounded concurrency, retrying throttling and transient errors."""
+        async with self.semaphore:
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                try:
+                    response = await self.client.post(path, json=payload, headers=headers)
+                except httpx.TransportError:
+                    if attempt == MAX_ATTEMPTS:
+                        raise
+                else:
+                    if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_ATTEMPTS:
+                        return response
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+
+    async def _create(self, table: str, record: dict, path: str, payload: dict, headers=None) -> None:
+        if self.checkpoint.get(table, record["id"]):
+            self.results[table]["skipped"] += 1
+            return
+        try:
+            response = await self._post(path, payload, headers)
+            if response.status_code in [200, 201]:
+                self.checkpoint.record(table, record["id"], response.json()["id"])
+                self.results[table]["success"] += 1
+            else:
+                self.results[table]["failed"] += 1
+                print(f"  ✗ {table} {record['id']} - {response.status_code}: {response.text}")
+        except Exception as e:
+            self.results[table]["failed"] += 1
+            print(f"  ✗ {table} {record['id']} - {str(e)}")
+
+    def _parent(self, table: str, record: dict, key: str, parent_table: str) -> str | None:
+        new_id = self.checkpoint.get(parent_table, record[key])
+        if not new_id:
+            self.results[table]["failed"] += 1
+            print(f"  ✗ {table} {record['id']} - {parent_table} {record[key]} was not imported")
+        return new_id
+
+    async def ai_system(self, system: dict) -> None:
+        await self._create("ai_systems", system, "/ai-systems", {
+            "name": system["name"],
+            "business_purpose": system["business_purpose"],
+            "intended_users": system["intended_users"],
+            "risk_classification": system["risk_classification"],
+            "owner": system["owner"],
+            "created_by": system["created_by"],
+        })
+
+    async def prompt_template(self, template: dict) -> None:
+        await self._create("prompt_templates", template, "/prompts/templates", {
+            "name": template["name"],
+            "description": template["description"],
+        })
+
+    async def rag_source(self, source: dict) -> None:
+        await self._create("rag_sources", source, "/rag/sources", {
+            "name": source["name"],
+            "description": source["description"],
+            "source_type": source["source_type"],
+        })
+
+    async def change_request(self, cr: dict) -> None:
+        system_id = self._parent("change_requests", cr, "ai_system_id", "ai_systems")
+        if not system_id:
+            return
+        await self._create("change_requests", cr, f"/ai-systems/{system_id}/changes", {
+            "change_type": cr["change_type"],
+            "description": cr["description"],
+            "contains_personal_data": cr.get("contains_personal_data", False),
+            "business_justification": cr["business_justification"],
+            "impact_assessment": cr["impact_assessment"],
+            "rollback_plan": cr["rollback_plan"],
+            "requested_by": cr["requested_by"],
+        })
+
+    async def prompt_versions(self, versions: list[dict]) -> None:
+        # Version numbers are assigned by the server, so one template's versions go in order.
+        for version in sorted(versions, key=lambda v: v["version"]):
+            template_id = self._parent("prompt_versions", version, "prompt_template_id", "prompt_templates")
+            if not template_id:
+                continue
+            await self._create(
+                "prompt_versions",
+                version,
+                f"/prompts/templates/{template_id}/versions",
+                {"prompt_text": version["prompt_text"], "parameters_schema": version["parameters_schema"]},
+                headers={"Idempotency-Key": f"import-{version['id']}"},
+            )
+
+    async def rag_source_versions(self, versions: list[dict]) -> None:
+        for version in sorted(versions, key=lambda v: v["version"]):
+            source_id = self._parent("rag_source_versions", version, "rag_source_id", "rag_sources")
+            if not source_id:
+                continue
+            await self._create(
+                "rag_source_versions",
+                version,
+                f"/rag/sources/{source_id}/versions",
+                {
+                    "uri": version["uri"],
+                    "ingestion_config": version["ingestion_config"],
+                    "embedding_config": version["embedding_config"],
+                },
+                headers={"Idempotency-Key": f"import-{version['id']}"},
+            )
+
+    @staticmethod
+    def _incident_payload(incident: dict) -> dict:
+        return {
+            "incident_type": incident["incident_type"],
+            "severity": incident["severity"],
+            "impact_area": incident["impact_area"],
+            "description": incident["description"],
+            "contains_personal_data": incident.get("contains_personal_data", False),
+        }
+
+    async def incident(self, incident: dict) -> None:
+        system_id = self._parent("incidents", incident, "ai_system_id", "ai_systems")
+        if not system_id:
+            return
+        await self._create(
+            "incidents", incident, f"/incidents/ai-systems/{system_id}/incidents",
+            self._incident_payload(incident),
+        )
+
+    async def incident_batch(self, incidents: list[dict]) -> bool:
+        """Post a batch to ``/incidents/bulk``; returns False if the server lacks it."""
+        pending = []
+        for incident in incidents:
+            if self.checkpoint.get("incidents", incident["id"]):
+                self.results["incidents"]["skipped"] += 1
+                continue
+            system_id = self._parent("incidents", incident, "ai_system_id", "ai_systems")
+            if system_id:
+                pending.append((incident, {**self._incident_payload(incident), "ai_system_id": system_id}))
+        if not pending:
+            return True
+
+        try:
+            response = await self._post("/incidents/bulk", [payload for _, payload in pending])
+        except Exception as e:
+            self.results["incidents"]["failed"] += len(pending)
+            print(f"  ✗ incidents bulk batch - {str(e)}")
+            return True
+        if response.status_code in (404, 405):
+            return False
+        if response.status_code not in [200, 201]:
+            self.results["incidents"]["failed"] += len(pending)
+            print(f"  ✗ incidents bulk batch - {response.status_code}: {response.text}")
+            return True
+
+        for result in response.json()["results"]:
+            incident = pending[result["index"]][0]
+            if result["status"] == "created":
+                self.checkpoint.record("incidents", incident["id"], result["incident_id"])
+                self.results["incidents"]["success"] += 1
+            else:
+                self.results["incidents"]["failed"] += 1
+                print(f"  ✗ incidents {incident['id']} - {result.get('error')}")
+        return True
+
+    async def incidents(self, incidents: list[dict]) -> None:
+        batches = [
+            incidents[start:start + BULK_INCIDENT_BATCH_SIZE]
+            for start in range(0, len(incidents), BULK_INCIDENT_BATCH_SIZE)
+        ]
+        if batches and not await self.incident_batch(batches[0]):
+            print("  Bulk endpoint unavailable; posting incidents one at a time")
+            await asyncio.gather(*(self.incident(incident) for incident in incidents))
+            return
+        await asyncio.gather(*(self.incident_batch(batch) for batch in batches[1:]))
+
+
+def _group_by(records: list[dict], key: str) -> list[list[dict]]:
+    groups = defaultdict(list)
+    for record in records:
+        groups[record[key]].append(record)
+    return list(groups.values())
+
+
+async def run_import(data: dict, base_url: str, token: str | None, concurrency: int, checkpoint: Checkpoint):
+    headers = dict(HEADERS)
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, headers=headers, timeout=60.0, follow_redirects=True, limits=limits
+    ) as client:
+        importer = Importer(client, checkpoint, concurrency)
+        stages = [
+            ("AI Systems, Prompt Templates, RAG Sources", [
+                *(importer.ai_system(system) for system in data.get("ai_systems", [])),
+                *(importer.prompt_template(template) for template in data.get("prompt_templates", [])),
+                *(importer.rag_source(source) for source in data.get("rag_sources", [])),
+            ]),
+            ("Change Requests", [
+                importer.change_request(cr) for cr in data.get("change_requests", [])
+            ]),
+            ("Prompt and RAG Versions", [
+                *(importer.prompt_versions(group)
+                  for group in _group_by(data.get("prompt_versions", []), "prompt_template_id")),
+                *(importer.rag_source_versions(group)
+                  for group in _group_by(data.get("rag_source_versions", []), "rag_source_id")),
+            ]),
+            ("Incidents", [importer.incidents(data.get("incidents", []))]),
+        ]
+
+        try:
+            for title, tasks in stages:
+                print(f"\n=== Importing {title} ===")
+                started = time.perf_counter()
+                await asyncio.gather(*tasks)
+                checkpoint.flush()
+                print(f"  done in {time.perf_counter() - started:.1f}s")
+        finally:
+            checkpoint.flush()
+
+    return importer.results
+
+
+def import_data(data_source: str, base_url: str = AZURE_BASE_URL, token: str | None = None,
+                concurrency: int = DEFAULT_CONCURRENCY, checkpoint_file: str | None = None,
+                dry_run: bool = False):
+    """Import data to Azure via API."""
+    data = load_data(data_source)
 
     print(f"{'[DRY RUN] ' if dry_run else ''}Starting import...")
     print(f"Data to import:")
@@ -30,153 +330,32 @@ def import_data(data_file: str, dry_run: bool = False):
         print("\nDry run - no actual API calls will be made.")
         return
 
-    client = httpx.Client(timeout=30.0, follow_redirects=True)
-    results = {
-        "ai_systems": {"success": 0, "failed": 0},
-        "change_requests": {"success": 0, "failed": 0},
-        "prompt_templates": {"success": 0, "failed": 0},
-        "prompt_versions": {"success": 0, "failed": 0},
-        "rag_sources": {"success": 0, "failed": 0},
-        "rag_source_versions": {"success": 0, "failed": 0},
-        "incidents": {"success": 0, "failed": 0},
-    }
-
-    try:
-        # 1. Import AI Systems first (base dependency)
-        print("\n=== Importing AI Systems ===")
-        for system in data["ai_systems"]:
-            try:
-                # Remove fields that shouldn't be in POST
-                post_data = {
-                    "name": system["name"],
-                    "business_purpose": system["business_purpose"],
-                    "intended_users": system["intended_users"],
-                    "risk_classification": system["risk_classification"],
-                    "owner": system["owner"],
-                    "created_by": system["created_by"],
-                }
-
-                response = client.post(
-                    f"{AZURE_BASE_URL}/ai-systems",
-                    json=post_data,
-                    headers=HEADERS
-                )
-
-                if response.status_code in [200, 201]:
-                    results["ai_systems"]["success"] += 1
-                    print(f"  ✓ Created: {system['name']}")
-                else:
-                    results["ai_systems"]["failed"] += 1
-                    print(f"  ✗ Failed: {system['name']} - {response.status_code}: {response.text}")
-
-            except Exception as e:
-                results["ai_systems"]["failed"] += 1
-                print(f"  ✗ Error: {system['name']} - {str(e)}")
-
-        # 2. Import Change Requests (depends on AI Systems)
-        print("\n=== Importing Change Requests ===")
-        for cr in data["change_requests"]:
-            try:
-                post_data = {
-                    "change_type": cr["change_type"],
-                    "description": cr["description"],
-                    "business_justification": cr["business_justification"],
-                    "impact_assessment": cr["impact_assessment"],
-                    "rollback_plan": cr["rollback_plan"],
-                    "requested_by": cr["requested_by"],
-                }
-
-                response = client.post(
-                    f"{AZURE_BASE_URL}/ai-systems/{cr['ai_system_id']}/changes",
-                    json=post_data,
-                    headers=HEADERS
-                )
-
-                if response.status_code in [200, 201]:
-                    results["change_requests"]["success"] += 1
-                    print(f"  ✓ Created change request")
-                else:
-                    results["change_requests"]["failed"] += 1
-                    print(f"  ✗ Failed - {response.status_code}: {response.text}")
-
-            except Exception as e:
-                results["change_requests"]["failed"] += 1
-                print(f"  ✗ Error - {str(e)}")
-
-        # 3. Import Prompt Templates
-        print("\n=== Importing Prompt Templates ===")
-        for template in data["prompt_templates"]:
-            try:
-                post_data = {
-                    "name": template["name"],
-                    "description": template["description"],
-                }
-
-                response = client.post(
-                    f"{AZURE_BASE_URL}/prompts/templates",
-                    json=post_data,
-                    headers=HEADERS
-                )
-
-                if response.status_code in [200, 201]:
-                    results["prompt_templates"]["success"] += 1
-                    print(f"  ✓ Created: {template['name']}")
-                else:
-                    results["prompt_templates"]["failed"] += 1
-                    print(f"  ✗ Failed: {template['name']} - {response.status_code}: {response.text}")
-
-            except Exception as e:
-                results["prompt_templates"]["failed"] += 1
-                print(f"  ✗ Error: {template['name']} - {str(e)}")
-
-        # 4. Import RAG Sources
-        print("\n=== Importing RAG Sources ===")
-        for source in data["rag_sources"]:
-            try:
-                post_data = {
-                    "name": source["name"],
-                    "description": source["description"],
-                    "source_type": source["source_type"],
-                }
-
-                response = client.post(
-                    f"{AZURE_BASE_URL}/rag/sources",
-                    json=post_data,
-                    headers=HEADERS
-                )
-
-                if response.status_code in [200, 201]:
-                    results["rag_sources"]["success"] += 1
-                    print(f"  ✓ Created: {source['name']}")
-                else:
-                    results["rag_sources"]["failed"] += 1
-                    print(f"  ✗ Failed: {source['name']} - {response.status_code}: {response.text}")
-
-            except Exception as e:
-                results["rag_sources"]["failed"] += 1
-                print(f"  ✗ Error: {source['name']} - {str(e)}")
-
-        # Print summary
-        print("\n" + "="*50)
-        print("IMPORT SUMMARY")
-        print("="*50)
-        for entity, stats in results.items():
-            total = stats["success"] + stats["failed"]
-            if total > 0:
-                print(f"{entity}:")
-                print(f"  ✓ Success: {stats['success']}/{total}")
-                print(f"  ✗ Failed:  {stats['failed']}/{total}")
+    checkpoint = Checkpoint(Path(checkpoint_file or f"{Path(data_source).name}.checkpoint.json"))
+    results = asyncio.run(run_import(data, base_url, token, concurrency, checkpoint))
 
-    finally:
-        client.close()
+    # Print summary
+    print("\n" + "="*50)
+    print("IMPORT SUMMARY")
+    print("="*50)
+    for entity, stats in results.items():
+        total = stats["success"] + stats["skipped"] + stats["failed"]
+        if total > 0:
+            print(f"{entity}:")
+            print(f"  ✓ Success: {stats['success']}/{total}")
+            print(f"  ↷ Skipped (already imported): {stats['skipped']}/{total}")
+            print(f"  ✗ Failed:  {stats['failed']}/{total}")
+    print(f"Checkpoint: {checkpoint.path}")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python import_to_azure.py <data.json> [--dry-run]")
-        sys.exit(1)
-
-    data_file = sys.argv[1]
-    dry_run = "--dry-run" in sys.argv
+    parser = argparse.ArgumentParser(description="Import exported data via the API.")
+    parser.add_argument("data", help="Export JSON file or export directory")
+    parser.add_argument("--base-url", default=os.getenv("IMPORT_BASE_URL", AZURE_BASE_URL))
+    parser.add_argument("--token", default=os.getenv("IMPORT_TOKEN"), help="Bearer token for the target API")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <data>.checkpoint.json)")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
 
-    import_data(data_file, dry_run)
+    import_data(args.data, args.base_url, args.token, args.concurrency, args.checkpoint, args.dry_run)
+    sys.exit(0)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""Standalone migration job: bring the database schema to head and exit.
+
+Usage:
+    python scripts/migrate.py [--check]
+
+Run once per deploy (a release job, init container or CI step) before the
+web workers start, and start the workers with ``MIGRATION_MODE=check`` so
+they only compare ``alembic_version`` against the shipped heads. Concurrent
+runs are safe: the upgrade is serialized by a PostgreSQL advisory lock.
+Waiters poll ``pg_try_advisory_lock`` rather than block in
+``pg_advisory_lock``, because a blocked waiter holds a snapshot and the
+migrations' ``CREATE INDEX CONCURRENTLY`` steps wait for every older
+snapshot; a blocking wait would hang both sides indefinitely. For the same
+reason, do not keep a transaction open against the database while a
+migration that builds indexes concurrently is running.
+
+--check verifies without upgrading and exits 1 if the schema is behind.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv(Path(__file__).parent.parent / ".env")
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.schema_migrations import SchemaOutOfDate, ensure_schema_current
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="verify only; exit 1 if behind")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    try:
+        outcome = ensure_schema_current("check" if args.check else "auto")
+    except SchemaOutOfDate as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(f"Schema {outcome}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
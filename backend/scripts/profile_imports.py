@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Summarize ``python -X importtime`` for importing the app.
+
+Usage:
+    python scripts/profile_imports.py [--module main] [--top N] [--raw PATH]
+
+Imports the module in a fresh interpreter with ``-X importtime`` and prints
+the total import time, the slowest modules by cumulative time, and self
+time summed per top-level package (fastapi, sqlalchemy, jose, ...), which
+is where an eager third-party import shows up. ``--raw`` also saves the
+unprocessed importtime log, e.g. for tuna or a later diff.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def _collect(module: str) -> tuple[list[tuple[int, int, int, str]], str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{result.stderr}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            # importtime indents nested imports by two spaces per level.
+            depth = (len(indent) - 1) // 2
+            entries.append((int(self_us), int(cumulative_us), depth, name))
+    return entries, result.stderr
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--raw", type=Path, help="also write the raw importtime log here")
+    args = parser.parse_args()
+
+    entries, raw_log = _collect(args.module)
+    if args.raw:
+        args.raw.write_text(raw_log, encoding="utf-8")
+
+    total_us = sum(cumulative for _, cumulative, depth, _ in entries if depth == 0)
+    target_us = next((cumulative for _, cumulative, _, name in reversed(entries) if name == args.module), 0)
+    by_package = defaultdict(int)
+    for self_us, _, _, name in entries:
+        by_package[name.split(".")[0]] += self_us
+
+    print(
+        f"import {args.module}: {target_us / 1000:.1f} ms "
+        f"({total_us / 1000:.1f} ms including interpreter startup, {len(entries)} modules)\n"
+    )
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    for self_us, cumulative_us, _, name in sorted(entries, key=lambda e: e[1], reverse=True)[: args.top]:
+        print(f"{cumulative_us / 1000:14.1f}  {self_us / 1000:8.1f}  {name}")
+
+    print(f"\n{'self ms':>14}  package")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"{self_us / 1000:14.1f}  {package}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""Verify the audit log hash chain, one worker process per monthly partition.
+
+Usage:
+    python scripts/verify_audit_chain.py [--from YYYY-MM] [--to YYYY-MM]
+                                         [--workers N] [--batch-size N]
+
+Each month is an independent chain, so months are checked in parallel.
+Within a month rows are streamed in ``chain_seq`` order with a server-side
+cursor and every link is recomputed. Exits 1 and prints the first broken
+link (earliest month, lowest sequence) if any check fails.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv(Path(__file__).parent.parent / ".env")
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select
+
+from database import engine
+from models import AuditLog
+from services.audit_chain import CHAINED_FIELDS, GENESIS_HASH, chain_month, compute_entry_hash
+
+DEFAULT_BATCH_SIZE = 50_000
+
+
+def _init_worker() -> None:
+    # Connections inherited from the parent must not be shared across processes.
+    engine.dispose(close=False)
+
+
+def verify_month(args: tuple[datetime, int]) -> dict:
+    """Walk one month's chain and stop at its first broken link."""
+    month_start, batch_size = args
+    month_start, month_end = chain_month(month_start)
+    columns = [getattr(AuditLog, name) for name in CHAINED_FIELDS]
+    statement = (
+        select(*columns, AuditLog.chain_seq, AuditLog.prev_hash, AuditLog.entry_hash)
+        .where(
+            AuditLog.timestamp >= month_start,
+            AuditLog.timestamp < month_end,
+            AuditLog.chain_seq.isnot(None),
+        )
+        .order_by(AuditLog.chain_seq)
+    )
+
+    result = {"month": f"{month_start:%Y-%m}", "rows": 0, "head": None, "broken": None}
+    expected_seq, prev_hash = 1, GENESIS_HASH
+    with engine.connect() as conn:
+        rows = conn.execution_options(stream_results=True, yield_per=batch_size).execute(statement)
+        for row in rows:
+            reason = None
+            if row.chain_seq != expected_seq:
+                reason = f"expected chain_seq {expected_seq}, found {row.chain_seq}"
+            elif row.prev_hash != prev_hash:
+                reason = "prev_hash does not match the preceding entry"
+            elif compute_entry_hash(row, prev_hash) != row.entry_hash:
+                reason = "entry_hash does not match the row contents"
+
+            if reason:
+                result["broken"] = {"chain_seq": row.chain_seq, "id": str(row.id), "reason": reason}
+                break
+
+            result["rows"] += 1
+            expected_seq, prev_hash = expected_seq + 1, row.entry_hash
+
+    result["head"] = prev_hash if result["rows"] else None
+    return result
+
+
+def _parse_month(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m")
+
+
+def _months(start: datetime, end: datetime) -> list[datetime]:
+    months = []
+    current = chain_month(start)[0]
+    while current <= end:
+        months.append(current)
+        current = chain_month(current)[1]
+    return months
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--from", dest="month_from", type=_parse_month, help="First month (YYYY-MM)")
+    parser.add_argument("--to", dest="month_to", type=_parse_month, help="Last month (YYYY-MM)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        first, last = conn.execute(
+            select(func.min(AuditLog.timestamp), func.max(AuditLog.timestamp))
+            .where(AuditLog.chain_seq.isnot(None))
+        ).one()
+    if first is None:
+        print("No chained audit log entries found.")
+        return 0
+
+    months = _months(args.month_from or first, args.month_to or last)
+    started = time.perf_counter()
+    with multiprocessing.Pool(min(args.workers, len(months)), initializer=_init_worker) as pool:
+        results = pool.map(verify_month, [(month, args.batch_size) for month in months], chunksize=1)
+    elapsed = time.perf_counter() - started
+
+    total = 0
+    first_break = None
+    for result in results:
+        total += result["rows"]
+        status = "BROKEN" if result["broken"] else "ok"
+        print(f"{result['month']}  {result['rows']:>12,} rows  {status:<6}  head={result['head'] or '-'}")
+        if result["broken"] and first_break is None:
+            first_break = result
+
+    print(f"Verified {total:,} entries across {len(months)} month(s) in {elapsed:.1f}s")
+    if first_break:
+        broken = first_break["broken"]
+        print(
+            f"First broken link: month {first_break['month']}, chain_seq {broken['chain_seq']}, "
+            f"id {broken['id']}: {broken['reason']}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,23 @@
+from collections import OrderedDict
 from dataclasses import dataclass
+import hashlib
 import os
+import threading
+import time
 from typing import Iterable
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer
-from jose import jwt
 
 from audit import log_security_event
+from security.jwks import decode_verified_token, jwks_cache
 from security.roles import Role
 
 security = HTTPBearer(auto_error=False)
 
+AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", "1024"))
+AUTH_USER_CACHE_TTL_SECONDS = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+
 APP_ROLE_MAP = {
     "auditor": Role.AUDITOR,
     "compliance": Role.COMPLIANCE,
@@ -39,11 +46,115 @@ def _map_roles(role_values: Iterable[str]) -> list[Role]:
     return mapped
 
 
+class _UserCache:
+    """Bounded LRU of parsed users keyed by token digest.
+
+    Entries expire after ``ttl`` seconds or at the token's ``exp`` claim,
+    whichever comes first, so a cached user never outlives its token.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> User | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user
+
+    def put(self, key: str, user: User, token_exp=None) -> None:
+        if self.max_size <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        if isinstance(token_exp, (int, float)):
+            expires_at = min(expires_at, token_exp)
+        with self._lock:
+            self._entries[key] = (expires_at, user)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_user_cache = _UserCache(AUTH_USER_CACHE_SIZE, AUTH_USER_CACHE_TTL_SECONDS)
+
+# Counts credential resolutions and actual JWT decodes (user cache misses).
+# FastAPI caches dependencies per request, so resolutions should equal
+# authenticated requests.
+_auth_counters = {"resolutions": 0, "token_decodes": 0}
+_auth_counters_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    with _auth_counters_lock:
+        _auth_counters[name] += 1
+
+
+def auth_metrics() -> dict:
+    with _auth_counters_lock:
+        return {**_auth_counters, "user_cache_size": len(_user_cache._entries)}
+
+
+def _parse_user(token_str: str) -> User:
+    cache_key = _user_cache.key(token_str)
+    user = _user_cache.get(cache_key)
+    if user is not None:
+        return user
+
+    _count("token_decodes")
+    if jwks_cache.configured:
+        payload = decode_verified_token(token_str)
+    elif _mock_mode():
+        # Local development without a JWKS source: trust the claims as-is.
+        from jose import jwt
+
+        payload = jwt.get_unverified_claims(token_str)
+    else:
+        raise RuntimeError("No JWKS source configured for token verification")
+    roles = payload.get("roles", [])
+    user_id = payload.get("oid")
+    username = payload.get("preferred_username") or payload.get("name") or user_id or "unknown"
+    user = User(user_id=user_id, username=username, mapped_roles=_map_roles(roles))
+    _user_cache.put(cache_key, user, payload.get("exp"))
+    return user
+
+
+def _mock_mode() -> bool:
+    return os.getenv("AUTH_MODE", "").lower() == "mock"
+
+
 def _mock_user() -> User:
     return User(user_id="local-user", username="local-user", mapped_roles=[Role.ADMIN])
 
 
 def get_current_user(request: Request, token=Depends(security)):
+    """Resolve the request's principal.
+
+    Role checks and handlers share this dependency, and FastAPI's
+    per-request dependency cache runs it once per request.
+    """
+    user = _resolve_user(request, token)
+    _count("resolutions")
+    return user
+
+
+def _resolve_user(request: Request, token) -> User:
     try:
         # Layer 1: Check for Easy Auth token (when App Service authentication is enabled)
         easyauth_token = request.headers.get("X-MS-TOKEN-AAD-ID-TOKEN")
@@ -59,19 +170,15 @@ def get_current_user(request: Request, token=Depends(security)):
 
         # Layer 2: Handle missing token
         if not token_str:
-            if os.getenv("AUTH_MODE", "").lower() == "mock":
+            if _mock_mode():
                 return _mock_user()
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Authentication token is missing",
             )
 
-        # Layer 3: Validate token and extract claims
-        payload = jwt.get_unverified_claims(token_str)
-        roles = payload.get("roles", [])
-        user_id = payload.get("oid")
-        username = payload.get("preferred_username") or payload.get("name") or user_id or "unknown"
-        user = User(user_id=user_id, username=username, mapped_roles=_map_roles(roles))
+        # Layer 3: Validate token and extract claims (cached per token)
+        user = _parse_user(token_str)
         log_security_event(user.user_id, "login_success")
         return user
     except Exception:
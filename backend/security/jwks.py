@@ -0,0 +1,156 @@
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+AZURE_TENANT_ID = os.getenv("AZURE_TENANT_ID")
+AUTH_JWKS_URL = os.getenv("AUTH_JWKS_URL") or (
+    f"https://login.microsoftonline.com/{AZURE_TENANT_ID}/discovery/v2.0/keys"
+    if AZURE_TENANT_ID
+    else None
+)
+# A local JWKS document takes precedence over the URL (offline and test setups).
+AUTH_JWKS_FILE = os.getenv("AUTH_JWKS_FILE")
+AUTH_JWKS_TTL_SECONDS = float(os.getenv("AUTH_JWKS_TTL_SECONDS", "3600"))
+AUTH_JWKS_MIN_REFRESH_SECONDS = float(os.getenv("AUTH_JWKS_MIN_REFRESH_SECONDS", "60"))
+AUTH_JWT_ALGORITHMS = [
+    alg.strip() for alg in os.getenv("AUTH_JWT_ALGORITHMS", "RS256").split(",") if alg.strip()
+]
+AUTH_JWT_AUDIENCE = os.getenv("AUTH_JWT_AUDIENCE")
+AUTH_JWT_ISSUER = os.getenv("AUTH_JWT_ISSUER")
+
+
+class JWKSCache:
+    """Signing keys from a JWKS document, parsed once and held in memory.
+
+    Keys are refreshed by a daemon thread every ``ttl`` seconds; a failed
+    refresh keeps the previous keys. A token signed with an unknown ``kid``
+    triggers a synchronous refresh (at most once per ``min_refresh_interval``)
+    so key rotation is picked up without waiting for the next cycle.
+    """
+
+    def __init__(
+        self,
+        url: str | None = AUTH_JWKS_URL,
+        path: str | None = AUTH_JWKS_FILE,
+        ttl: float = AUTH_JWKS_TTL_SECONDS,
+        min_refresh_interval: float = AUTH_JWKS_MIN_REFRESH_SECONDS,
+    ):
+        self.url = url
+        self.path = path
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+
+        self._keys: dict = {}
+        self._loaded_at: float | None = None
+        self._last_attempt = 0.0
+        self._refresh_lock = threading.Lock()
+        self._refresher: threading.Thread | None = None
+
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.path or self.url)
+
+    def _fetch(self) -> list[dict]:
+        if self.path:
+            with open(self.path, encoding="utf-8") as handle:
+                document = json.load(handle)
+        else:
+            import httpx
+
+            response = httpx.get(self.url, timeout=5.0)
+            response.raise_for_status()
+            document = response.json()
+        return document.get("keys", [])
+
+    def refresh(self) -> None:
+        from jose import jwk
+        from jose.exceptions import JWKError
+
+        self._last_attempt = time.monotonic()
+        keys = {}
+        for key_data in self._fetch():
+            if key_data.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[key_data.get("kid")] = jwk.construct(
+                    key_data, key_data.get("alg") or AUTH_JWT_ALGORITHMS[0]
+                )
+            except JWKError:
+                logger.warning("Skipping unsupported JWKS key %s", key_data.get("kid"))
+        self._keys = keys
+        self._loaded_at = time.monotonic()
+        self.refreshes += 1
+
+    def get_key(self, kid: str | None):
+        self._ensure_refresher()
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        with self._refresh_lock:
+            key = self._keys.get(kid)
+            due = time.monotonic() - self._last_attempt >= self.min_refresh_interval
+            if key is None and (self._loaded_at is None or due):
+                self.refresh()
+                key = self._keys.get(kid)
+        if key is None:
+            from jose.exceptions import JWTError
+
+            raise JWTError(f"No signing key found for kid {kid!r}")
+        return key
+
+    def _ensure_refresher(self) -> None:
+        if self._refresher is not None:
+            return
+        with self._refresh_lock:
+            if self._refresher is None:
+                self._refresher = threading.Thread(
+                    target=self._run, name="jwks-refresher", daemon=True
+                )
+                self._refresher.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.ttl)
+            try:
+                with self._refresh_lock:
+                    self.refresh()
+            except Exception:
+                self.refresh_failures += 1
+                logger.exception("JWKS refresh failed; keeping previously loaded keys")
+
+
+jwks_cache = JWKSCache()
+
+
+def decode_verified_token(token: str) -> dict:
+    """Verify the token's signature and expiry and return its claims.
+
+    Audience and issuer are checked only when configured. python-jose (and
+    the cryptography backend it loads) is imported on the first token, not
+    at app import.
+    """
+    from jose import jwt
+    from jose.exceptions import JWTError
+
+    header = jwt.get_unverified_header(token)
+    algorithm = header.get("alg")
+    if algorithm not in AUTH_JWT_ALGORITHMS:
+        raise JWTError(f"Unsupported token algorithm {algorithm!r}")
+
+    key = jwks_cache.get_key(header.get("kid"))
+    return jwt.decode(
+        token,
+        key,
+        algorithms=[algorithm],
+        audience=AUTH_JWT_AUDIENCE,
+        issuer=AUTH_JWT_ISSUER,
+        options={"verify_aud": bool(AUTH_JWT_AUDIENCE), "verify_at_hash": False},
+    )
@@ -0,0 +1,94 @@
+import hashlib
+import json
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from models import AuditLog
+
+GENESIS_HASH = "0" * 64
+
+# Fields covered by each entry's digest, in order.
+CHAINED_FIELDS = (
+    "id",
+    "timestamp",
+    "user_id",
+    "action",
+    "entity_type",
+    "entity_id",
+    "payload_hash",
+    "state_hash",
+    "audit_metadata",
+)
+
+
+def chain_month(timestamp: datetime) -> tuple[datetime, datetime]:
+    """Bounds of the monthly chain (and ``audit_logs`` partition) holding ``timestamp``."""
+    start = timestamp.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
+
+
+def compute_entry_hash(entry, prev_hash: str) -> str:
+    """SHA-256 over the previous link and a canonical encoding of the entry.
+
+    ``entry`` may be a dict (write path) or an ``AuditLog`` row (verification).
+    """
+    get = entry.get if isinstance(entry, dict) else lambda name: getattr(entry, name)
+    values = []
+    for name in CHAINED_FIELDS:
+        value = get(name)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif name == "id" and value is not None:
+            value = str(value)
+        values.append(value)
+
+    canonical = json.dumps(
+        [prev_hash, *values], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def link_entries(db: Session, entries: list[dict]) -> None:
+    """Assign ``chain_seq``, ``prev_hash`` and ``entry_hash`` to new entries.
+
+    Each calendar month is its own chain. On PostgreSQL a transaction-scoped
+    advisory lock serializes appends per month across workers, so the
+    caller must insert the entries and commit on the same session.
+    """
+    months: dict[datetime, list[dict]] = {}
+    for entry in entries:
+        months.setdefault(chain_month(entry["timestamp"])[0], []).append(entry)
+
+    is_postgres = db.get_bind().dialect.name == "postgresql"
+    for month_start in sorted(months):
+        month_start, month_end = chain_month(month_start)
+        if is_postgres:
+            db.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                {"key": f"audit_chain:{month_start:%Y-%m}"},
+            )
+
+        last = (
+            db.query(AuditLog.chain_seq, AuditLog.entry_hash)
+            .filter(
+                AuditLog.timestamp >= month_start,
+                AuditLog.timestamp < month_end,
+                AuditLog.chain_seq.isnot(None),
+            )
+            .order_by(AuditLog.chain_seq.desc())
+            .first()
+        )
+        seq, prev_hash = (last.chain_seq, last.entry_hash) if last else (0, GENESIS_HASH)
+
+        for entry in months[month_start]:
+            seq += 1
+            entry["chain_seq"] = seq
+            entry["prev_hash"] = prev_hash
+            entry["entry_hash"] = compute_entry_hash(entry, prev_hash)
+            prev_hash = entry["entry_hash"]
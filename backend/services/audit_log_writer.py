@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+
+from sqlalchemy import insert, text
+
+from database import SessionLocal
+from models import AuditLog, generate_uuid
+from services.audit_chain import link_entries
+
+logger = logging.getLogger(__name__)
+
+AUDIT_QUEUE_MAX_SIZE = int(os.getenv("AUDIT_QUEUE_MAX_SIZE", "10000"))
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "200"))
+AUDIT_FLUSH_INTERVAL_SECONDS = float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "1.0"))
+# What to do when the queue is full: "block" waits for room, "drop" discards
+# the entry and counts it, "sync" writes the entry inline.
+AUDIT_BACKPRESSURE = os.getenv("AUDIT_BACKPRESSURE", "block").lower()
+AUDIT_PARTITION_MONTHS_AHEAD = int(os.getenv("AUDIT_PARTITION_MONTHS_AHEAD", "3"))
+
+
+def ensure_audit_log_partitions(months_ahead: int = AUDIT_PARTITION_MONTHS_AHEAD) -> None:
+    """Create monthly ``audit_logs`` partitions from this month to ``months_ahead`` out.
+
+    Rows outside any monthly partition still land in ``audit_logs_default``;
+    this keeps them in prunable partitions instead.
+    """
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name != "postgresql":
+            return
+        db.execute(
+            text(
+                "SELECT create_audit_log_partition("
+                "(date_trunc('month', now()) + make_interval(months => m))::date) "
+                "FROM generate_series(0, :months_ahead) AS m"
+            ),
+            {"months_ahead": months_ahead},
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Audit log partition maintenance failed")
+    finally:
+        db.close()
+
+
+class AuditLogWriter:
+    """Buffers audit log rows in a bounded queue and batch-inserts them.
+
+    A background task flushes whenever ``batch_size`` rows are waiting or
+    ``flush_interval`` seconds have passed. Inserts run in a worker thread
+    so the event loop never blocks on the database. ``stop()`` drains the
+    queue before returning, so entries accepted before shutdown are written.
+    Each batch is appended to its month's hash chain in the same transaction
+    that inserts it.
+    """
+
+    def __init__(
+        self,
+        max_size: int = AUDIT_QUEUE_MAX_SIZE,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+        backpressure: str = AUDIT_BACKPRESSURE,
+    ):
+        if backpressure not in {"block", "drop", "sync"}:
+            raise ValueError(f"Unsupported audit backpressure policy: {backpressure}")
+
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure = backpressure
+
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._partitions_checked_for: tuple[int, int] | None = None
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flushes = 0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self._total_flush_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting work and flush everything still queued."""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, entry: dict) -> None:
+        entry.setdefault("id", generate_uuid())
+        entry.setdefault("timestamp", datetime.utcnow())
+
+        if not self.running:
+            await asyncio.to_thread(self._insert_batch, [entry])
+            return
+
+        try:
+            self._queue.put_nowait(entry)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.backpressure == "block":
+            await self._queue.put(entry)
+        elif self.backpressure == "sync":
+            await asyncio.to_thread(self._insert_batch, [entry])
+        else:
+            self.dropped += 1
+            logger.warning("Audit queue full; dropped entry for action %s", entry.get("action"))
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            await asyncio.to_thread(self._insert_batch, batch)
+
+        # Drain anything enqueued behind the stop marker.
+        remaining = []
+        while not self._queue.empty():
+            entry = self._queue.get_nowait()
+            if entry is not None:
+                remaining.append(entry)
+        for start in range(0, len(remaining), self.batch_size):
+            await asyncio.to_thread(self._insert_batch, remaining[start:start + self.batch_size])
+
+    def _insert_batch(self, batch: list[dict]) -> None:
+        now = datetime.utcnow()
+        if self._partitions_checked_for != (now.year, now.month):
+            ensure_audit_log_partitions()
+            self._partitions_checked_for = (now.year, now.month)
+
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            link_entries(db, batch)
+            db.execute(insert(AuditLog), batch)
+            db.commit()
+            self.written += len(batch)
+        except Exception:
+            db.rollback()
+            self.failed += len(batch)
+            logger.exception("Audit log batch insert failed (%d entries)", len(batch))
+        finally:
+            db.close()
+
+        elapsed = time.perf_counter() - started
+        self.flushes += 1
+        self.last_flush_seconds = elapsed
+        self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+        self._total_flush_seconds += elapsed
+
+    def metrics(self) -> dict:
+        return {
+            "running": self.running,
+            "backpressure": self.backpressure,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_max_size": self.max_size,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "flushes": self.flushes,
+            "last_flush_ms": round(self.last_flush_seconds * 1000, 3),
+            "max_flush_ms": round(self.max_flush_seconds * 1000, 3),
+            "avg_flush_ms": (
+                round(self._total_flush_seconds / self.flushes * 1000, 3) if self.flushes else 0.0
+            ),
+        }
+
+
+audit_log_writer = AuditLogWriter()
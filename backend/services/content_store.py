@@ -0,0 +1,41 @@
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from models import ContentBlob
+from utils.content_codec import compress_text, content_hash
+
+
+class ContentStore:
+    """Content-addressed, compressed storage for version text.
+
+    ``put`` is idempotent: identical text maps to the same hash and is
+    stored once. Blobs are written on the caller's session so they commit
+    together with the version that references them.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def put(self, text: str) -> str:
+        digest = content_hash(text)
+        if self.db.get(ContentBlob, digest) is not None:
+            return digest
+
+        codec, data = compress_text(text)
+        values = {
+            "content_hash": digest,
+            "codec": codec,
+            "size": len(text.encode("utf-8")),
+            "data": data,
+        }
+        if self.db.get_bind().dialect.name == "postgresql":
+            # A concurrent writer may store the same text first.
+            self.db.execute(
+                pg_insert(ContentBlob).values(**values).on_conflict_do_nothing(
+                    index_elements=["content_hash"]
+                )
+            )
+        else:
+            self.db.add(ContentBlob(**values))
+            self.db.flush()
+        return digest
@@ -0,0 +1,252 @@
+import gzip
+import io
+import json
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import AsyncIterator, BinaryIO
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from database import get_engine
+from models import (
+    AIIncident,
+    AISystem,
+    AISystemPromptBinding,
+    AISystemRAGBinding,
+    ChangeRequest,
+    ContentBlob,
+    PromptTemplate,
+    PromptVersion,
+    RAGSource,
+    RAGSourceVersion,
+    RiskMetricsSnapshot,
+)
+from services.risk_snapshot_service import RiskSnapshotService
+
+SNAPSHOT_FORMAT = "ai-grc-snapshot"
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_COMPRESS_LEVEL = 6
+COPY_END_MARKER = b"\\.\n"
+SNAPSHOT_QUEUE_CHUNKS = 64
+# How often a writer blocked on a full queue checks whether the client left.
+SNAPSHOT_STOP_POLL_SECONDS = 0.5
+
+# Governance tables in foreign-key order. The risk snapshot is derived and
+# rebuilt after restore; audit logs stay with their environment.
+SNAPSHOT_TABLES = [
+    AISystem.__table__,
+    ChangeRequest.__table__,
+    PromptTemplate.__table__,
+    ContentBlob.__table__,
+    PromptVersion.__table__,
+    RAGSource.__table__,
+    RAGSourceVersion.__table__,
+    AISystemPromptBinding.__table__,
+    AISystemRAGBinding.__table__,
+    AIIncident.__table__,
+]
+TABLES_BY_NAME = {table.name: table for table in SNAPSHOT_TABLES}
+
+
+class SnapshotError(ValueError):
+    """The uploaded archive is malformed or does not match this schema."""
+
+
+def _quote_identifiers(names) -> str:
+    return ", ".join(f'"{name}"' for name in names)
+
+
+class _StreamClosed(Exception):
+    """The response stopped reading; the snapshot writer should give up."""
+
+
+class _QueueWriter(io.RawIOBase):
+    """Binary sink that hands compressed chunks to the streaming response.
+
+    ``put`` waits for queue space only while ``stopped`` is unset, so a
+    client that disconnects mid-download cannot leave the writer thread
+    blocked forever on a full queue.
+    """
+
+    def __init__(self, chunks: queue.Queue, stopped: threading.Event):
+        self.chunks = chunks
+        self.stopped = stopped
+
+    def writable(self) -> bool:
+        return True
+
+    def put(self, item) -> None:
+        while not self.stopped.is_set():
+            try:
+                self.chunks.put(item, timeout=SNAPSHOT_STOP_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+        raise _StreamClosed()
+
+    def write(self, data) -> int:
+        self.put(bytes(data))
+        return len(data)
+
+
+def _write_snapshot(sink: BinaryIO) -> None:
+    """COPY every table out of one REPEATABLE READ snapshot into a gzip stream.
+
+    The archive is a JSON header line, then for each table a JSON section
+    line followed by ``COPY ... TO STDOUT`` text rows and a ``\\.`` line.
+    """
+    raw = get_engine().raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+        cursor.execute("SELECT version_num FROM alembic_version")
+        schema_revision = cursor.fetchone()[0]
+
+        with gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=SNAPSHOT_COMPRESS_LEVEL) as archive:
+            header = {
+                "format": SNAPSHOT_FORMAT,
+                "version": SNAPSHOT_FORMAT_VERSION,
+                "schema_revision": schema_revision,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "tables": [table.name for table in SNAPSHOT_TABLES],
+            }
+            archive.write(json.dumps(header).encode("utf-8") + b"\n")
+            for table in SNAPSHOT_TABLES:
+                columns = [column.name for column in table.columns]
+                archive.write(json.dumps({"table": table.name, "columns": columns}).encode("utf-8") + b"\n")
+                cursor.copy_expert(
+                    f'COPY "{table.name}" ({_quote_identifiers(columns)}) TO STDOUT',
+                    archive,
+                )
+                archive.write(COPY_END_MARKER)
+        raw.rollback()
+    finally:
+        raw.close()
+
+
+async def stream_snapshot() -> AsyncIterator[bytes]:
+    """Yield the compressed archive while a worker thread produces it.
+
+    The bounded queue keeps memory flat: COPY blocks whenever the client
+    reads more slowly than the database writes. Closing the generator
+    early (``ClosingStreamingResponse`` does when the client disconnects)
+    tells the writer to stop; its COPY aborts and the connection is
+    released.
+    """
+    chunks: queue.Queue = queue.Queue(maxsize=SNAPSHOT_QUEUE_CHUNKS)
+    stopped = threading.Event()
+    writer = _QueueWriter(chunks, stopped)
+    done = object()
+
+    def produce():
+        try:
+            _write_snapshot(writer)
+            writer.put(done)
+        except _StreamClosed:
+            pass
+        except Exception as exc:
+            try:
+                writer.put(exc)
+            except _StreamClosed:
+                pass
+
+    threading.Thread(target=produce, name="snapshot-writer", daemon=True).start()
+    try:
+        while True:
+            chunk = await run_in_threadpool(chunks.get)
+            if chunk is done:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        stopped.set()
+
+
+class _SectionReader(io.RawIOBase):
+    """Reads one table's COPY rows from the archive, stopping at the ``\\.`` line."""
+
+    def __init__(self, archive):
+        self.archive = archive
+        self.finished = False
+        self.buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while not self.finished and (size < 0 or len(self.buffer) < size):
+            line = self.archive.readline()
+            if not line:
+                raise SnapshotError("Archive ended inside a table section")
+            if line == COPY_END_MARKER:
+                self.finished = True
+                break
+            self.buffer += line
+        if size < 0:
+            data, self.buffer = self.buffer, b""
+        else:
+            data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def readline(self, size: int = -1) -> bytes:
+        if self.finished:
+            return b""
+        line = self.archive.readline()
+        if line == COPY_END_MARKER:
+            self.finished = True
+            return b""
+        return line
+
+
+def restore_snapshot(db: Session, archive_file: BinaryIO) -> dict:
+    """Replace all governance tables with the archive's rows, keeping their IDs.
+
+    Runs in the session's transaction: tables are truncated, bulk-loaded
+    with ``COPY ... FROM STDIN`` and the risk snapshot rebuilt, then the
+    caller commits. Any error leaves the database untouched.
+    """
+    with gzip.GzipFile(fileobj=archive_file, mode="rb") as archive:
+        try:
+            header = json.loads(archive.readline())
+        except (json.JSONDecodeError, OSError, EOFError) as exc:
+            raise SnapshotError("Not a snapshot archive") from exc
+        if header.get("format") != SNAPSHOT_FORMAT or header.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise SnapshotError("Unsupported snapshot format")
+
+        current_revision = db.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        if header.get("schema_revision") != current_revision:
+            raise SnapshotError(
+                f"Snapshot schema {header.get('schema_revision')} does not match "
+                f"database schema {current_revision}"
+            )
+
+        cursor = db.connection().connection.cursor()
+        truncated = [RiskMetricsSnapshot.__table__.name, *TABLES_BY_NAME]
+        cursor.execute(f"TRUNCATE {_quote_identifiers(truncated)} CASCADE")
+
+        counts = {}
+        for line in iter(archive.readline, b""):
+            section = json.loads(line)
+            table = TABLES_BY_NAME.get(section.get("table"))
+            if table is None:
+                raise SnapshotError(f"Unknown table in snapshot: {section.get('table')}")
+            columns = section.get("columns") or []
+            unknown = set(columns) - {column.name for column in table.columns}
+            if unknown:
+                raise SnapshotError(f"Unknown columns for {table.name}: {sorted(unknown)}")
+
+            reader = _SectionReader(archive)
+            cursor.copy_expert(
+                f'COPY "{table.name}" ({_quote_identifiers(columns)}) FROM STDIN',
+                reader,
+            )
+            counts[table.name] = cursor.rowcount
+            if not reader.finished:
+                reader.read()
+
+    RiskSnapshotService(db).rebuild()
+    return {"schema_revision": current_revision, "snapshot_created_at": header.get("created_at"), "rows": counts}
@@ -1,37 +1,32 @@
-import ast
 from datetime import datetime, timedelta
-from pathlib import Path
 
-import yaml
 from sqlalchemy.orm import Session
 
 from models import AIIncident, AISystem
 from services.risk_metrics_service import RiskMetricsService
+from services.triage_rule_engine import (
+    compile_condition,
+    load_root_cause_map,
+    load_rule_set,
+)
 
 
 class IncidentTriageService:
     def __init__(self, db: Session):
         self.db = db
-        self.rules = self._load_rules()
-        self.root_cause_map = self._load_root_cause_map()
-
-    @staticmethod
-    def _rules_path() -> Path:
-        return Path(__file__).resolve().parent.parent / "triage" / "triage_rules.yaml"
-
-    def _load_rules(self) -> dict:
-        with self._rules_path().open("r", encoding="utf-8") as handle:
-            return yaml.safe_load(handle) or {}
-
-    def _load_root_cause_map(self) -> dict:
-        path = Path(__file__).resolve().parent.parent / "triage" / "root_cause_map.yaml"
-        with path.open("r", encoding="utf-8") as handle:
-            return yaml.safe_load(handle) or {}
+        # Process-wide, precompiled and reloaded only when the YAML files change.
+        self.rule_set = load_rule_set()
+        self.root_cause_map = load_root_cause_map()
 
     def suggest(self, incident: AIIncident) -> dict:
+        context = self.system_context(incident.ai_system_id)
+        return self.suggest_for_context(context, incident.incident_type)
+
+    def system_context(self, system_id: str) -> dict:
+        """Per-system triage inputs, shared by every incident of that system in a batch."""
         ai_system = (
             self.db.query(AISystem)
-            .filter(AISystem.id == incident.ai_system_id)
+            .filter(AISystem.id == system_id)
             .first()
         )
         risk = (
@@ -39,21 +34,25 @@ class IncidentTriageService:
             if ai_system
             else "low"
         )
-        incident_type = getattr(incident.incident_type, "value", incident.incident_type)
 
         risk_service = RiskMetricsService(self.db)
-        drift_flag = self._check_drift(incident.ai_system_id, risk_service)
-        incidents_last_30_days = self._incident_count_last_30_days(incident.ai_system_id)
-        volatility = risk_service.changes_last_30_days().get(str(incident.ai_system_id), 0)
+        drift_flag = self._check_drift(system_id, risk_service)
+        incidents_last_30_days = self._incident_count_last_30_days(system_id)
+        volatility = risk_service.changes_last_30_days(
+            system_id=system_id
+        ).get(str(system_id), 0)
 
-        context = {
+        return {
             "risk": risk,
-            "type": incident_type,
             "drift_flag": drift_flag,
             "incidents_last_30_days": incidents_last_30_days,
             "volatility": volatility,
         }
 
+    def suggest_for_context(self, system_context: dict, incident_type) -> dict:
+        incident_type = getattr(incident_type, "value", incident_type)
+        context = {**system_context, "type": incident_type}
+
         suggestion = {
             "severity": "Medium",
             "owner_role": "AI_OWNER",
@@ -61,8 +60,9 @@ class IncidentTriageService:
             "reason": "Default rule applied",
         }
 
-        for rule in self.rules.get("severity_rules", []):
-            if self._match_condition(rule.get("condition"), context):
+        for compiled in self.rule_set.severity_rules:
+            if compiled.matches(context):
+                rule = compiled.rule
                 suggestion = {
                     "severity": rule.get("suggested_severity", "Medium"),
                     "owner_role": rule.get("owner_role", "AI_OWNER"),
@@ -73,15 +73,17 @@ class IncidentTriageService:
 
         context["severity"] = suggestion["severity"]
 
-        for esc in self.rules.get("escalation_rules", []):
-            if self._match_condition(esc.get("condition"), context):
+        for compiled in self.rule_set.escalation_rules:
+            if compiled.matches(context):
+                esc = compiled.rule
                 levels = int(esc.get("escalate_by", 0))
                 suggestion["severity"] = self._escalate(suggestion["severity"], levels)
                 suggestion["reason"] += f" | Escalation: {esc.get('reason', 'rule')}"
                 context["severity"] = suggestion["severity"]
 
-        for dr in self.rules.get("drift_rules", []):
-            if self._match_condition(dr.get("condition"), context):
+        for compiled in self.rule_set.drift_rules:
+            if compiled.matches(context):
+                dr = compiled.rule
                 suggestion["severity"] = dr.get("suggested_severity", suggestion["severity"])
                 suggestion["owner_role"] = dr.get("owner_role", suggestion["owner_role"])
                 suggestion["root_cause"] = dr.get("root_cause", suggestion["root_cause"])
@@ -109,14 +111,12 @@ class IncidentTriageService:
 
     @staticmethod
     def _check_drift(system_id: str, risk_service: RiskMetricsService) -> bool:
-        prompt = risk_service.prompt_drift().get(str(system_id), {})
-        rag = risk_service.rag_drift().get(str(system_id), {})
-        incident_links = risk_service.change_after_incident().get(str(system_id), [])
+        drift = risk_service.system_drift(system_id)
 
         return (
-            prompt.get("prompt_drift_flag", False)
-            or rag.get("rag_drift_flag", False)
-            or len(incident_links) > 0
+            drift["prompt_drift_flag"]
+            or drift["rag_drift_flag"]
+            or drift["change_after_incident"]
         )
 
     def _suggest_root_cause(self, incident_type: str) -> tuple[str, str]:
@@ -142,53 +142,4 @@ class IncidentTriageService:
     def _match_condition(condition: str | None, context: dict) -> bool:
         if not condition:
             return False
-        tree = ast.parse(condition, mode="eval")
-        return IncidentTriageService._eval_node(tree.body, context)
-
-    @staticmethod
-    def _eval_node(node: ast.AST, context: dict):
-        if isinstance(node, ast.BoolOp):
-            values = [IncidentTriageService._eval_node(v, context) for v in node.values]
-            if isinstance(node.op, ast.And):
-                return all(values)
-            if isinstance(node.op, ast.Or):
-                return any(values)
-        if isinstance(node, ast.Compare):
-            left = IncidentTriageService._eval_node(node.left, context)
-            for op, comparator in zip(node.ops, node.comparators):
-                right = IncidentTriageService._eval_node(comparator, context)
-                if isinstance(op, ast.Eq):
-                    if left != right:
-                        return False
-                elif isinstance(op, ast.NotEq):
-                    if left == right:
-                        return False
-                elif isinstance(op, ast.Gt):
-                    if left <= right:
-                        return False
-                elif isinstance(op, ast.GtE):
-                    if left < right:
-                        return False
-                elif isinstance(op, ast.Lt):
-                    if left >= right:
-                        return False
-                elif isinstance(op, ast.LtE):
-                    if left > right:
-                        return False
-                elif isinstance(op, ast.In):
-                    if left not in right:
-                        return False
-                elif isinstance(op, ast.NotIn):
-                    if left in right:
-                        return False
-                else:
-                    raise ValueError("Unsupported operator")
-                left = right
-            return True
-        if isinstance(node, ast.Name):
-            return context.get(node.id)
-        if isinstance(node, ast.Constant):
-            return node.value
-        if isinstance(node, ast.Tuple):
-            return tuple(IncidentTriageService._eval_node(elt, context) for elt in node.elts)
-        raise ValueError("Unsupported condition expression")
+        return bool(compile_condition(condition)(context))
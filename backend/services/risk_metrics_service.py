@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 
-from sqlalchemy import func
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
 from models import (
@@ -9,11 +11,16 @@ from models import (
     AISystemPromptBinding,
     AISystemRAGBinding,
     ChangeRequest,
+    IncidentSeverity,
     IncidentType,
     PromptVersion,
     RAGSourceVersion,
+    RiskMetricsSnapshot,
+    SnapshotMetric,
 )
 
+REACTIVE_CHANGE_WINDOW_DAYS = 7
+
 
 class RiskMetricsService:
     def __init__(self, db: Session):
@@ -23,111 +30,149 @@ class RiskMetricsService:
     def _enum_value(value):
         return getattr(value, "value", value)
 
+    @staticmethod
+    def _severity_label(bucket: str) -> str:
+        member = IncidentSeverity.__members__.get(bucket)
+        return member.value if member else bucket
+
+    def _snapshot_query(self, metric: SnapshotMetric, *columns):
+        return self.db.query(*columns).filter(RiskMetricsSnapshot.metric == metric.value)
+
     def count_incidents_by_severity(self):
+        total = func.sum(RiskMetricsSnapshot.event_count)
         results = (
-            self.db.query(AIIncident.severity, func.count(AIIncident.id))
-            .group_by(AIIncident.severity)
+            self._snapshot_query(
+                SnapshotMetric.INCIDENT_SEVERITY, RiskMetricsSnapshot.bucket, total
+            )
+            .group_by(RiskMetricsSnapshot.bucket)
+            .having(total > 0)
             .all()
         )
-        return {self._enum_value(severity): count for severity, count in results}
+        return {self._severity_label(bucket): int(count) for bucket, count in results}
 
-    def hallucination_rate_per_system(self):
-        systems = self.db.query(AISystem).all()
-        output = {}
+    def hallucination_rate_per_system(self, system_id=None):
+        """Hallucination share of incidents per AI system.
+
+        Pass ``system_id`` to restrict the aggregation to a single system.
+        """
+        incident_counts = self._snapshot_query(
+            SnapshotMetric.INCIDENT_TYPE,
+            RiskMetricsSnapshot.ai_system_id.label("ai_system_id"),
+            func.sum(RiskMetricsSnapshot.event_count).label("total"),
+            func.sum(RiskMetricsSnapshot.event_count)
+            .filter(RiskMetricsSnapshot.bucket == IncidentType.HALLUCINATION.name)
+            .label("hallucinations"),
+        )
+        if system_id is not None:
+            incident_counts = incident_counts.filter(
+                RiskMetricsSnapshot.ai_system_id == system_id
+            )
+        incident_counts = incident_counts.group_by(RiskMetricsSnapshot.ai_system_id).subquery()
+
+        query = self.db.query(
+            AISystem.id,
+            AISystem.name,
+            func.coalesce(incident_counts.c.total, 0),
+            func.coalesce(incident_counts.c.hallucinations, 0),
+        ).outerjoin(incident_counts, incident_counts.c.ai_system_id == AISystem.id)
+        if system_id is not None:
+            query = query.filter(AISystem.id == system_id)
 
-        for system in systems:
-            total = (
-                self.db.query(AIIncident)
-                .filter(AIIncident.ai_system_id == system.id)
-                .count()
-            )
-            hallucinations = (
-                self.db.query(AIIncident)
-                .filter(
-                    AIIncident.ai_system_id == system.id,
-                    AIIncident.incident_type == IncidentType.HALLUCINATION,
-                )
-                .count()
-            )
-            rate = hallucinations / total if total > 0 else 0
-            output[str(system.id)] = {
-                "system_name": system.name,
+        output = {}
+        for system_id, system_name, total_count, hallucination_count in query.all():
+            total_count = int(total_count)
+            hallucination_count = int(hallucination_count)
+            rate = hallucination_count / total_count if total_count > 0 else 0
+            output[str(system_id)] = {
+                "system_name": system_name,
                 "hallucination_rate": rate,
-                "hallucination_count": hallucinations,
-                "total_incidents": total,
+                "hallucination_count": hallucination_count,
+                "total_incidents": total_count,
             }
 
         return output
 
-    def changes_last_30_days(self):
-        cutoff = datetime.utcnow() - timedelta(days=30)
-        results = (
-            self.db.query(ChangeRequest.ai_system_id, func.count(ChangeRequest.id))
-            .filter(ChangeRequest.created_at >= cutoff)
-            .group_by(ChangeRequest.ai_system_id)
-            .all()
-        )
-        return {str(system_id): count for system_id, count in results}
+    def changes_last_30_days(self, system_id=None):
+        """Change request volume per AI system over the last 30 days.
+
+        Pass ``system_id`` to restrict the aggregation to a single system.
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=30)).date()
+        query = self._snapshot_query(
+            SnapshotMetric.CHANGE_REQUEST,
+            RiskMetricsSnapshot.ai_system_id,
+            func.sum(RiskMetricsSnapshot.event_count),
+        ).filter(RiskMetricsSnapshot.day >= cutoff)
+        if system_id is not None:
+            query = query.filter(RiskMetricsSnapshot.ai_system_id == system_id)
+        results = query.group_by(RiskMetricsSnapshot.ai_system_id).all()
+        return {str(system_id): int(count) for system_id, count in results}
 
     def hallucinations_per_week(self, weeks: int = 8):
         """Count hallucination incidents per week over a recent window."""
-        cutoff = datetime.utcnow() - timedelta(weeks=weeks)
+        cutoff = (datetime.utcnow() - timedelta(weeks=weeks)).date()
+        week_start = func.date_trunc("week", RiskMetricsSnapshot.day).label("week_start")
         results = (
-            self.db.query(
-                func.date_trunc("week", AIIncident.created_at).label("week_start"),
-                func.count(AIIncident.id),
+            self._snapshot_query(
+                SnapshotMetric.INCIDENT_TYPE,
+                week_start,
+                func.sum(RiskMetricsSnapshot.event_count),
             )
             .filter(
-                AIIncident.incident_type == IncidentType.HALLUCINATION,
-                AIIncident.created_at >= cutoff,
+                RiskMetricsSnapshot.bucket == IncidentType.HALLUCINATION.name,
+                RiskMetricsSnapshot.day >= cutoff,
             )
-            .group_by("week_start")
-            .order_by("week_start")
+            .group_by(week_start)
+            .order_by(week_start)
             .all()
         )
 
         return [
             {
                 "week_start": week_start.date().isoformat(),
-                "count": count,
+                "count": int(count),
             }
             for week_start, count in results
         ]
 
     def severity_trend(self, days=30):
         """Show incident severity distribution over time"""
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = (datetime.utcnow() - timedelta(days=days)).date()
 
         results = (
-            self.db.query(
-                func.date_trunc("day", AIIncident.created_at).label("day"),
-                AIIncident.severity,
-                func.count(AIIncident.id),
+            self._snapshot_query(
+                SnapshotMetric.INCIDENT_SEVERITY,
+                RiskMetricsSnapshot.day,
+                RiskMetricsSnapshot.bucket,
+                func.sum(RiskMetricsSnapshot.event_count),
             )
-            .filter(AIIncident.created_at >= cutoff)
-            .group_by("day", AIIncident.severity)
-            .order_by("day")
+            .filter(RiskMetricsSnapshot.day >= cutoff)
+            .group_by(RiskMetricsSnapshot.day, RiskMetricsSnapshot.bucket)
+            .order_by(RiskMetricsSnapshot.day)
             .all()
         )
 
         trend = {}
-        for day, severity, count in results:
-            day_str = day.date().isoformat()
-            severity_val = self._enum_value(severity)
-            trend.setdefault(day_str, {})[severity_val] = count
+        for day, bucket, count in results:
+            if not count:
+                continue
+            trend.setdefault(day.isoformat(), {})[self._severity_label(bucket)] = int(count)
 
         return trend
 
     def repeated_incidents(self):
         """Identify AI systems with > 3 incidents (unstable systems)"""
+        total = func.sum(RiskMetricsSnapshot.event_count)
         results = (
-            self.db.query(AIIncident.ai_system_id, func.count(AIIncident.id))
-            .group_by(AIIncident.ai_system_id)
-            .having(func.count(AIIncident.id) > 3)
+            self._snapshot_query(
+                SnapshotMetric.INCIDENT_TYPE, RiskMetricsSnapshot.ai_system_id, total
+            )
+            .group_by(RiskMetricsSnapshot.ai_system_id)
+            .having(total > 3)
             .all()
         )
 
-        return {str(system_id): count for system_id, count in results}
+        return {str(system_id): int(count) for system_id, count in results}
 
     def prompt_drift(self):
         """Detect frequent prompt changes (>3 in 30 days) per AI system"""
@@ -181,24 +226,175 @@ class RiskMetricsService:
 
         return drift
 
-    def change_after_incident(self):
-        """Find changes made within 7 days of incidents (reactive behavior)"""
-        output = {}
+    def system_drift(self, system_id):
+        """Drift signals for a single AI system.
 
-        incidents = self.db.query(AIIncident).all()
-        changes = self.db.query(ChangeRequest).all()
-
-        for inc in incidents:
-            for ch in changes:
-                if ch.ai_system_id == inc.ai_system_id:
-                    time_diff = (ch.created_at - inc.created_at).days
-                    if 0 <= time_diff <= 7:
-                        output.setdefault(str(inc.ai_system_id), []).append(
-                            {
-                                "incident_id": str(inc.id),
-                                "change_id": str(ch.id),
-                                "days_after_incident": time_diff,
-                            }
-                        )
+        Uses the same thresholds as ``prompt_drift``, ``rag_drift`` and
+        ``change_after_incident`` but only touches rows of ``system_id``.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=30)
+
+        prompt_changes = (
+            self.db.query(func.count(PromptVersion.id))
+            .join(
+                AISystemPromptBinding,
+                AISystemPromptBinding.prompt_version_id == PromptVersion.id,
+            )
+            .filter(
+                AISystemPromptBinding.ai_system_id == system_id,
+                PromptVersion.created_at >= cutoff,
+            )
+            .scalar()
+        ) or 0
+        rag_changes = (
+            self.db.query(func.count(RAGSourceVersion.id))
+            .join(
+                AISystemRAGBinding,
+                AISystemRAGBinding.rag_source_version_id == RAGSourceVersion.id,
+            )
+            .filter(
+                AISystemRAGBinding.ai_system_id == system_id,
+                RAGSourceVersion.created_at >= cutoff,
+            )
+            .scalar()
+        ) or 0
+
+        return {
+            "prompt_changes_30d": prompt_changes,
+            "prompt_drift_flag": prompt_changes >= 3,
+            "rag_changes_30d": rag_changes,
+            "rag_drift_flag": rag_changes >= 3,
+            "change_after_incident": self._has_change_after_incident(system_id),
+        }
+
+    def _has_change_after_incident(self, system_id) -> bool:
+        if self.db.get_bind().dialect.name != "postgresql":
+            return next(self._change_after_incident_sweep([system_id]), None) is not None
+
+        window_end = AIIncident.created_at + timedelta(
+            days=REACTIVE_CHANGE_WINDOW_DAYS + 1
+        )
+        match = (
+            self.db.query(AIIncident.id)
+            .join(
+                ChangeRequest,
+                and_(
+                    ChangeRequest.ai_system_id == AIIncident.ai_system_id,
+                    ChangeRequest.created_at >= AIIncident.created_at,
+                    ChangeRequest.created_at < window_end,
+                ),
+            )
+            .filter(AIIncident.ai_system_id == system_id)
+            .limit(1)
+            .first()
+        )
+        return match is not None
+
+    def change_after_incident(self, after_system_id=None, limit=None):
+        """Find changes made within 7 days of incidents (reactive behavior)
+
+        Results can be paged by AI system: pass ``limit`` to cap the number of
+        systems considered and ``after_system_id`` (the last system id of the
+        previous page) to continue from there.
+        """
+        system_page = self._system_page(after_system_id, limit)
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            matches = self._change_after_incident_range_join(system_page)
+        else:
+            matches = self._change_after_incident_sweep(system_page)
+
+        output = {}
+        for system_id, incident_id, change_id, days in matches:
+            output.setdefault(str(system_id), []).append(
+                {
+                    "incident_id": str(incident_id),
+                    "change_id": str(change_id),
+                    "days_after_incident": days,
+                }
+            )
 
         return output
+
+    def _system_page(self, after_system_id=None, limit=None):
+        if after_system_id is None and limit is None:
+            return None
+
+        query = self.db.query(AISystem.id)
+        if after_system_id is not None:
+            query = query.filter(AISystem.id > after_system_id)
+        query = query.order_by(AISystem.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return select(query.subquery().c.id)
+
+    def _change_after_incident_range_join(self, system_page=None):
+        """Match incidents to follow-up changes with a single SQL range join."""
+        window_end = AIIncident.created_at + timedelta(
+            days=REACTIVE_CHANGE_WINDOW_DAYS + 1
+        )
+        query = (
+            self.db.query(
+                AIIncident.ai_system_id,
+                AIIncident.id,
+                AIIncident.created_at,
+                ChangeRequest.id,
+                ChangeRequest.created_at,
+            )
+            .join(
+                ChangeRequest,
+                and_(
+                    ChangeRequest.ai_system_id == AIIncident.ai_system_id,
+                    ChangeRequest.created_at >= AIIncident.created_at,
+                    ChangeRequest.created_at < window_end,
+                ),
+            )
+        )
+        if system_page is not None:
+            query = query.filter(AIIncident.ai_system_id.in_(system_page))
+        query = query.order_by(
+            AIIncident.ai_system_id, AIIncident.created_at, ChangeRequest.created_at
+        )
+
+        for system_id, incident_id, incident_at, change_id, change_at in query:
+            days = (change_at - incident_at).days
+            if 0 <= days <= REACTIVE_CHANGE_WINDOW_DAYS:
+                yield system_id, incident_id, change_id, days
+
+    def _change_after_incident_sweep(self, system_page=None):
+        """Sort-merge fallback for dialects without interval arithmetic.
+
+        Incidents and changes are streamed in (system, created_at) order so only
+        one system's changes are held in memory at a time.
+        """
+        incidents = self.db.query(
+            AIIncident.ai_system_id, AIIncident.id, AIIncident.created_at
+        )
+        changes = self.db.query(
+            ChangeRequest.ai_system_id, ChangeRequest.id, ChangeRequest.created_at
+        )
+        if system_page is not None:
+            incidents = incidents.filter(AIIncident.ai_system_id.in_(system_page))
+            changes = changes.filter(ChangeRequest.ai_system_id.in_(system_page))
+        incidents = incidents.order_by(AIIncident.ai_system_id, AIIncident.created_at)
+        changes = changes.order_by(ChangeRequest.ai_system_id, ChangeRequest.created_at)
+
+        change_groups = groupby(changes, key=itemgetter(0))
+        pending = next(change_groups, None)
+
+        for system_id, system_incidents in groupby(incidents, key=itemgetter(0)):
+            while pending is not None and str(pending[0]) < str(system_id):
+                pending = next(change_groups, None)
+            if pending is None or str(pending[0]) != str(system_id):
+                continue
+
+            system_changes = [(change_id, change_at) for _, change_id, change_at in pending[1]]
+            start = 0
+            for _, incident_id, incident_at in system_incidents:
+                while start < len(system_changes) and system_changes[start][1] < incident_at:
+                    start += 1
+                for change_id, change_at in system_changes[start:]:
+                    days = (change_at - incident_at).days
+                    if days > REACTIVE_CHANGE_WINDOW_DAYS:
+                        break
+                    yield system_id, incident_id, change_id, days
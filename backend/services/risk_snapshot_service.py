@@ -0,0 +1,172 @@
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import Date, cast, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from models import (
+    AIIncident,
+    ChangeRequest,
+    IncidentSeverity,
+    IncidentType,
+    RiskMetricsSnapshot,
+    SnapshotMetric,
+    generate_uuid,
+)
+
+
+class RiskSnapshotService:
+    """Keeps ``risk_metrics_snapshot`` in step with incident and change writes.
+
+    Callers record events on the same session as the write itself, so the
+    snapshot is committed (or rolled back) together with the source row.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _bucket(enum_cls, value) -> str:
+        """Store enum buckets by member name, matching the DB enum labels."""
+        if isinstance(value, enum_cls):
+            return value.name
+        try:
+            return enum_cls(value).name
+        except ValueError:
+            return str(value)
+
+    @staticmethod
+    def _day(created_at):
+        return (created_at or datetime.utcnow()).date()
+
+    def record_incident(self, incident: AIIncident) -> None:
+        self.record_incidents([incident])
+
+    def record_incidents(self, incidents) -> None:
+        """Count a batch of new incidents with one upsert per distinct bucket."""
+        counts = Counter()
+        for incident in incidents:
+            day = self._day(incident.created_at)
+            counts[
+                (
+                    incident.ai_system_id,
+                    day,
+                    SnapshotMetric.INCIDENT_SEVERITY,
+                    self._bucket(IncidentSeverity, incident.severity),
+                )
+            ] += 1
+            counts[
+                (
+                    incident.ai_system_id,
+                    day,
+                    SnapshotMetric.INCIDENT_TYPE,
+                    self._bucket(IncidentType, incident.incident_type),
+                )
+            ] += 1
+
+        for (system_id, day, metric, bucket), delta in counts.items():
+            self._increment(system_id, day, metric, bucket, delta)
+
+    def record_severity_change(self, incident: AIIncident, previous_severity) -> None:
+        old_bucket = self._bucket(IncidentSeverity, previous_severity)
+        new_bucket = self._bucket(IncidentSeverity, incident.severity)
+        if old_bucket == new_bucket:
+            return
+
+        day = self._day(incident.created_at)
+        self._increment(
+            incident.ai_system_id, day, SnapshotMetric.INCIDENT_SEVERITY, old_bucket, -1
+        )
+        self._increment(
+            incident.ai_system_id, day, SnapshotMetric.INCIDENT_SEVERITY, new_bucket
+        )
+
+    def record_change_request(self, change: ChangeRequest) -> None:
+        self._increment(
+            change.ai_system_id,
+            self._day(change.created_at),
+            SnapshotMetric.CHANGE_REQUEST,
+            getattr(change.change_type, "value", change.change_type),
+        )
+
+    def _increment(self, system_id, day, metric: SnapshotMetric, bucket: str, delta: int = 1):
+        if self.db.get_bind().dialect.name == "postgresql":
+            stmt = pg_insert(RiskMetricsSnapshot).values(
+                id=generate_uuid(),
+                ai_system_id=system_id,
+                day=day,
+                metric=metric.value,
+                bucket=bucket,
+                event_count=delta,
+                updated_at=datetime.utcnow(),
+            )
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_risk_metrics_snapshot_bucket",
+                set_={
+                    "event_count": RiskMetricsSnapshot.event_count + stmt.excluded.event_count,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            self.db.execute(stmt)
+            return
+
+        row = (
+            self.db.query(RiskMetricsSnapshot)
+            .filter(
+                RiskMetricsSnapshot.ai_system_id == system_id,
+                RiskMetricsSnapshot.day == day,
+                RiskMetricsSnapshot.metric == metric.value,
+                RiskMetricsSnapshot.bucket == bucket,
+            )
+            .with_for_update()
+            .first()
+        )
+        if row:
+            row.event_count += delta
+        else:
+            self.db.add(
+                RiskMetricsSnapshot(
+                    ai_system_id=system_id,
+                    day=day,
+                    metric=metric.value,
+                    bucket=bucket,
+                    event_count=delta,
+                )
+            )
+            # Sessions run with autoflush off; flush so a later increment of
+            # the same bucket in this transaction finds the row.
+            self.db.flush()
+
+    def rebuild(self) -> None:
+        """Recompute the whole snapshot from the raw incident and change tables."""
+        self.db.query(RiskMetricsSnapshot).delete(synchronize_session=False)
+
+        sources = (
+            (SnapshotMetric.INCIDENT_SEVERITY, AIIncident, AIIncident.severity, IncidentSeverity),
+            (SnapshotMetric.INCIDENT_TYPE, AIIncident, AIIncident.incident_type, IncidentType),
+            (SnapshotMetric.CHANGE_REQUEST, ChangeRequest, ChangeRequest.change_type, None),
+        )
+        for metric, model, column, enum_cls in sources:
+            day = cast(model.created_at, Date)
+            results = (
+                self.db.query(model.ai_system_id, day, column, func.count(model.id))
+                .group_by(model.ai_system_id, day, column)
+                .all()
+            )
+            self.db.add_all(
+                RiskMetricsSnapshot(
+                    ai_system_id=system_id,
+                    day=row_day,
+                    metric=metric.value,
+                    bucket=(
+                        self._bucket(enum_cls, value)
+                        if enum_cls
+                        else getattr(value, "value", value)
+                    ),
+                    event_count=count,
+                )
+                for system_id, row_day, value, count in results
+            )
+
+        self.db.flush()
@@ -0,0 +1,126 @@
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+from database import get_engine
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+ALEMBIC_INI = BACKEND_DIR / "alembic.ini"
+MIGRATION_LOCK_KEY = "ai-grc:alembic-upgrade"
+MIGRATION_LOCK_POLL_SECONDS = 0.5
+
+# "auto" upgrades under the advisory lock when the schema is behind;
+# "check" only verifies and fails startup, for deployments where a
+# separate migration job (scripts/migrate.py) owns the DDL; "skip" does
+# nothing.
+MIGRATION_MODE = os.getenv("MIGRATION_MODE", "auto").lower()
+
+
+class SchemaOutOfDate(RuntimeError):
+    """The database is not at the migration head and this process may not upgrade it."""
+
+
+def head_revisions() -> set[str]:
+    """Head revisions of the migration scripts shipped with this build."""
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    return set(script.get_heads())
+
+
+def current_revisions(connection) -> set[str]:
+    """Revisions recorded in ``alembic_version``; empty for a fresh database."""
+    return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def run_alembic_upgrade() -> None:
+    """``alembic upgrade head`` in a child interpreter.
+
+    Kept out of process so alembic's ``env.py`` logging setup does not
+    replace the server's logging configuration.
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    logger.info(f"Migrations completed: {result.stdout}")
+
+
+def _acquire_migration_lock(connection) -> None:
+    """Take the upgrade advisory lock, polling instead of blocking.
+
+    A backend blocked in ``pg_advisory_lock`` holds a snapshot for as long
+    as it waits, and ``CREATE INDEX CONCURRENTLY`` in the upgrader waits for
+    every older snapshot to finish, so a blocking wait would deadlock the
+    two without PostgreSQL noticing. Between polls this connection is idle
+    in autocommit and holds none.
+    """
+    waiting = False
+    while not connection.execute(
+        text("SELECT pg_try_advisory_lock(hashtext(:key))"), {"key": MIGRATION_LOCK_KEY}
+    ).scalar():
+        if not waiting:
+            logger.info("Waiting for another worker to finish migrations...")
+            waiting = True
+        time.sleep(MIGRATION_LOCK_POLL_SECONDS)
+
+
+def ensure_schema_current(mode: str = MIGRATION_MODE) -> str:
+    """Bring the schema to head, or confirm it already is.
+
+    The common case is one ``alembic_version`` read. When an upgrade is
+    needed, a session-level advisory lock makes concurrent workers and
+    replicas wait (by polling, see ``_acquire_migration_lock``) for a
+    single upgrader; each re-checks the version after acquiring the lock,
+    so only the first one runs alembic.
+
+    Returns ``"current"``, ``"upgraded"`` or ``"skipped"``.
+    """
+    if mode == "skip":
+        return "skipped"
+
+    started = time.perf_counter()
+    heads = head_revisions()
+    with get_engine().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        current = current_revisions(connection)
+        if current == heads:
+            logger.info(
+                "Schema at %s; migration check took %.1f ms",
+                ", ".join(sorted(heads)),
+                (time.perf_counter() - started) * 1000,
+            )
+            return "current"
+        if mode == "check":
+            raise SchemaOutOfDate(
+                f"Database schema at {sorted(current) or 'base'}, expected {sorted(heads)}; "
+                "run scripts/migrate.py"
+            )
+
+        use_lock = connection.dialect.name == "postgresql"
+        if use_lock:
+            _acquire_migration_lock(connection)
+        try:
+            if current_revisions(connection) == heads:
+                logger.info("Schema upgraded by another worker")
+                return "current"
+            logger.info("Running database migrations...")
+            run_alembic_upgrade()
+        finally:
+            if use_lock:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": MIGRATION_LOCK_KEY}
+                )
+
+    logger.info("Migrations took %.1f ms", (time.perf_counter() - started) * 1000)
+    return "upgraded"
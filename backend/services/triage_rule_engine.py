@@ -0,0 +1,144 @@
+import ast
+import operator
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+TRIAGE_DIR = Path(__file__).resolve().parent.parent / "triage"
+RULES_PATH = TRIAGE_DIR / "triage_rules.yaml"
+ROOT_CAUSE_MAP_PATH = TRIAGE_DIR / "root_cause_map.yaml"
+
+Predicate = Callable[[dict], bool]
+
+_COMPARE_OPS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Predicate:
+    """Parse a rule condition once into a closure over the triage context.
+
+    Only the expression subset the YAML rules use is accepted: boolean
+    and/or, comparisons, context names, constants and tuples.
+    """
+    tree = ast.parse(condition, mode="eval")
+    return _compile_node(tree.body)
+
+
+def _compile_node(node: ast.AST) -> Callable[[dict], object]:
+    if isinstance(node, ast.BoolOp):
+        parts = tuple(_compile_node(value) for value in node.values)
+        if isinstance(node.op, ast.And):
+            return lambda context: all(part(context) for part in parts)
+        if isinstance(node.op, ast.Or):
+            return lambda context: any(part(context) for part in parts)
+    if isinstance(node, ast.Compare):
+        left = _compile_node(node.left)
+        steps = []
+        for op, comparator in zip(node.ops, node.comparators):
+            compare = _COMPARE_OPS.get(type(op))
+            if compare is None:
+                raise ValueError("Unsupported operator")
+            steps.append((compare, _compile_node(comparator)))
+
+        def evaluate_compare(context: dict) -> bool:
+            left_value = left(context)
+            for compare, right in steps:
+                right_value = right(context)
+                if not compare(left_value, right_value):
+                    return False
+                left_value = right_value
+            return True
+
+        return evaluate_compare
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda context: context.get(name)
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda context: value
+    if isinstance(node, ast.Tuple):
+        elements = tuple(_compile_node(elt) for elt in node.elts)
+        return lambda context: tuple(element(context) for element in elements)
+    raise ValueError("Unsupported condition expression")
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    rule: dict
+    predicate: Predicate | None
+
+    def matches(self, context: dict) -> bool:
+        return self.predicate is not None and bool(self.predicate(context))
+
+
+@dataclass(frozen=True)
+class CompiledRuleSet:
+    severity_rules: tuple[CompiledRule, ...]
+    escalation_rules: tuple[CompiledRule, ...]
+    drift_rules: tuple[CompiledRule, ...]
+
+    @classmethod
+    def from_rules(cls, rules: dict) -> "CompiledRuleSet":
+        def compile_section(name: str) -> tuple[CompiledRule, ...]:
+            compiled = []
+            for rule in rules.get(name, []) or []:
+                condition = rule.get("condition")
+                predicate = compile_condition(condition) if condition else None
+                compiled.append(CompiledRule(rule=rule, predicate=predicate))
+            return tuple(compiled)
+
+        return cls(
+            severity_rules=compile_section("severity_rules"),
+            escalation_rules=compile_section("escalation_rules"),
+            drift_rules=compile_section("drift_rules"),
+        )
+
+
+class _ReloadingFile:
+    """Caches a parsed YAML file for the process, re-reading it when its mtime changes."""
+
+    def __init__(self, path: Path, transform: Callable[[dict], object] = lambda data: data):
+        self.path = path
+        self.transform = transform
+        self._lock = threading.Lock()
+        self._mtime_ns: int | None = None
+        self._value = None
+
+    def get(self):
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        if mtime_ns == self._mtime_ns:
+            return self._value
+
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                import yaml  # deferred until the first triage, off the import path
+
+                with self.path.open("r", encoding="utf-8") as handle:
+                    data = yaml.safe_load(handle) or {}
+                self._value = self.transform(data)
+                self._mtime_ns = mtime_ns
+            return self._value
+
+
+_rule_set = _ReloadingFile(RULES_PATH, CompiledRuleSet.from_rules)
+_root_cause_map = _ReloadingFile(ROOT_CAUSE_MAP_PATH)
+
+
+def load_rule_set() -> CompiledRuleSet:
+    return _rule_set.get()
+
+
+def load_root_cause_map() -> dict:
+    return _root_cause_map.get()
@@ -0,0 +1,69 @@
+import enum
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from utils.diff import generate_unified_diff, side_by_side_diff, word_diff
+
+VERSION_DIFF_CACHE_SIZE = int(os.getenv("VERSION_DIFF_CACHE_SIZE", "512"))
+
+
+class DiffCache:
+    """Thread-safe LRU of rendered diffs keyed by content hashes.
+
+    Content hashes identify the exact texts compared, so entries never go
+    stale and can be shared between prompt and RAG versions.
+    """
+
+    def __init__(self, max_size: int = VERSION_DIFF_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], object]):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+
+class DiffFormat(str, enum.Enum):
+    UNIFIED = "unified"
+    SIDE_BY_SIDE = "side_by_side"
+    WORD = "word"
+
+
+RENDERERS = {
+    DiffFormat.UNIFIED: generate_unified_diff,
+    DiffFormat.SIDE_BY_SIDE: side_by_side_diff,
+    DiffFormat.WORD: word_diff,
+}
+
+diff_cache = DiffCache()
+
+
+def cached_diff(
+    old_hash: str,
+    new_hash: str,
+    load_texts: Callable[[], tuple[str, str]],
+    diff_format: DiffFormat = DiffFormat.UNIFIED,
+):
+    """Diff between two contents in ``diff_format``; ``load_texts`` only runs on a cache miss."""
+    render = RENDERERS[diff_format]
+    return diff_cache.get_or_compute(
+        (old_hash, new_hash, diff_format.value),
+        lambda: render(*load_texts()),
+    )
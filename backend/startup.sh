@@ -2,7 +2,7 @@
 set -e
 
 echo "Running database migrations..."
-python -m alembic upgrade head
+python scripts/migrate.py
 
 echo "Starting uvicorn server..."
-exec python -m uvicorn main:app --host 0.0.0.0 --port 8000
+MIGRATION_MODE=check exec python -m uvicorn main:app --host 0.0.0.0 --port 8000
@@ -1,4 +1,5 @@
 AI_INCIDENT_REPORTED = "AI_INCIDENT_REPORTED"
+AI_INCIDENT_BULK_REPORTED = "AI_INCIDENT_BULK_REPORTED"
 AI_INCIDENT_TRIAGE_SUGGESTED = "AI_INCIDENT_TRIAGE_SUGGESTED"
 AI_INCIDENT_TRIAGE_CONFIRMED = "AI_INCIDENT_TRIAGE_CONFIRMED"
 AI_INCIDENT_ASSIGNED = "AI_INCIDENT_ASSIGNED"
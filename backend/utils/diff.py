@@ -1,6 +1,80 @@
 import difflib
+import re
 from typing import Optional
 
+WORD_TOKEN = re.compile(r"\s+|\w+|[^\w\s]")
+
+
+def _line_opcodes(old_lines: list[str], new_lines: list[str]) -> list[tuple]:
+    """SequenceMatcher opcodes computed on hashed lines (or any tokens).
+
+    Tokens are interned to small integers and the common prefix and suffix
+    are stripped before matching, so a typical version-to-version edit only
+    runs the matcher over the few lines that actually changed.
+    """
+    ids: dict[str, int] = {}
+    old = [ids.setdefault(line, len(ids)) for line in old_lines]
+    new = [ids.setdefault(line, len(ids)) for line in new_lines]
+
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+
+    opcodes = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    matcher = difflib.SequenceMatcher(
+        None, old[prefix:len(old) - suffix], new[prefix:len(new) - suffix]
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(("equal", len(old) - suffix, len(old), len(new) - suffix, len(new)))
+
+    merged = []
+    for opcode in opcodes:
+        if merged and opcode[0] == "equal" and merged[-1][0] == "equal":
+            last = merged.pop()
+            opcode = ("equal", last[1], opcode[2], last[3], opcode[4])
+        merged.append(opcode)
+    return merged or [("equal", 0, 0, 0, 0)]
+
+
+def _grouped_opcodes(opcodes: list[tuple], n: int = 3):
+    """Hunks with ``n`` lines of context, as in ``SequenceMatcher.get_grouped_opcodes``."""
+    codes = list(opcodes)
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > n * 2:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
 
 def generate_unified_diff(old_text: Optional[str], new_text: str) -> str:
     """
@@ -13,12 +87,67 @@ def generate_unified_diff(old_text: Optional[str], new_text: str) -> str:
     old_lines = old_text.splitlines(keepends=True)
     new_lines = new_text.splitlines(keepends=True)
 
-    diff = difflib.unified_diff(
-        old_lines,
-        new_lines,
-        fromfile="previous_version",
-        tofile="new_version",
-        lineterm="",
-    )
+    output = []
+    for group in _grouped_opcodes(_line_opcodes(old_lines, new_lines)):
+        if not output:
+            output.append("--- previous_version\n+++ new_version\n")
+        first, last = group[0], group[-1]
+        output.append(
+            f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@\n"
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                output.extend(" " + line for line in old_lines[i1:i2])
+                continue
+            if tag in {"replace", "delete"}:
+                output.extend("-" + line for line in old_lines[i1:i2])
+            if tag in {"replace", "insert"}:
+                output.extend("+" + line for line in new_lines[j1:j2])
+
+    return "".join(output)
+
+
+def side_by_side_diff(old_text: str, new_text: str) -> list[dict]:
+    """Aligned rows of old and new lines with 1-based line numbers.
+
+    ``op`` is one of equal, replace, delete or insert; the side a row does
+    not cover has ``None`` for its line number and text.
+    """
+    old_lines = old_text.splitlines()
+    new_lines = new_text.splitlines()
+
+    rows = []
+    for tag, i1, i2, j1, j2 in _line_opcodes(old_lines, new_lines):
+        for offset in range(max(i2 - i1, j2 - j1)):
+            old_index, new_index = i1 + offset, j1 + offset
+            has_old, has_new = old_index < i2, new_index < j2
+            rows.append(
+                {
+                    "op": tag if tag == "equal" or (has_old and has_new) else (
+                        "delete" if has_old else "insert"
+                    ),
+                    "old_line": old_index + 1 if has_old else None,
+                    "old_text": old_lines[old_index] if has_old else None,
+                    "new_line": new_index + 1 if has_new else None,
+                    "new_text": new_lines[new_index] if has_new else None,
+                }
+            )
+    return rows
+
+
+def word_diff(old_text: str, new_text: str) -> list[dict]:
+    """Word-level segments; concatenating equal and insert texts yields ``new_text``."""
+    old_tokens = WORD_TOKEN.findall(old_text)
+    new_tokens = WORD_TOKEN.findall(new_text)
 
-    return "".join(diff)
+    segments = []
+    for tag, i1, i2, j1, j2 in _line_opcodes(old_tokens, new_tokens):
+        if tag == "equal":
+            if i2 > i1:
+                segments.append({"op": "equal", "text": "".join(old_tokens[i1:i2])})
+            continue
+        if i2 > i1:
+            segments.append({"op": "delete", "text": "".join(old_tokens[i1:i2])})
+        if j2 > j1:
+            segments.append({"op": "insert", "text": "".join(new_tokens[j1:j2])})
+    return segments
@@ -0,0 +1,46 @@
+from fastapi import Header, HTTPException, Response
+from sqlalchemy.orm import Query
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def idempotency_key_header(
+    key: str | None = Header(None, alias=IDEMPOTENCY_KEY_HEADER, max_length=255),
+) -> str | None:
+    return key
+
+
+def find_existing_version(
+    versions: Query,
+    model,
+    content_hash: str,
+    key: str | None,
+):
+    """Return the version a repeated create should resolve to, if any.
+
+    ``versions`` is the parent's version query. A matching ``Idempotency-Key``
+    wins, but reusing a key with different content is a 409. Otherwise the
+    newest version is returned if its content hash matches, so re-posting
+    unchanged content is a no-op. Older versions are not compared: an
+    activated version cannot be submitted again, so re-posting its content
+    must create a new version for a rollback to be possible.
+    """
+    if key:
+        keyed = versions.filter(model.idempotency_key == key).first()
+        if keyed:
+            if keyed.content_hash != content_hash:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"{IDEMPOTENCY_KEY_HEADER} was already used with different content",
+                )
+            return keyed
+
+    latest = versions.order_by(model.version.desc()).first()
+    if latest and latest.content_hash == content_hash:
+        return latest
+    return None
+
+
+def mark_replayed(response: Response) -> None:
+    response.headers[IDEMPOTENT_REPLAYED_HEADER] = "true"
@@ -0,0 +1,90 @@
+import base64
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import DateTime, Integer, Uuid, tuple_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class PageParams:
+    cursor: str | None
+    limit: int
+
+
+def page_params(
+    cursor: str | None = Query(
+        None, description=f"Opaque cursor from the previous page's {NEXT_CURSOR_HEADER} header"
+    ),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> PageParams:
+    return PageParams(cursor=cursor, limit=limit)
+
+
+def encode_cursor(values) -> str:
+    payload = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor_value(column, value):
+    """Convert one cursor element back to ``column``'s type, or raise ValueError.
+
+    Cursors come from clients, so each element is checked against the column
+    before it reaches SQL; a wrongly typed value would otherwise fail in the
+    database rather than as a bad cursor.
+    """
+    if isinstance(column.type, Integer):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError("cursor element is not an integer")
+        return value
+    if not isinstance(value, str):
+        raise ValueError("cursor element is not a string")
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Uuid):
+        parsed = uuid.UUID(value)
+        return parsed if column.type.as_uuid else str(parsed)
+    return value
+
+
+def decode_cursor(cursor: str, columns) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor arity mismatch")
+        return [_decode_cursor_value(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def keyset_page(query, columns, page: PageParams, response: Response, descending: bool = True):
+    """Return one page of ``query`` ordered by ``columns`` (e.g. created_at, id).
+
+    Rows after the cursor are selected with a row-value comparison, so the
+    cost per page does not grow with the offset. When more rows exist the
+    cursor for the next page is returned in the ``X-Next-Cursor`` header.
+    """
+    if page.cursor:
+        key = tuple_(*columns)
+        values = tuple_(*decode_cursor(page.cursor, columns))
+        query = query.filter(key < values if descending else key > values)
+
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    rows = query.order_by(*ordering).limit(page.limit + 1).all()
+
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            getattr(last, column.key) for column in columns
+        )
+
+    return rows
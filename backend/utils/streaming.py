@@ -0,0 +1,64 @@
+from typing import Callable
+
+import anyio
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Query, Session
+
+from database import SessionLocal
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_BATCH_SIZE = 500
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """``StreamingResponse`` that always closes an async body iterator.
+
+    When the client disconnects, Starlette cancels the send loop while the
+    generator is usually suspended at ``yield``, and does not close it; its
+    ``finally`` would only run whenever the garbage collector gets to it.
+    Generators that hold connections or threads need it to run now.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.body_iterator.aclose()
+
+
+def wants_ndjson(request: Request, stream: bool = False) -> bool:
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def stream_ndjson(
+    build_query: Callable[[Session], Query],
+    schema: type[BaseModel],
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> StreamingResponse:
+    """Stream query rows as NDJSON, one ``schema`` object per line.
+
+    The query runs on its own session with a server-side cursor
+    (``yield_per``), and rows are serialized and flushed one batch at a
+    time, so memory stays constant however many rows match. The session is
+    opened inside the generator because request-scoped dependencies may be
+    closed before the body finishes streaming.
+    """
+
+    def generate():
+        db = SessionLocal()
+        try:
+            lines = []
+            for row in build_query(db).yield_per(batch_size):
+                lines.append(schema.model_validate(row).model_dump_json())
+                if len(lines) >= batch_size:
+                    yield "\n".join(lines) + "\n"
+                    lines = []
+            if lines:
+                yield "\n".join(lines) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE)